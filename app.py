@@ -1,14 +1,24 @@
 import json
+import zipfile
+from contextlib import nullcontext
 import pandas as pd
 import streamlit as st
 from datetime import datetime
 
-from src.pdf_utils import extract_text_from_pdf
+from src.pdf_utils import default_mode, extract_text_from_pdf
+from src.pdf_cache import get_pdf_cache
+from src.pdf_parallel import extract_many
+from src.bulk_ingest import iter_scored, resolve_server_path, server_root
 from src.sections import split_sections
 from src.highlight import highlight_terms
 from src.suggestions import generate_suggestions
 
-from src.ranking import score_resume_against_jd
+from src.ranking import score_resume_against_jd, score_resumes_against_jd
+from src.score_table import ScoreTable
+from src.timing import candidate, recording, write_metrics
+from src.profiling import profile_run, profiling_requested
+from src.semantic_scoring import MODEL_NAME
+from src.model_registry import REGISTRY
 from src.ui_style import inject_css
 from src.ui_components import brandbar, pill, pill_html, kpis, softline, chips
 from src.pdf_export import generate_ats_pdf_report
@@ -35,12 +45,51 @@ s = w_kw + w_sem + w_skill
 weights = (0.20, 0.65, 0.15) if s == 0 else (w_kw / s, w_sem / s, w_skill / s)
 st.sidebar.caption(f"**Normalized:** KW={weights[0]:.2f} • SEM={weights[1]:.2f} • SKILL={weights[2]:.2f}")
 
-mode = st.sidebar.radio("**Mode**", ["Batch Rank (ATS)", "Single Resume"], index=0)
+mode = st.sidebar.radio("**Mode**", ["Batch Rank (ATS)", "Single Resume", "Bulk Ingest (ZIP / Folder)"], index=0)
 top_k = st.sidebar.slider("**Top K (Batch)**", 1, 30, 10, 1)
+cascade = st.sidebar.toggle(
+    "Fast cascade (Batch)", value=False,
+    help="Skip the SBERT encode for candidates that cannot reach REVIEW or the Top K. "
+         "Decisions and the Top K are unchanged; skipped candidates show Semantic = 0.",
+)
+fast_pdf = st.sidebar.toggle(
+    "Fast PDF text extraction", value=default_mode() == "fast",
+    help="Read only the PDF text layer (no layout reconstruction, images skipped); about 2x faster. "
+         "Default comes from TALENTRANK_PDF_MODE.",
+)
+pdf_mode = "fast" if fast_pdf else "full"
+profile_on = st.sidebar.toggle(
+    "Profile this run (Batch)", value=profiling_requested(),
+    help="Capture cProfile + tracemalloc for the next batch run; downloads appear in the Exports tab. "
+         "Default comes from TALENTRANK_PROFILE.",
+)
 
 st.sidebar.divider()
 st.sidebar.caption("💡 **Tip:** For HR-style ranking, keep Semantic high (0.6–0.75).")
 
+with st.sidebar.expander("Model memory"):
+    loaded = REGISTRY.memory_report()
+    if not loaded:
+        st.caption("Encoder still loading…")
+    for info in loaded:
+        st.caption(
+            f"**{info.model_name}** ({info.backend}): "
+            f"RSS +{info.rss_delta_bytes / 2**20:.0f} MB • weights {info.weights_bytes / 2**20:.0f} MB • "
+            f"loaded in {info.load_seconds:.1f}s"
+        )
+
+
+with st.sidebar.expander("PDF text cache"):
+    pdf_cache = get_pdf_cache()
+    if pdf_cache is None:
+        st.caption("Disabled (TALENTRANK_PDF_CACHE=0).")
+    else:
+        cs = pdf_cache.stats()
+        st.caption(
+            f"{cs['entries']} files in memory • hits {cs['memory_hits']} (memory) + {cs['disk_hits']} (disk) • "
+            f"misses {cs['misses']} • hit rate {cs['hit_rate']:.0%}"
+        )
+
 
 # Responsive layout
 col_left, col_right = st.columns([1, 1], gap="small")
@@ -54,6 +103,16 @@ with col_left:
 
     if mode == "Batch Rank (ATS)":
         resume_files = st.file_uploader("Upload Multiple Resumes (PDF)", type=["pdf"], accept_multiple_files=True)
+    elif mode == "Bulk Ingest (ZIP / Folder)":
+        bulk_zip = st.file_uploader("Upload a ZIP of Resumes (PDF)", type=["zip"])
+        bulk_path = ""
+        # server-side sources only inside the operator's allow-listed folder
+        if server_root() is not None:
+            bulk_path = st.text_input(
+                f"…or a ZIP / folder under {server_root()}",
+                help="Read directly from disk, so the archive is never uploaded through the browser. "
+                     "Paths are relative to TALENTRANK_BULK_ROOT.",
+            )
     else:
         resume_file = st.file_uploader("Upload Resume (PDF)", type=["pdf"])
 
@@ -109,14 +168,26 @@ def _make_leaderboard_df(results_sorted):
             "Semantic %": round(r.sbert * 100, 2),
             "Keyword %": round(r.tfidf * 100, 2),
             "Skill %": round(r.skill_overlap * 100, 2),
-            "Missing (preview)": ", ".join(r.missing[:8]) + (" ..." if len(r.missing) > 8 else ""),
+            "Missing (preview)": ", ".join(r.missing_skills()[:8]) + (" ..." if len(r.missing_skills()) > 8 else ""),
         })
     return pd.DataFrame(rows)
 
 
 # Initialize session state
-if "results_sorted" not in st.session_state:
-    st.session_state.results_sorted = []
+if "perf" not in st.session_state:
+    st.session_state.perf = None
+if "profile" not in st.session_state:
+    st.session_state.profile = None
+if "failed_files" not in st.session_state:
+    st.session_state.failed_files = []
+if "truncated_files" not in st.session_state:
+    st.session_state.truncated_files = []
+if "score_table" not in st.session_state:
+    st.session_state.score_table = None
+if "scored_weights" not in st.session_state:
+    st.session_state.scored_weights = weights
+if "scored_top_k" not in st.session_state:
+    st.session_state.scored_top_k = None  # Top K the cascade pruned for (None: nothing pruned)
 if "jd_skills" not in st.session_state:
     st.session_state.jd_skills = []
 if "jd_text" not in st.session_state:
@@ -131,15 +202,69 @@ if run_btn:
             st.error("Please upload at least one resume PDF.")
             st.stop()
 
-        results = []
-        for f in resume_files:
-            resume_text = extract_text_from_pdf(f)
-            results.append(score_resume_against_jd(resume_text, jd_text, f.name, weights))
+        with (profile_run() if profile_on else nullcontext()) as prof, recording() as perf:
+            # parsed in a process pool; a broken file is reported instead of failing the batch
+            extracted = extract_many(resume_files, mode=pdf_mode)
+            failed = [r for r in extracted if not r.ok]
+            resumes = [(r.text, r.name) for r in extracted if r.ok]
+            results = score_resumes_against_jd(resumes, jd_text, weights, cascade=cascade, top_k=top_k)
+        st.session_state.profile = prof.report if prof is not None else None
+        if prof is not None and prof.busy:
+            st.warning("Profiling skipped: another session is profiling right now.")
+        st.session_state.failed_files = [(r.name, r.error) for r in failed]
+        st.session_state.truncated_files = [(r.name, r.truncated) for r in extracted if r.ok and r.truncated]
+        if not resumes:
+            st.error("None of the uploaded PDFs could be read: "
+                     + "; ".join(f"{r.name} ({r.error})" for r in failed))
+            st.stop()
 
-        results_sorted = sorted(results, key=lambda x: x.overall, reverse=True)
+        st.session_state.score_table = ScoreTable.from_results(results)
+        st.session_state.scored_weights = weights
+        st.session_state.scored_top_k = top_k if cascade else None
+        st.session_state.jd_skills = results[0].jd_skills if results else []
+        st.session_state.jd_text = jd_text
+
+    elif mode == "Bulk Ingest (ZIP / Folder)":
+        source = bulk_zip
+        if bulk_path.strip():
+            try:
+                source = resolve_server_path(bulk_path.strip(), server_root())
+            except ValueError as exc:
+                st.error(str(exc))
+                st.stop()
+        if not source:
+            st.error("Please upload a ZIP of resumes.")
+            st.stop()
+
+        # members are read, extracted and scored one chunk at a time; only the scores are kept
+        results, failed, truncated = [], [], []
+        progress = st.empty()
+        try:
+            with recording() as perf:
+                for records in iter_scored(source, jd_text, weights, mode=pdf_mode):
+                    for rec in records:
+                        if rec.result is None:
+                            failed.append((rec.name, rec.error))
+                        else:
+                            results.append(rec.result)
+                            if rec.truncated:
+                                truncated.append((rec.name, rec.truncated))
+                    progress.caption(f"Processed {len(results) + len(failed)} files…")
+        except (OSError, zipfile.BadZipFile) as exc:
+            st.error(f"Could not read {bulk_path.strip() or bulk_zip.name}: {exc}")
+            st.stop()
+        progress.empty()
+        st.session_state.profile = None
+        st.session_state.failed_files = failed
+        st.session_state.truncated_files = truncated
+        if not results:
+            st.error(f"No readable resume PDFs found ({len(failed)} skipped).")
+            st.stop()
 
-        st.session_state.results_sorted = results_sorted
-        st.session_state.jd_skills = results_sorted[0].jd_skills if results_sorted else []
+        st.session_state.score_table = ScoreTable.from_results(results)
+        st.session_state.scored_weights = weights
+        st.session_state.scored_top_k = None
+        st.session_state.jd_skills = results[0].jd_skills
         st.session_state.jd_text = jd_text
 
     else:
@@ -147,16 +272,28 @@ if run_btn:
             st.error("Please upload a resume PDF.")
             st.stop()
 
-        resume_text = extract_text_from_pdf(resume_file)
-        result = score_resume_against_jd(resume_text, jd_text, resume_file.name, weights)
-
-        st.session_state.results_sorted = [result]
+        with recording() as perf:
+            with candidate(resume_file.name):
+                resume_text = extract_text_from_pdf(resume_file, mode=pdf_mode)
+            result = score_resume_against_jd(resume_text, jd_text, resume_file.name, weights)
+
+        st.session_state.score_table = ScoreTable.from_results([result])
+        st.session_state.profile = None
+        st.session_state.failed_files = []
+        st.session_state.truncated_files = []
+        st.session_state.scored_weights = weights
+        st.session_state.scored_top_k = None
         st.session_state.jd_skills = result.jd_skills
         st.session_state.jd_text = jd_text
 
+    st.session_state.perf = perf
+    write_metrics(perf)  # Prometheus/JSON files when TALENTRANK_METRICS_DIR is set
+
 
 # ---------------- Render Tabs ----------------
-results_sorted = st.session_state.results_sorted
+# Component scores are kept, so moving a weight slider only re-ranks (no re-scoring).
+score_table = st.session_state.score_table
+results_sorted = score_table.reweight(weights) if score_table is not None else []
 jd_skills_global = st.session_state.jd_skills
 jd_text_global = st.session_state.jd_text
 
@@ -175,10 +312,48 @@ with col_right:
             _render_pipeline_summary(results_sorted)
             softline()
 
-            df = _make_leaderboard_df(results_sorted)
-            st.dataframe(df.head(top_k), use_container_width=True, hide_index=True)
+            df = _make_leaderboard_df(results_sorted[:top_k])
+            st.dataframe(df, use_container_width=True, hide_index=True)
 
             st.caption("Overall = weighted ensemble of Keyword + Semantic + Skill coverage (with robustness adjustments).")
+            if st.session_state.failed_files:
+                st.warning(
+                    f"{len(st.session_state.failed_files)} file(s) could not be read and were skipped: "
+                    + "; ".join(f"{name} ({err})" for name, err in st.session_state.failed_files)
+                )
+            if st.session_state.truncated_files:
+                st.caption(
+                    f"{len(st.session_state.truncated_files)} file(s) were cut off by the extraction limits: "
+                    + "; ".join(f"{name} ({limit})" for name, limit in st.session_state.truncated_files)
+                )
+            if score_table.sbert_skipped:
+                st.caption(
+                    f"Fast cascade skipped {score_table.sbert_skipped} of {len(results_sorted)} "
+                    "SBERT encodes (candidates that could not reach REVIEW or the Top K)."
+                )
+                if weights != st.session_state.scored_weights:
+                    st.warning("Weights changed since the cascade run: skipped candidates have Semantic = 0, "
+                               "so re-run screening for an exact ranking.")
+                elif top_k > (st.session_state.scored_top_k or top_k):
+                    st.warning(f"Top K raised from {st.session_state.scored_top_k} since the cascade run: rows below "
+                               "that may be skipped candidates with Semantic = 0, so re-run screening for an "
+                               "exact Top K.")
+
+            perf = st.session_state.perf
+            if perf is not None:
+                with st.expander("Performance"):
+                    st.caption("Time per pipeline stage for the last run (batch stages run once per upload).")
+                    st.dataframe(pd.DataFrame(perf.summary()), use_container_width=True, hide_index=True)
+                    per_candidate = pd.DataFrame.from_dict(perf.breakdown(), orient="index").fillna(0.0) * 1000
+                    if not per_candidate.empty:
+                        st.caption("Per candidate (ms)")
+                        st.dataframe(per_candidate.round(2), use_container_width=True)
+                    st.download_button(
+                        "Timings (JSON)",
+                        data=json.dumps(perf.to_json(), indent=2).encode("utf-8"),
+                        file_name="talentrank_timings.json",
+                        mime="application/json",
+                    )
 
     # -------- Candidate View Tab --------
     with tabs[1]:
@@ -217,9 +392,9 @@ with col_right:
 
             # Skill gaps
             st.markdown("#### 📚 Skill Assessment")
-            if chosen.missing:
+            if chosen.missing_skills():
                 st.write("**Missing skills:**")
-                chips(chosen.missing)
+                chips(chosen.missing_skills())
             else:
                 st.success("All required skills detected!")
 
@@ -333,6 +508,40 @@ with col_right:
 
             st.caption("PDF for hiring notes, interviews, and candidate feedback.")
 
+            report = st.session_state.profile
+            if report is not None:
+                softline()
+                st.markdown("#### Profile of the last batch run")
+                st.caption(f"Wall time {report.wall_seconds:.2f}s • peak traced Python memory "
+                           f"{report.peak_bytes / 2**20:.1f} MB")
+                col1, col2, col3 = st.columns(3, gap="small")
+                with col1:
+                    st.download_button(
+                        "cProfile stats (.prof)",
+                        data=report.pstats_bytes,
+                        file_name="talentrank_run.prof",
+                        mime="application/octet-stream",
+                        use_container_width=True,
+                    )
+                with col2:
+                    st.download_button(
+                        "Top allocations (CSV)",
+                        data=pd.DataFrame(report.allocations).to_csv(index=False).encode("utf-8"),
+                        file_name="talentrank_allocations.csv",
+                        mime="text/csv",
+                        use_container_width=True,
+                    )
+                with col3:
+                    st.download_button(
+                        "Profile summary (JSON)",
+                        data=json.dumps(report.summary(), indent=2).encode("utf-8"),
+                        file_name="talentrank_profile.json",
+                        mime="application/json",
+                        use_container_width=True,
+                    )
+                with st.expander("Top functions (cumulative time)"):
+                    st.code(report.top_functions)
+
     # -------- Evaluation Tab (V9.1: PDF-based evaluation) --------
     with tabs[3]:
         with st.container(border=True):
@@ -376,7 +585,7 @@ with col_right:
 
                 items = []
                 for f in eval_files:
-                    text = extract_text_from_pdf(f)
+                    text = extract_text_from_pdf(f, mode=pdf_mode)
                     items.append(EvalItem(filename=f.name, text=text, label=int(labels[f.name])))
 
                 with st.spinner("Scoring resumes and computing metrics..."):
@@ -398,3 +607,8 @@ with col_right:
                 st.dataframe(leaderboards[model_choice], use_container_width=True, hide_index=True)
 
                 st.success("Evaluation complete! Use these metrics in your README and interviews.")
+
+
+# Load the encoder in the background once the page has rendered, so the first
+# paint never waits on torch and the first screening doesn't pay the load.
+REGISTRY.warmup(MODEL_NAME)
@@ -0,0 +1,100 @@
+"""
+Benchmark: single-pass SkillMatcher vs. the original per-skill regex loop.
+
+    python -m src.bench_skills --sizes 50 1000 10000
+
+For each skills-list size the real SKILLS are padded with synthetic terms
+(single words and phrases), both implementations run over the resumes and
+JD in eval_dataset.json, results are checked to be identical and the mean
+time per document is reported.
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from typing import List, Set
+
+from src.skills import SkillMatcher, _normalize
+from src.skills_db import SKILLS
+
+
+def extract_skills_loop(text: str, skills: List[str]) -> Set[str]:
+    """The original implementation: one re.search per skill."""
+    t = _normalize(text)
+    found: Set[str] = set()
+    for skill in skills:
+        if " " in skill:
+            if skill in t:
+                found.add(skill)
+        else:
+            if re.search(rf"\b{re.escape(skill)}\b", t):
+                found.add(skill)
+    return found
+
+
+def synthetic_skills(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    skills = set(SKILLS)
+    while len(skills) < n:
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        if rng.random() < 0.3:
+            word += " " + "".join(rng.choice(letters) for _ in range(rng.randint(3, 8)))
+        skills.add(word)
+    return sorted(skills)
+
+
+def _load_docs(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    return [data["jd_text"]] + [r["text"] for r in data["resumes"]]
+
+
+def _mean_ms(fn, docs: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for d in docs:
+            fn(d)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(docs))
+
+
+def run(sizes: List[int], dataset: str, repeat: int) -> List[dict]:
+    docs = _load_docs(dataset)
+    rows = []
+    for n in sizes:
+        skills = synthetic_skills(n)
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for d in docs:
+            if matcher.find(_normalize(d)) != extract_skills_loop(d, skills):
+                raise AssertionError(f"matcher and loop disagree with {n} skills")
+
+        rows.append({
+            "skills": len(skills),
+            "build_ms": round(build_ms, 2),
+            "loop_ms_per_doc": round(_mean_ms(lambda d: extract_skills_loop(d, skills), docs, repeat), 3),
+            "matcher_ms_per_doc": round(_mean_ms(lambda d: matcher.find(_normalize(d)), docs, repeat), 3),
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Skill matcher scaling benchmark.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 500, 2000, 10000])
+    parser.add_argument("--dataset", default="eval_dataset.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'skills':>7} {'build ms':>9} {'loop ms/doc':>12} {'matcher ms/doc':>15} {'speedup':>8}")
+    for r in run(args.sizes, args.dataset, args.repeat):
+        speedup = r["loop_ms_per_doc"] / max(r["matcher_ms_per_doc"], 1e-9)
+        print(f"{r['skills']:>7} {r['build_ms']:>9} {r['loop_ms_per_doc']:>12} "
+              f"{r['matcher_ms_per_doc']:>15} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Throughput benchmark with a synthetic corpus.
+
+    python -m src.benchmark --sizes 10 100 1000 --out bench          # writes bench.csv / bench.json
+    python -m src.benchmark --sizes 10 100 1000 --compare bench.json  # fails on regressions
+
+Resumes, a JD and resume PDFs are generated from the eval_dataset.json
+vocabulary and the skills taxonomy. For every pool size each stage is timed:
+
+    per resume   extract_text_from_pdf, tfidf_match_score, sbert_match_score,
+                 extract_skills, split_sections, highlight_terms
+    per pool     tfidf_match_scores, sbert_match_scores (batch APIs),
+                 generate_ats_pdf_report
+
+Per-resume stages time at most --sample resumes per size and extrapolate
+the pool total; they are flagged and reported in their own table, since
+their ms/resume is flat across sizes by construction. Batch stages run on
+the real pool (up to --batch-cap resumes, 0 = no cap), so their rows show
+how the batch APIs actually scale. The embedding and PDF text caches are bypassed for the run
+(the environment is restored afterwards) so every number is real work.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.ranking import REVIEW_THRESHOLD, SHORTLIST_THRESHOLD, CandidateResult
+from src.skills_db import SKILLS
+
+
+SECTION_TITLES = ["Skills", "Experience", "Projects", "Education"]
+
+PER_RESUME = [
+    "extract_text_from_pdf", "tfidf_match_score", "sbert_match_score",
+    "extract_skills", "split_sections", "highlight_terms",
+]
+PER_POOL = ["tfidf_match_scores", "sbert_match_scores", "generate_ats_pdf_report"]
+STAGES = PER_RESUME + PER_POOL
+
+
+# ---------------- synthetic corpus ----------------
+
+def load_vocabulary(dataset: str = "eval_dataset.json") -> List[str]:
+    """Lower-case words from the labeled dataset (JD + resumes)."""
+    try:
+        with open(dataset, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        text = " ".join([data["jd_text"]] + [r["text"] for r in data["resumes"]])
+    except (OSError, ValueError, KeyError):
+        text = ""
+    words = sorted(set(re.findall(r"[a-z][a-z\-]{2,}", text.lower())))
+    return words or ["team", "project", "built", "developed", "data", "system", "model"]
+
+
+class CorpusGenerator:
+    """Seeded generator of resumes / JDs with skills and section headings."""
+
+    def __init__(self, vocabulary: Sequence[str], skills: Sequence[str] = SKILLS, seed: int = 0):
+        self.vocabulary = list(vocabulary)
+        self.skills = list(skills)
+        self.rng = random.Random(seed)
+
+    def _sentence(self, n_words: int, skills: Sequence[str]) -> str:
+        words = [self.rng.choice(self.vocabulary) for _ in range(n_words)]
+        for s in skills:
+            words.insert(self.rng.randrange(len(words) + 1), s)
+        return " ".join(words).capitalize() + "."
+
+    def resume(self, n_words: int = 300) -> str:
+        skills = self.rng.sample(self.skills, k=min(len(self.skills), self.rng.randint(3, 12)))
+        per_section = max(8, n_words // len(SECTION_TITLES))
+        parts = []
+        for title in SECTION_TITLES:
+            if title == "Skills":
+                body = ", ".join(skills)
+            else:
+                picked = self.rng.sample(skills, k=min(2, len(skills)))
+                body = "\n".join(
+                    self._sentence(12, picked if i == 0 else [])
+                    for i in range(max(1, per_section // 12))
+                )
+            parts.append(f"{title}\n{body}")
+        return "\n\n".join(parts)
+
+    def jd(self, n_words: int = 150) -> str:
+        skills = self.rng.sample(self.skills, k=min(len(self.skills), 8))
+        return "Requirements: " + self._sentence(n_words, skills)
+
+
+def text_to_pdf(text: str) -> bytes:
+    """Render plain text as a simple PDF (core font, latin-1)."""
+    from fpdf import FPDF  # lazy, like pdf_export
+
+    pdf = FPDF(format="A4")
+    pdf.set_auto_page_break(auto=True, margin=12)
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=10)
+    pdf.multi_cell(0, 5, text.encode("latin-1", "replace").decode("latin-1"))
+    return bytes(pdf.output())
+
+
+def synthetic_results(n: int, jd_skills: List[str], seed: int = 0) -> List[CandidateResult]:
+    """Scored-looking results for the report stage (no models involved)."""
+    rng = np.random.default_rng(seed)
+    overall = np.sort(rng.random(n))[::-1]
+    return [
+        CandidateResult(
+            filename=f"resume_{i:06d}.pdf",
+            overall=float(o), tfidf=float(rng.random()), sbert=float(rng.random()),
+            skill_overlap=float(rng.random()), resume_skills=[], jd_skills=jd_skills,
+            missing=jd_skills[: i % (len(jd_skills) + 1)],
+            decision="SHORTLIST" if o >= SHORTLIST_THRESHOLD else "REVIEW" if o >= REVIEW_THRESHOLD else "REJECT",
+        )
+        for i, o in enumerate(overall)
+    ]
+
+
+# ---------------- timing ----------------
+
+def _time(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+@contextmanager
+def _env(name: str, value: str) -> Iterator[None]:
+    old = os.environ.get(name)
+    os.environ[name] = value
+    try:
+        yield
+    finally:
+        if old is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = old
+
+
+def run(
+    sizes: Sequence[int],
+    stages: Sequence[str] = STAGES,
+    sample: Optional[int] = 2000,
+    resume_words: int = 300,
+    dataset: str = "eval_dataset.json",
+    seed: int = 0,
+    batch_cap: Optional[int] = None,
+) -> List[Dict]:
+    """
+    One row per (pool size, stage) with total seconds, ms per resume and
+    resumes/s. `sample` caps the per-resume stages, `batch_cap` the batch
+    stages (None = whole pool).
+    """
+    with _env("TALENTRANK_EMBED_CACHE", "0"):
+        return _run(sizes, stages, sample, resume_words, dataset, seed, batch_cap)
+
+
+def _run(sizes, stages, sample, resume_words, dataset, seed, batch_cap) -> List[Dict]:
+    from src.highlight import highlight_terms
+    from src.pdf_export import generate_ats_pdf_report
+    from src.pdf_utils import extract_text_from_pdf
+    from src.scoring import tfidf_match_score, tfidf_match_scores
+    from src.sections import split_sections
+    from src.semantic_scoring import sbert_match_score, sbert_match_scores
+    from src.skills import extract_skills
+
+    gen = CorpusGenerator(load_vocabulary(dataset), seed=seed)
+    jd = gen.jd()
+    jd_skills = extract_skills(jd)
+    # lazy imports and model load are not throughput
+    sbert_match_score("warm up", jd)
+    tfidf_match_score("warm up", jd)
+    extract_text_from_pdf(io.BytesIO(text_to_pdf("warm up")), use_cache=False)
+
+    rows = []
+    resumes: List[str] = []
+    for n in sorted(sizes):
+        timed_n = min(n, sample or n)
+        batch_n = min(n, batch_cap or n) if any(s in PER_POOL for s in stages) else 0
+        while len(resumes) < max(timed_n, batch_n):  # only what gets timed is generated
+            resumes.append(gen.resume(resume_words))
+        timed = resumes[:timed_n]
+        batch = resumes[:batch_n]
+
+        per_resume: Dict[str, Callable[[str], object]] = {
+            "tfidf_match_score": lambda r: tfidf_match_score(r, jd),
+            "sbert_match_score": lambda r: sbert_match_score(r, jd),
+            "extract_skills": extract_skills,
+            "split_sections": split_sections,
+            "highlight_terms": lambda r: highlight_terms(r, jd_skills),
+        }
+        # batch stages run on the whole pool (up to batch_cap) as one batch
+        report_input = synthetic_results(batch_n, jd_skills, seed) if "generate_ats_pdf_report" in stages else []
+        per_pool: Dict[str, Callable[[], object]] = {
+            "tfidf_match_scores": lambda: tfidf_match_scores(batch, jd),
+            "sbert_match_scores": lambda: sbert_match_scores(batch, jd),
+            "generate_ats_pdf_report": lambda: generate_ats_pdf_report(
+                report_input, jd_skills, "Batch Rank (ATS)", (0.2, 0.65, 0.15)
+            ),
+        }
+
+        for stage in stages:
+            if stage == "extract_text_from_pdf":
+                pdfs = [text_to_pdf(r) for r in timed]  # generation is not timed
+                secs = _time(lambda: [extract_text_from_pdf(io.BytesIO(p), use_cache=False) for p in pdfs])
+                measured = len(pdfs)
+            elif stage in per_resume:
+                fn = per_resume[stage]
+                secs = _time(lambda: [fn(r) for r in timed])
+                measured = len(timed)
+            else:
+                secs = _time(per_pool[stage])
+                measured = batch_n
+
+            total = secs * n / measured
+            rows.append({
+                "size": n,
+                "stage": stage,
+                "kind": "per_pool" if stage in PER_POOL else "per_resume",
+                "measured": measured,
+                "extrapolated": measured < n,
+                "seconds": round(total, 6),
+                "ms_per_resume": round(total * 1000 / n, 6),
+                "resumes_per_s": round(n / total, 2) if total > 0 else float("inf"),
+            })
+            print(f"{n:>7} {stage:<24} {total:>10.3f}s {total * 1000 / n:>10.3f} ms/resume"
+                  + ("  (extrapolated)" if measured < n else ""), file=sys.stderr)
+    return rows
+
+
+def scaling_table(rows: List[Dict], extrapolated: Optional[bool] = None) -> pd.DataFrame:
+    """
+    Scaling curves: ms per resume, stages x pool sizes. `extrapolated`
+    keeps only stages with (True) or without (False) an extrapolated row.
+    """
+    df = pd.DataFrame(rows)
+    if extrapolated is not None:
+        flagged = set(df.loc[df["extrapolated"], "stage"])
+        df = df[df["stage"].isin(flagged) == extrapolated]
+    return df.pivot(index="stage", columns="size", values="ms_per_resume")
+
+
+def baseline(rows: List[Dict]) -> Dict:
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "rows": rows,
+    }
+
+
+def compare(rows: List[Dict], base: Dict, tolerance: float = 0.25) -> pd.DataFrame:
+    """
+    Stages whose ms per resume got more than `tolerance` slower than the
+    baseline at the same pool size (only pairs present in both runs).
+    """
+    cur = pd.DataFrame(rows).set_index(["size", "stage"])["ms_per_resume"]
+    old = pd.DataFrame(base["rows"]).set_index(["size", "stage"])["ms_per_resume"]
+    both = pd.concat({"baseline_ms": old, "current_ms": cur}, axis=1, join="inner")
+    both["ratio"] = (both["current_ms"] / both["baseline_ms"]).round(3)
+    return both[both["ratio"] > 1 + tolerance].reset_index()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stage throughput benchmark on a synthetic corpus.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--sample", type=int, default=2000,
+                        help="max resumes timed per per-resume stage, rest extrapolated (0 = whole pool)")
+    parser.add_argument("--batch-cap", type=int, default=0,
+                        help="max pool size for the batch stages, rest extrapolated (0 = whole pool)")
+    parser.add_argument("--resume-words", type=int, default=300)
+    parser.add_argument("--dataset", default="eval_dataset.json", help="vocabulary source")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write <out>.csv and the <out>.json baseline")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing")
+    args = parser.parse_args(argv)
+
+    rows = run(args.sizes, args.stages, args.sample or None, args.resume_words, args.dataset, args.seed,
+               args.batch_cap or None)
+    for title, flag in (("Measured (ms/resume)", False), ("Extrapolated past --sample / --batch-cap (ms/resume)", True)):
+        table = scaling_table(rows, extrapolated=flag)
+        if len(table):
+            print(f"\n{title}\n" + table.round(3).to_string())
+
+    if args.out:
+        pd.DataFrame(rows).to_csv(f"{args.out}.csv", index=False)
+        with open(f"{args.out}.json", "w", encoding="utf-8") as fh:
+            json.dump(baseline(rows), fh, indent=2)
+        print(f"\nWrote {args.out}.csv and {args.out}.json")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            slower = compare(rows, json.load(fh), args.tolerance)
+        if len(slower):
+            print(f"\nRegressions (> {args.tolerance:.0%} slower than {args.compare}):")
+            print(slower.to_string(index=False))
+            sys.exit(1)
+        print(f"\nNo regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Bulk screening of a ZIP archive or a directory of resume PDFs.
+
+    python -m src.bulk_ingest cvs.zip --jd jd.txt --out ranked.csv --top-k 20
+
+Members are streamed in chunks of --chunk-size: a chunk is read, extracted
+in a process pool (src/pdf_parallel.py) and its raw bytes are dropped
+before the next chunk is read. The text is scored per chunk (TF-IDF
+pairwise, as in single-resume mode, so a score does not depend on which
+chunk a resume landed in) and only the scored result is kept. The CLI writes each chunk's rows to the CSV as it goes
+and keeps just the top K, so peak memory depends on the chunk size, not
+the size of the archive.
+
+Environment:
+    TALENTRANK_BULK_MAX_MB  skip members larger than this (default 20)
+    TALENTRANK_BULK_ROOT    directory the app may read server-side ZIPs /
+                            folders from (unset = uploads only)
+"""
+
+import argparse
+import heapq
+import os
+import sys
+import time
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.pdf_parallel import ExtractResult, extract_many
+from src.pdf_utils import ExtractLimits
+from src.ranking import CandidateResult, build_jd_profile, score_resumes_against_jd, to_row_dict
+from src.scoring import tfidf_match_score
+from src.timing import candidate, stage
+
+
+DEFAULT_CHUNK = 128
+DEFAULT_WEIGHTS = (0.20, 0.65, 0.15)
+
+
+@dataclass
+class IngestRecord:
+    name: str
+    result: Optional[CandidateResult] = None
+    error: Optional[str] = None
+    truncated: Optional[str] = None  # extraction limit that cut the text short
+
+
+def max_member_bytes() -> int:
+    return int(float(os.environ.get("TALENTRANK_BULK_MAX_MB", 20)) * 1024 * 1024)
+
+
+def server_root() -> Optional[Path]:
+    root = os.environ.get("TALENTRANK_BULK_ROOT", "").strip()
+    return Path(root).resolve() if root else None
+
+
+def resolve_server_path(path: str, root: Path) -> Path:
+    """
+    `path` (relative to `root`, or absolute) resolved with symlinks followed;
+    ValueError unless it exists and stays inside `root`.
+    """
+    resolved = (root / path).resolve()
+    if resolved != root and root not in resolved.parents:
+        raise ValueError(f"{path!r} is outside {root}")
+    if not resolved.exists():
+        raise ValueError(f"{path!r} does not exist under {root}")
+    return resolved
+
+
+def _is_pdf(name: str) -> bool:
+    parts = PurePosixPath(name).parts
+    return (
+        name.lower().endswith(".pdf")
+        and not any(p.startswith(".") or p == "__MACOSX" for p in parts)
+    )
+
+
+def _read_limited(fh, limit: int) -> bytes:
+    data = fh.read(limit + 1)  # the size in a ZIP header can lie
+    if len(data) > limit:
+        raise ValueError(f"larger than {limit / 2**20:.0f} MB")
+    return data
+
+
+@contextmanager
+def open_members(source, max_bytes: Optional[int] = None) -> Iterator[Iterator[Tuple[str, Callable[[], bytes]]]]:
+    """
+    Iterator of (name, read) for every PDF in a ZIP file (path or file
+    object) or under a directory, in a stable order. read() loads that one
+    member only; the archive stays open until the block exits.
+    """
+    max_bytes = max_bytes or max_member_bytes()
+    if isinstance(source, (str, os.PathLike)) and Path(source).is_dir():
+        yield _walk(Path(source), max_bytes)
+        return
+
+    with zipfile.ZipFile(source) as zf:
+        yield (
+            (info.filename, (lambda i=info: _read_member(zf, i, max_bytes)))
+            for info in zf.infolist()
+            if not info.is_dir() and _is_pdf(info.filename)
+        )
+
+
+def _walk(root: Path, max_bytes: int) -> Iterator[Tuple[str, Callable[[], bytes]]]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for fn in sorted(filenames):
+            path = Path(dirpath) / fn
+            name = path.relative_to(root).as_posix()
+            if _is_pdf(name) and not path.is_symlink():  # a link could point outside the folder
+                yield name, (lambda p=path: _read_path(p, max_bytes))
+
+
+def _read_path(path: Path, max_bytes: int) -> bytes:
+    with open(path, "rb") as fh:
+        return _read_limited(fh, max_bytes)
+
+
+def _read_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, max_bytes: int) -> bytes:
+    if info.file_size > max_bytes:
+        raise ValueError(f"larger than {max_bytes / 2**20:.0f} MB")
+    with zf.open(info) as fh:
+        return _read_limited(fh, max_bytes)
+
+
+def _extract_chunk(members, workers: Optional[int], limits: Optional[ExtractLimits], mode: Optional[str]) -> List[ExtractResult]:
+    """One ExtractResult per (name, read) member, in member order (read failures included)."""
+    out: List[ExtractResult] = []
+    files, slots = [], []
+    for name, read in members:
+        out.append(ExtractResult(name=name))
+        try:
+            files.append((name, read()))
+            slots.append(len(out) - 1)
+        except Exception as exc:
+            out[-1].error = f"{type(exc).__name__}: {exc}"
+    # one extract_many call per chunk (timeouts and crash isolation); the bytes are released when it returns
+    for slot, res in zip(slots, extract_many(files, workers=workers, limits=limits, mode=mode)):
+        out[slot] = res
+    del files
+    return out
+
+
+def _chunks(items: Iterator, size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_scored(
+    source,
+    jd_text: str,
+    weights: Tuple[float, float, float] = DEFAULT_WEIGHTS,
+    chunk_size: int = DEFAULT_CHUNK,
+    workers: Optional[int] = None,
+    limits: Optional[ExtractLimits] = None,
+    mode: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+) -> Iterator[List[IngestRecord]]:
+    """
+    Stream the PDFs of `source` (ZIP or directory) through extraction and
+    scoring; yields one list of IngestRecords per chunk, in archive order.
+    """
+    profile = build_jd_profile(jd_text)
+    with open_members(source, max_bytes) as all_members:
+        for members in _chunks(all_members, chunk_size):
+            yield _score_chunk(members, jd_text, weights, profile, workers, limits, mode)
+
+
+def _score_chunk(members, jd_text, weights, profile, workers, limits, mode) -> List[IngestRecord]:
+    """Extract and score one chunk of (name, read) members; records keep the archive order."""
+    extracted = _extract_chunk(members, workers, limits, mode)
+    records: List[IngestRecord] = []
+    ok: List[int] = []  # positions in `records` still to be scored
+    for r in extracted:
+        if not r.ok:
+            records.append(IngestRecord(name=r.name, error=r.error))
+        elif not r.text.strip():
+            records.append(IngestRecord(name=r.name, error="no text layer"))
+        else:
+            records.append(IngestRecord(name=r.name, truncated=r.truncated))
+            ok.append(len(records) - 1)
+
+    tfidf = []
+    for i in ok:
+        with candidate(extracted[i].name), stage("tfidf"):
+            tfidf.append(tfidf_match_score(extracted[i].text, jd_text))
+    results = score_resumes_against_jd(
+        [(extracted[i].text, extracted[i].name) for i in ok], jd_text, weights, profile=profile, tfidf_scores=tfidf
+    )
+    # positions, not names: a ZIP can hold the same name twice
+    for i, res in zip(ok, results):
+        records[i].result = res
+    return records
+
+
+def _row(rec: IngestRecord) -> dict:
+    if rec.result is None:
+        return {"filename": rec.name, "error": rec.error}
+    row = to_row_dict(rec.result)
+    row["truncated"] = rec.truncated
+    return row
+
+
+def _columns() -> Sequence[str]:
+    sample = CandidateResult("", 0.0, 0.0, 0.0, 0.0, [], [], [], "")
+    return list(to_row_dict(sample)) + ["truncated", "error"]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform != "darwin" else peak / 2**20
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screen a ZIP archive or directory of resume PDFs against a JD.")
+    parser.add_argument("source", help="ZIP file or directory of PDFs")
+    parser.add_argument("--jd", required=True, help="job description text file")
+    parser.add_argument("--out", default="bulk_results.csv", help="CSV with one row per file (written as it goes)")
+    parser.add_argument("--weights", nargs=3, type=float, default=list(DEFAULT_WEIGHTS),
+                        metavar=("TFIDF", "SBERT", "SKILL"))
+    parser.add_argument("--top-k", type=int, default=20, help="candidates printed at the end")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    parser.add_argument("--workers", type=int, help="extraction processes (default: $TALENTRANK_PDF_WORKERS)")
+    parser.add_argument("--mode", choices=["full", "fast"], help="PDF extraction mode (default: $TALENTRANK_PDF_MODE)")
+    args = parser.parse_args(argv)
+
+    jd_text = Path(args.jd).read_text(encoding="utf-8")
+    total = sum(args.weights) or 1.0
+    weights = tuple(w / total for w in args.weights)
+
+    start = time.perf_counter()
+    top: List[Tuple[float, int, CandidateResult]] = []
+    seen = scored = failed = 0
+    header = True
+    for records in iter_scored(args.source, jd_text, weights, args.chunk_size, args.workers, mode=args.mode):
+        rows = [_row(rec) for rec in records]
+        pd.DataFrame(rows).reindex(columns=_columns()).to_csv(args.out, mode="w" if header else "a",
+                                                               header=header, index=False)
+        header = False
+        for rec in records:
+            seen += 1
+            if rec.result is None:
+                failed += 1
+                continue
+            scored += 1
+            item = (rec.result.overall, -seen, rec.result)
+            if len(top) < args.top_k:
+                heapq.heappush(top, item)
+            else:
+                heapq.heappushpop(top, item)
+        print(f"{seen} files, {scored} scored, {failed} skipped", file=sys.stderr)
+
+    best = [r for _, _, r in sorted(top, key=lambda t: (-t[0], -t[1]))]
+    if best:
+        print(pd.DataFrame([to_row_dict(r) for r in best]).to_string(index=False))
+    peak = _peak_rss_mb()
+    print(f"\n{seen} files ({failed} skipped) in {time.perf_counter() - start:.1f}s"
+          + (f", peak RSS {peak:.0f} MB" if peak else "") + f"; rows written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
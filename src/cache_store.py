@@ -0,0 +1,181 @@
+"""
+Small content-addressed on-disk store with a size cap and LRU eviction.
+Used by the embedding cache; entries are plain files tracked by an index.json.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def default_cache_dir() -> Path:
+    """Cache root: $TALENTRANK_CACHE_DIR or ./.cache/talentrank"""
+    return Path(os.environ.get("TALENTRANK_CACHE_DIR", Path(".cache") / "talentrank"))
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class DiskStore:
+    """
+    Files keyed by string, evicted least-recently-used once the total size
+    exceeds `max_bytes` (down to LOW_WATER of it, so the next puts don't
+    evict again). The index is kept in memory in LRU order; index.json
+    is rewritten at most every FLUSH_SECONDS while entries are being added,
+    and on flush() / interpreter exit.
+    """
+
+    INDEX_NAME = "index.json"
+    FLUSH_SECONDS = 5.0
+    LOW_WATER = 0.9
+
+    def __init__(self, root, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._index: "OrderedDict[str, Dict]" = self._load_index()
+        self._total = sum(e["size"] for e in self._index.values())
+        self._dirty = False
+        self._flushed_at = time.monotonic()
+        atexit.register(self.flush)
+
+    # ---- index ----
+    def _load_index(self) -> "OrderedDict[str, Dict]":
+        try:
+            with open(self.root / self.INDEX_NAME, "r", encoding="utf-8") as fh:
+                index = json.load(fh)
+        except (OSError, ValueError):
+            return OrderedDict()
+        # least recently used first; drop entries whose file disappeared
+        live = [(k, v) for k, v in index.items() if (self.root / v["file"]).exists()]
+        return OrderedDict(sorted(live, key=lambda kv: kv[1]["last_used"]))
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._write_index()
+
+    def _write_index(self) -> None:
+        self._dirty = False
+        self._flushed_at = time.monotonic()
+        tmp = self.root / f"{self.INDEX_NAME}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self._index, fh)
+        os.replace(tmp, self.root / self.INDEX_NAME)
+
+    # ---- access ----
+    @staticmethod
+    def _file_name(key: str, suffix: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + suffix
+
+    def get(self, key: str, read: Callable[[Path], T]) -> Optional[T]:
+        """
+        read(path) of the stored file for `key`, or None; only a successful
+        load counts as a hit. An entry whose file is gone (evicted by another
+        process) or fails to parse (truncated) is dropped, its file deleted.
+        Other OS errors (e.g. too many open files) are misses that keep the
+        entry, since the file itself is fine.
+        """
+        with self._lock:
+            entry = self._index.get(key)
+        if entry is not None:
+            path = self.root / entry["file"]
+            broken = False
+            try:
+                value = read(path)
+            except FileNotFoundError:
+                value, broken = None, True
+            except OSError:
+                value = None
+            except Exception:  # truncated or corrupt file
+                value, broken = None, True
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            with self._lock:
+                if value is not None:
+                    entry["last_used"] = time.time()
+                    if self._index.get(key) is entry:
+                        self._index.move_to_end(key)
+                    self._dirty = True
+                    self.hits += 1
+                    return value
+                if broken and self._index.get(key) is entry:
+                    self._drop(key)
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, suffix: str, write: Callable[[Path], None]) -> Path:
+        """
+        Store a file for `key`. `write(path)` must create the file at `path`
+        (the file is written under a temporary name and renamed into place).
+        """
+        name = self._file_name(key, suffix)
+        path = self.root / name
+        tmp = self.root / f"{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        write(tmp)
+        os.replace(tmp, path)
+        size = path.stat().st_size
+
+        with self._lock:
+            old = self._index.get(key)
+            self._total += size - (old["size"] if old else 0)
+            self._index[key] = {"file": name, "size": size, "last_used": time.time()}
+            self._index.move_to_end(key)
+            self._evict()
+            self._dirty = True
+            if time.monotonic() - self._flushed_at >= self.FLUSH_SECONDS:
+                self._write_index()
+        return path
+
+    def _drop(self, key: str) -> None:
+        entry = self._index.pop(key)
+        self._total -= entry["size"]
+        self._dirty = True
+
+    def _evict(self) -> None:
+        if self._total <= self.max_bytes:
+            return
+        target = self.max_bytes * self.LOW_WATER
+        while self._index and self._total > target:
+            key, entry = next(iter(self._index.items()))  # least recently used
+            try:
+                (self.root / entry["file"]).unlink()
+            except OSError:
+                pass
+            self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._index.values():
+                try:
+                    (self.root / entry["file"]).unlink()
+                except OSError:
+                    pass
+            self._index = OrderedDict()
+            self._total = 0
+            self._write_index()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "bytes": self._total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,70 @@
+"""
+Persistent embedding cache.
+Embeddings are stored as float32 .npy files (loaded memory-mapped), keyed by
+(text hash, model name, normalisation flag), with a size cap and LRU eviction.
+
+Environment:
+    TALENTRANK_CACHE_DIR       cache root (default ./.cache/talentrank)
+    TALENTRANK_EMBED_CACHE     set to 0 to disable the cache
+    TALENTRANK_EMBED_CACHE_MB  size cap in MB (default 512)
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.cache_store import DiskStore, default_cache_dir, sha256_text
+
+
+DEFAULT_MAX_MB = 512
+
+
+class EmbeddingCache:
+    def __init__(self, root=None, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.store = DiskStore(root or default_cache_dir() / "embeddings", max_bytes)
+
+    @staticmethod
+    def key(text: str, model_name: str, normalize: bool) -> str:
+        return f"{model_name}|{int(bool(normalize))}|{sha256_text(text)}"
+
+    def get(self, text: str, model_name: str, normalize: bool) -> Optional[np.ndarray]:
+        # loaded eagerly: a memory map would hold a file descriptor per cached row
+        return self.store.get(self.key(text, model_name, normalize), np.load)
+
+    def put(self, text: str, model_name: str, normalize: bool, embedding: np.ndarray) -> None:
+        arr = np.ascontiguousarray(embedding, dtype=np.float32)
+
+        def _write(path):
+            with open(path, "wb") as fh:
+                np.save(fh, arr)
+
+        self.store.put(self.key(text, model_name, normalize), ".npy", _write)
+
+    @property
+    def hits(self) -> int:
+        return self.store.hits
+
+    @property
+    def misses(self) -> int:
+        return self.store.misses
+
+    def stats(self) -> Dict:
+        return self.store.stats()
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Process-wide cache configured from the environment (None when disabled)."""
+    global _CACHE
+    if os.environ.get("TALENTRANK_EMBED_CACHE", "1") == "0":
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            max_mb = float(os.environ.get("TALENTRANK_EMBED_CACHE_MB", DEFAULT_MAX_MB))
+            _CACHE = EmbeddingCache(max_bytes=int(max_mb * 1024 * 1024))
+    return _CACHE
@@ -0,0 +1,112 @@
+"""
+Parity and speed comparison of the encoder backends (see src/encoders.py).
+
+    python -m src.encoder_bench --dataset eval_dataset.json
+
+Parity: cosine between each backend's embedding and the fp32 PyTorch
+embedding for every text in the dataset (JD + resumes), plus the largest
+change in the JD-resume SBERT score.
+Speed: single-text latency and batched throughput on CPU.
+The embedding cache is bypassed so every number is a real encode.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from src.encoders import BACKENDS, load_encoder
+from src.semantic_scoring import MODEL_NAME
+
+
+def _load_texts(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    return [data["jd_text"]] + [r["text"] for r in data["resumes"]]
+
+
+def _encode(encoder, texts: List[str], batch_size: int) -> np.ndarray:
+    return np.asarray(encoder.encode(texts, batch_size=batch_size, normalize_embeddings=True), dtype=np.float32)
+
+
+def _latency_ms(encoder, texts: List[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        for t in texts:
+            start = time.perf_counter()
+            encoder.encode([t], batch_size=1, normalize_embeddings=True)
+            times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def _throughput(encoder, texts: List[str], batch_size: int, min_texts: int) -> float:
+    corpus = (texts * (min_texts // max(len(texts), 1) + 1))[:max(min_texts, len(texts))]
+    start = time.perf_counter()
+    _encode(encoder, corpus, batch_size)
+    return len(corpus) / (time.perf_counter() - start)
+
+
+def compare_backends(
+    texts: List[str],
+    backends=BACKENDS,
+    model_name: str = MODEL_NAME,
+    batch_size: int = 32,
+    repeat: int = 3,
+    throughput_texts: int = 256,
+) -> pd.DataFrame:
+    """
+    One row per backend: parity vs. the torch fp32 reference and CPU speed.
+    Texts[0] is treated as the JD for the score-drift column.
+    """
+    reference = _encode(load_encoder(model_name, "torch"), texts, batch_size)
+    ref_scores = reference[1:] @ reference[0]
+
+    rows: List[Dict] = []
+    for backend in backends:
+        encoder = load_encoder(model_name, backend)
+        _encode(encoder, texts[:1], 1)  # warmup (session init, first allocation)
+
+        emb = _encode(encoder, texts, batch_size)
+        cos = np.sum(emb * reference, axis=1)
+        scores = emb[1:] @ emb[0]
+        rows.append({
+            "Backend": backend,
+            "Mean cosine vs fp32": round(float(cos.mean()), 6),
+            "Min cosine vs fp32": round(float(cos.min()), 6),
+            "Max score drift": round(float(np.max(np.abs(scores - ref_scores))) if len(scores) else 0.0, 6),
+            "Latency p50 (ms)": round(_latency_ms(encoder, texts, repeat), 2),
+            "Throughput (texts/s)": round(_throughput(encoder, texts, batch_size, throughput_texts), 1),
+        })
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare encoder backends for parity and CPU speed.")
+    parser.add_argument("--dataset", default="eval_dataset.json")
+    parser.add_argument("--model", default=MODEL_NAME)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--throughput-texts", type=int, default=256)
+    parser.add_argument("--json", help="also write the table to this JSON file")
+    args = parser.parse_args(argv)
+
+    df = compare_backends(
+        _load_texts(args.dataset),
+        backends=args.backends,
+        model_name=args.model,
+        batch_size=args.batch_size,
+        repeat=args.repeat,
+        throughput_texts=args.throughput_texts,
+    )
+    print(df.to_string(index=False))
+    if args.json:
+        df.to_json(args.json, orient="records", indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Pluggable sentence-encoder backends for CPU inference.
+
+Backends (select with TALENTRANK_ENCODER_BACKEND):
+    torch      SentenceTransformer on PyTorch (default, reference fp32 model)
+    onnx       the same transformer exported to ONNX, run with ONNX Runtime
+    onnx-int8  the ONNX export with dynamic int8 weight quantization
+
+ONNX artifacts are exported once from the PyTorch model and stored under
+<cache dir>/onnx/<model>/ (built in a temp dir and renamed into place, so an
+interrupted export is redone and other workers never load a partial one). Every backend exposes the subset of the
+SentenceTransformer API used by src.semantic_scoring:
+encode(texts, batch_size, normalize_embeddings, convert_to_numpy) and
+get_sentence_embedding_dimension().
+"""
+
+import inspect
+import json
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+
+from src.cache_store import default_cache_dir
+
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+DEFAULT_BACKEND = "torch"
+
+
+def encoder_backend() -> str:
+    backend = os.environ.get("TALENTRANK_ENCODER_BACKEND", DEFAULT_BACKEND).strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown encoder backend {backend!r}; expected one of {BACKENDS}")
+    return backend
+
+
+def encoder_id(model_name: str, backend: str) -> str:
+    """Identifier used to key cached embeddings (backends give slightly different vectors)."""
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+
+def _onnx_dir(model_name: str) -> Path:
+    return default_cache_dir() / "onnx" / re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+
+
+# written last by export_onnx, so its presence means the export finished
+DONE_MARKER = "encoder.json"
+
+
+@contextmanager
+def _staged_dir(out_dir: Path):
+    """
+    Yield a temp dir next to `out_dir` and rename it into place on success.
+    If another process published a complete export first, that one is kept;
+    a leftover incomplete `out_dir` (interrupted older export) is replaced.
+    """
+    out_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{out_dir.name}.", dir=out_dir.parent))
+    try:
+        yield tmp
+        if not (out_dir / DONE_MARKER).exists():
+            if out_dir.exists():
+                shutil.rmtree(out_dir, ignore_errors=True)
+            try:
+                os.replace(tmp, out_dir)
+            except OSError:
+                if not (out_dir / DONE_MARKER).exists():  # not just a lost race
+                    raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+# ---------------- Export ----------------
+
+def export_onnx(model_name: str, out_dir=None) -> Path:
+    """
+    Export the transformer of a SentenceTransformer model to ONNX (fp32).
+    Writes model.onnx, tokenizer.json and encoder.json (DONE_MARKER, last)
+    to `out_dir`, all at once via _staged_dir.
+    """
+    out_dir = Path(out_dir or _onnx_dir(model_name))
+    with _staged_dir(out_dir) as tmp:
+        _export_files(model_name, tmp)
+    return out_dir / "model.onnx"
+
+
+def _export_files(model_name: str, out_dir: Path) -> None:
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    st = SentenceTransformer(model_name, device="cpu")
+    pooling = st[1] if len(st) > 1 else None
+    if pooling is None or not getattr(pooling, "pooling_mode_mean_tokens", False):
+        raise ValueError(f"{model_name}: only mean-pooling models can be exported")
+
+    auto_model = st[0].auto_model.eval()
+    sample = st.tokenizer(["export sample text"], return_tensors="pt", padding=True, truncation=True)
+    input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+
+    class _LastHidden(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *args):
+            return self.model(**dict(zip(input_names, args))).last_hidden_state
+
+    dynamic_axes = {n: {0: "batch", 1: "seq"} for n in input_names + ["last_hidden_state"]}
+    kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        kwargs["dynamo"] = False
+
+    with torch.no_grad():
+        torch.onnx.export(
+            _LastHidden(auto_model),
+            tuple(sample[n] for n in input_names),
+            str(out_dir / "model.onnx"),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14,
+            **kwargs,
+        )
+
+    st.tokenizer.backend_tokenizer.save(str(out_dir / "tokenizer.json"))
+    with open(out_dir / DONE_MARKER, "w", encoding="utf-8") as fh:
+        json.dump({
+            "model_name": model_name,
+            "max_seq_length": st.max_seq_length,
+            "dimension": st.get_sentence_embedding_dimension(),
+            "input_names": input_names,
+            "pad_token_id": st.tokenizer.pad_token_id or 0,
+            "pad_token": st.tokenizer.pad_token or "[PAD]",
+        }, fh)
+
+
+def quantize_onnx(fp32_path, int8_path=None) -> Path:
+    """Dynamic int8 weight quantization of an exported ONNX model."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    fp32_path = Path(fp32_path)
+    int8_path = Path(int8_path or fp32_path.with_name("model-int8.onnx"))
+    tmp = int8_path.with_name(f".{int8_path.stem}.{os.getpid()}.onnx")
+    try:
+        quantize_dynamic(str(fp32_path), str(tmp), weight_type=QuantType.QInt8)
+        os.replace(tmp, int8_path)  # readers only ever see a complete file
+    finally:
+        tmp.unlink(missing_ok=True)
+    return int8_path
+
+
+# ---------------- Runtime ----------------
+
+class OnnxEncoder:
+    """Mean-pooled sentence embeddings from an ONNX-exported transformer."""
+
+    def __init__(self, model_name: str, quantized: bool = False, model_dir=None):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "The onnx encoder backends need `onnxruntime` (pip install onnxruntime)."
+            ) from e
+
+        model_dir = Path(model_dir or _onnx_dir(model_name))
+        fp32_path = model_dir / "model.onnx"
+        if not (model_dir / DONE_MARKER).exists():
+            export_onnx(model_name, model_dir)
+        path = fp32_path
+        if quantized:
+            path = model_dir / "model-int8.onnx"
+            if not path.exists():
+                quantize_onnx(fp32_path, path)
+
+        with open(model_dir / DONE_MARKER, "r", encoding="utf-8") as fh:
+            self.config = json.load(fh)
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.config["max_seq_length"])
+        self.tokenizer.enable_padding(pad_id=self.config["pad_token_id"], pad_token=self.config["pad_token"])
+
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.model_path = path
+        self.session = ort.InferenceSession(str(path), opts, providers=["CPUExecutionProvider"])
+        self.input_names: List[str] = self.config["input_names"]
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return int(self.config["dimension"])
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        hidden = self.session.run(None, {n: feeds[n] for n in self.input_names})[0]
+
+        mask = feeds["attention_mask"][..., None].astype(np.float32)
+        summed = (hidden * mask).sum(axis=1)
+        return summed / np.clip(mask.sum(axis=1), 1e-9, None)
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        convert_to_numpy: bool = True,
+        **_,
+    ) -> np.ndarray:
+        texts = list(texts)
+        out = np.zeros((len(texts), self.get_sentence_embedding_dimension()), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            out[start:start + batch_size] = self._encode_batch(texts[start:start + batch_size])
+        if normalize_embeddings:
+            out /= np.clip(np.linalg.norm(out, axis=1, keepdims=True), 1e-12, None)
+        return out
+
+
+def load_encoder(model_name: str, backend: str = DEFAULT_BACKEND):
+    """Instantiate the encoder for `backend` (one of BACKENDS)."""
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model_name)
+    if backend == "onnx":
+        return OnnxEncoder(model_name, quantized=False)
+    if backend == "onnx-int8":
+        return OnnxEncoder(model_name, quantized=True)
+    raise ValueError(f"Unknown encoder backend {backend!r}; expected one of {BACKENDS}")
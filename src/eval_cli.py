@@ -0,0 +1,261 @@
+"""
+Headless evaluation over labeled datasets.
+
+    python -m src.eval_cli eval_dataset.json more_jds/ --out-dir eval_out --workers 4
+
+Each input is a JSON file (or a directory of them) in eval_dataset.json
+format, {"jd_text": ..., "resumes": [{"filename", "text", "label"}, ...]},
+optionally named with "name"; a file may also hold a list of such datasets
+or {"datasets": [...]}.
+
+Component scores per dataset are computed in a process pool and cached on
+disk (keyed by JD, resumes, encoder, skills taxonomy and CACHE_VERSION), so
+re-runs only score datasets that changed. A dataset that fails to score is
+reported; the others are still evaluated. Metrics and leaderboards come from
+eval_experiment.compare_models and are written as CSV and/or JSON.
+
+Environment:
+    TALENTRANK_COMPONENT_CACHE_MB  component cache size cap in MB (default 256)
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.cache_store import DiskStore, default_cache_dir, sha256_text
+from src.encoders import encoder_backend, encoder_id
+from src.eval_experiment import EvalItem, compare_models
+from src.ranking import CandidateResult, score_resumes_against_jd
+from src.score_table import ScoreTable
+from src.semantic_scoring import MODEL_NAME
+from src.skills_db import ALIASES, SKILLS
+
+
+DEFAULT_WEIGHTS = (0.20, 0.65, 0.15)
+
+
+def load_datasets(paths: List[str]) -> List[Dict]:
+    """Datasets from JSON files / directories, each with a unique "name"."""
+    files: List[Path] = []
+    for p in map(Path, paths):
+        files.extend(sorted(p.glob("*.json")) if p.is_dir() else [p])
+
+    datasets: List[Dict] = []
+    for f in files:
+        with open(f, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        entries = data.get("datasets", [data]) if isinstance(data, dict) else data
+        for i, d in enumerate(entries):
+            name = d.get("name") or (f.stem if len(entries) == 1 else f"{f.stem}[{i}]")
+            datasets.append({"name": name, "jd_text": d["jd_text"], "resumes": d["resumes"]})
+
+    seen: Dict[str, int] = {}
+    for d in datasets:  # keep output names unique
+        n = seen.get(d["name"], 0)
+        seen[d["name"]] = n + 1
+        if n:
+            d["name"] = f"{d['name']}#{n}"
+    return datasets
+
+
+class ComponentCache:
+    """Scored CandidateResults per dataset, pickled in a DiskStore."""
+
+    # bump whenever scoring or CandidateResult changes, so stale entries are not reused
+    CACHE_VERSION = 1
+
+    def __init__(self, root=None, max_bytes: int = 256 * 1024 * 1024):
+        self.store = DiskStore(root or default_cache_dir() / "components", max_bytes)
+        self._config = json.dumps([
+            self.CACHE_VERSION, list(DEFAULT_WEIGHTS),
+            encoder_id(MODEL_NAME, encoder_backend()), sorted(SKILLS), sorted(ALIASES.items()),
+        ])
+
+    def key(self, dataset: Dict) -> str:
+        # TF-IDF is fitted on the whole batch, so the key covers every resume
+        parts = [self._config, dataset["jd_text"]]
+        parts += [f"{r['filename']}\0{r['text']}" for r in dataset["resumes"]]
+        return sha256_text("\0\0".join(parts))
+
+    def get(self, dataset: Dict) -> Optional[List[CandidateResult]]:
+        def _read(path):
+            with open(path, "rb") as fh:
+                return pickle.load(fh)
+
+        return self.store.get(self.key(dataset), _read)
+
+    def put(self, dataset: Dict, results: List[CandidateResult]) -> None:
+        def _write(path):
+            with open(path, "wb") as fh:
+                pickle.dump(results, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.store.put(self.key(dataset), ".pkl", _write)
+
+
+def _init_worker() -> None:
+    # workers only compute; the parent owns the on-disk caches
+    os.environ["TALENTRANK_EMBED_CACHE"] = "0"
+
+
+def _score(jd_text: str, resumes: List[Dict]) -> List[CandidateResult]:
+    return score_resumes_against_jd([(r["text"], r["filename"]) for r in resumes], jd_text, DEFAULT_WEIGHTS)
+
+
+def score_datasets(
+    datasets: List[Dict], workers: int = 1, cache: Optional[ComponentCache] = None
+) -> Tuple[Dict[str, List[CandidateResult]], int, Dict[str, str]]:
+    """
+    Component scores for every dataset (by name), the number of cache hits,
+    and {name: error} for datasets whose scoring failed (the others are still
+    returned and cached).
+    """
+    scored: Dict[str, List[CandidateResult]] = {}
+    failed: Dict[str, str] = {}
+    todo: List[Dict] = []
+    for d in datasets:
+        hit = cache.get(d) if cache else None
+        if hit is not None and len(hit) == len(d["resumes"]):
+            scored[d["name"]] = hit
+        else:
+            todo.append(d)
+    hits = len(datasets) - len(todo)
+
+    def _done(d: Dict, results: List[CandidateResult]) -> None:
+        scored[d["name"]] = results
+        if cache:
+            cache.put(d, results)
+
+    if workers <= 1 or len(todo) <= 1:
+        for d in todo:
+            try:
+                results = _score(d["jd_text"], d["resumes"])
+            except Exception as exc:
+                failed[d["name"]] = f"{type(exc).__name__}: {exc}"
+                continue
+            _done(d, results)
+    else:
+        # spawn: torch does not survive fork reliably
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(todo)), mp_context=get_context("spawn"), initializer=_init_worker
+        ) as pool:
+            futures = {pool.submit(_score, d["jd_text"], d["resumes"]): d for d in todo}
+            for fut in as_completed(futures):
+                d = futures[fut]
+                try:
+                    results = fut.result()
+                except Exception as exc:  # bad dataset or crashed worker
+                    failed[d["name"]] = f"{type(exc).__name__}: {exc}"
+                    continue
+                _done(d, results)
+    return scored, hits, failed
+
+
+def evaluate(
+    datasets: List[Dict],
+    weights: Tuple[float, float, float] = DEFAULT_WEIGHTS,
+    k_values: Tuple[int, ...] = (3, 5, 10),
+    workers: int = 1,
+    cache: Optional[ComponentCache] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Dict[str, pd.DataFrame]], int, Dict[str, str]]:
+    """
+    Returns (metrics for all scored datasets with a "Dataset" column,
+    {dataset: {model: leaderboard}}, component cache hits, {dataset: error}
+    for datasets that could not be scored).
+    """
+    scored, hits, failed = score_datasets(datasets, workers, cache)
+    metrics, leaderboards = [], {}
+    for d in datasets:
+        if d["name"] in failed:
+            continue
+        items = [EvalItem(filename=r["filename"], text=r["text"], label=int(r["label"])) for r in d["resumes"]]
+        table = ScoreTable.from_results(scored[d["name"]])
+        df_metrics, boards = compare_models(d["jd_text"], items, weights, k_values, table=table)
+        df_metrics.insert(0, "Dataset", d["name"])
+        metrics.append(df_metrics)
+        leaderboards[d["name"]] = boards
+    if not metrics:
+        return pd.DataFrame(columns=["Dataset", "Model", "K", "Precision@K", "NDCG@K"]), leaderboards, hits, failed
+    return pd.concat(metrics, ignore_index=True), leaderboards, hits, failed
+
+
+def _file_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+
+
+def summarize(metrics: pd.DataFrame) -> pd.DataFrame:
+    """Mean Precision@K / NDCG@K per model and K across datasets."""
+    cols = ["Precision@K", "NDCG@K"]
+    return metrics.groupby(["Model", "K"], sort=False)[cols].mean().round(4).reset_index()
+
+
+def write_outputs(out_dir: str, metrics: pd.DataFrame, leaderboards: Dict, formats: List[str]) -> None:
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    summary = summarize(metrics)
+
+    if "csv" in formats:
+        metrics.to_csv(out / "metrics.csv", index=False)
+        summary.to_csv(out / "summary.csv", index=False)
+        for dataset, boards in leaderboards.items():
+            ddir = out / "leaderboards" / _file_name(dataset)
+            ddir.mkdir(parents=True, exist_ok=True)
+            for model, df in boards.items():
+                df.to_csv(ddir / f"{_file_name(model)}.csv", index=False)
+    if "json" in formats:
+        payload = {
+            "summary": summary.to_dict(orient="records"),
+            "metrics": metrics.to_dict(orient="records"),
+            "leaderboards": {
+                dataset: {model: df.to_dict(orient="records") for model, df in boards.items()}
+                for dataset, boards in leaderboards.items()
+            },
+        }
+        with open(out / "results.json", "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate ranking models over labeled datasets.")
+    parser.add_argument("paths", nargs="+", help="dataset JSON files or directories")
+    parser.add_argument("--out-dir", default="eval_out")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--weights", nargs=3, type=float, default=list(DEFAULT_WEIGHTS),
+                        metavar=("KW", "SEM", "SKILL"), help="ensemble weights (normalised)")
+    parser.add_argument("--k", nargs="+", type=int, default=[3, 5, 10])
+    parser.add_argument("--format", nargs="+", choices=["csv", "json"], default=["csv", "json"])
+    parser.add_argument("--no-cache", action="store_true", help="don't read or write the component cache")
+    args = parser.parse_args(argv)
+
+    total = sum(args.weights)
+    weights = DEFAULT_WEIGHTS if total == 0 else tuple(w / total for w in args.weights)
+    cache = None
+    if not args.no_cache:
+        max_mb = float(os.environ.get("TALENTRANK_COMPONENT_CACHE_MB", 256))
+        cache = ComponentCache(max_bytes=int(max_mb * 1024 * 1024))
+
+    start = time.perf_counter()
+    datasets = load_datasets(args.paths)
+    metrics, leaderboards, hits, failed = evaluate(datasets, weights, tuple(args.k), args.workers, cache)
+    write_outputs(args.out_dir, metrics, leaderboards, args.format)
+
+    print(f"{len(datasets) - len(failed)} datasets ({hits} from cache) evaluated in "
+          f"{time.perf_counter() - start:.1f}s -> {args.out_dir}/")
+    print(summarize(metrics).to_string(index=False))
+    if failed:
+        print(f"\n{len(failed)} datasets failed:", file=sys.stderr)
+        for name, error in failed.items():
+            print(f"  {name}: {error}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
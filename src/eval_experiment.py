@@ -4,10 +4,11 @@ Supports PDF uploads with ground truth labels.
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from typing import List, Optional, Sequence, Tuple, Dict
 import pandas as pd
 
-from src.ranking import score_resume_against_jd
+from src.ranking import score_resumes_against_jd
+from src.score_table import ScoreTable
 from src.eval_metrics import precision_at_k, ndcg_at_k
 
 
@@ -19,57 +20,83 @@ class EvalItem:
     label: int  # 0=bad, 1=ok, 2=good
 
 
-def _run_once(
+def _score_items(
     jd_text: str,
     items: List[EvalItem],
     weights: Tuple[float, float, float]
+) -> ScoreTable:
+    """Compute every component score once; any weighting is then a re-rank."""
+    results = score_resumes_against_jd([(it.text, it.filename) for it in items], jd_text, weights)
+    return ScoreTable.from_results(results)
+
+
+def _rank(
+    table: ScoreTable,
+    items: List[EvalItem],
+    weights: Tuple[float, float, float]
 ) -> Tuple[List[int], List[int], pd.DataFrame]:
     """
-    Score all items and return metrics.
+    Rank the scored items under `weights` and return metrics inputs.
     
     Returns:
         (relevances, binary_labels, leaderboard_df)
     """
-    scored = []
-    for it in items:
-        s = score_resume_against_jd(it.text, jd_text, it.filename, weights)
-        scored.append((s, it.label))
-
     # Sort by predicted overall score
-    scored_sorted = sorted(scored, key=lambda x: x[0].overall, reverse=True)
+    overall = table.overall(weights)
+    order = table.order(weights)
     
     # Extract labels in ranked order
-    rel = [lab for _, lab in scored_sorted]
+    rel = [items[i].label for i in order]
     binary = [1 if r >= 1 else 0 for r in rel]  # ok+good are relevant
 
     # Build leaderboard
     leaderboard = pd.DataFrame([{
-        "Rank": i + 1,
-        "Filename": s.filename,
-        "Predicted": round(s.overall, 4),
-        "Semantic": round(s.sbert, 4),
-        "Keyword": round(s.tfidf, 4),
-        "Skill": round(s.skill_overlap, 4),
-        "True Label": lab,
-    } for i, (s, lab) in enumerate(scored_sorted)])
+        "Rank": rank + 1,
+        "Filename": table.results[i].filename,
+        "Predicted": round(float(overall[i]), 4),
+        "Semantic": round(table.results[i].sbert, 4),
+        "Keyword": round(table.results[i].tfidf, 4),
+        "Skill": round(table.results[i].skill_overlap, 4),
+        "True Label": items[i].label,
+    } for rank, i in enumerate(order)])
 
     return rel, binary, leaderboard
 
 
+def _run_once(
+    jd_text: str,
+    items: List[EvalItem],
+    weights: Tuple[float, float, float]
+) -> Tuple[List[int], List[int], pd.DataFrame]:
+    """
+    Score all items and return metrics.
+    
+    Returns:
+        (relevances, binary_labels, leaderboard_df)
+    """
+    return _rank(_score_items(jd_text, items, weights), items, weights)
+
+
 def compare_models(
     jd_text: str,
     items: List[EvalItem],
     ensemble_weights: Tuple[float, float, float],
-    k_values: Tuple[int, ...] = (3, 5, 10)
+    k_values: Tuple[int, ...] = (3, 5, 10),
+    extra_configs: Optional[Sequence[Tuple[str, Tuple[float, float, float]]]] = None,
+    table: Optional[ScoreTable] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
     """
     Compare TF-IDF, SBERT, Skill, and Ensemble models.
+    Resumes are scored once; each model is a re-weighting of the same
+    component scores.
     
     Args:
         jd_text: job description
         items: list of labeled resumes
         ensemble_weights: (kw, sem, skill) weights for ensemble
         k_values: cutoffs for metrics
+        extra_configs: additional (name, weights) models to compare
+        table: precomputed component scores for `items` (same order)
     
     Returns:
         (metrics_df, leaderboards_dict)
@@ -80,12 +107,16 @@ def compare_models(
         ("Skill only", (0.0, 0.0, 1.0)),
         ("Ensemble", ensemble_weights),
     ]
+    configs += list(extra_configs or [])
+
+    if table is None:
+        table = _score_items(jd_text, items, ensemble_weights)
 
     metrics_rows = []
     leaderboards: Dict[str, pd.DataFrame] = {}
 
     for name, w in configs:
-        rel, binary, lb = _run_once(jd_text, items, w)
+        rel, binary, lb = _rank(table, items, w)
         leaderboards[name] = lb
 
         for k in k_values:
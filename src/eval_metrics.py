@@ -1,10 +1,69 @@
 """
 Evaluation metrics for ranking quality assessment.
 Used to compute Precision@K and NDCG@K for model comparison.
+
+The *_batch functions take a 2-D matrix of ranked lists (one row per query
+or weight configuration) and several K values at once; the single-list
+functions are thin wrappers around them and return identical values.
 """
 
 import math
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
+
+
+_DISCOUNTS = np.zeros(0, dtype=np.float64)
+
+
+def log2_discounts(n: int) -> np.ndarray:
+    """log2(i + 2) for ranks i = 0..n-1 (precomputed and grown on demand)."""
+    global _DISCOUNTS
+    if _DISCOUNTS.size < n:
+        # math.log2 so values match the scalar formula bit for bit
+        _DISCOUNTS = np.array([math.log2(i + 2) for i in range(max(n, 2 * _DISCOUNTS.size))])
+    return _DISCOUNTS[:n]
+
+
+def _as_matrix(rows) -> np.ndarray:
+    m = np.asarray(rows)
+    return m.reshape(1, -1) if m.ndim == 1 else m
+
+
+def _cutoffs(k_values: Sequence[int], n: int) -> np.ndarray:
+    return np.array([max(1, min(k, n)) for k in k_values], dtype=np.int64)
+
+
+def precision_at_k_batch(labels, k_values: Sequence[int]) -> np.ndarray:
+    """
+    Precision@K for every row of `labels` (n_rows x ranked positions,
+    1 = relevant) and every K: array of shape (n_rows, len(k_values)).
+    """
+    labels = _as_matrix(labels)
+    ks = _cutoffs(k_values, labels.shape[1])
+    if labels.shape[1] == 0:
+        return np.zeros((labels.shape[0], len(ks)))
+    hits = np.cumsum(labels, axis=1)[:, ks - 1]
+    return hits / ks
+
+
+def dcg_at_k_batch(relevances, k_values: Sequence[int]) -> np.ndarray:
+    """DCG@K for every row and K: array of shape (n_rows, len(k_values))."""
+    rel = _as_matrix(relevances)
+    ks = _cutoffs(k_values, rel.shape[1])
+    if rel.shape[1] == 0:  # empty ranking: no gain (and no ideal, so NDCG is 0)
+        return np.zeros((rel.shape[0], len(ks)))
+    gains = (2.0 ** rel - 1) / log2_discounts(rel.shape[1])
+    # cumsum adds left to right like the scalar loop, so results are identical
+    return np.cumsum(gains, axis=1)[:, ks - 1]
+
+
+def ndcg_at_k_batch(relevances, k_values: Sequence[int]) -> np.ndarray:
+    """NDCG@K for every row and K (0 where the ideal DCG is 0)."""
+    rel = _as_matrix(relevances)
+    dcg = dcg_at_k_batch(rel, k_values)
+    ideal = dcg_at_k_batch(-np.sort(-rel, axis=1), k_values)
+    return np.divide(dcg, ideal, out=np.zeros_like(dcg), where=ideal != 0)
 
 
 def precision_at_k(labels: List[int], k: int) -> float:
@@ -18,8 +77,7 @@ def precision_at_k(labels: List[int], k: int) -> float:
     Returns:
         Precision@K (0 to 1)
     """
-    k = max(1, min(k, len(labels)))
-    return sum(labels[:k]) / k
+    return float(precision_at_k_batch(labels, [k])[0, 0])
 
 
 def dcg_at_k(relevances: List[int], k: int) -> float:
@@ -34,12 +92,7 @@ def dcg_at_k(relevances: List[int], k: int) -> float:
     Returns:
         DCG@K score
     """
-    k = max(1, min(k, len(relevances)))
-    score = 0.0
-    for i in range(k):
-        rel = relevances[i]
-        score += (2**rel - 1) / math.log2(i + 2)
-    return score
+    return float(dcg_at_k_batch(relevances, [k])[0, 0])
 
 
 def ndcg_at_k(relevances: List[int], k: int) -> float:
@@ -53,6 +106,4 @@ def ndcg_at_k(relevances: List[int], k: int) -> float:
     Returns:
         NDCG@K (0 to 1, where 1 = perfect ranking)
     """
-    ideal = sorted(relevances, reverse=True)
-    denom = dcg_at_k(ideal, k)
-    return 0.0 if denom == 0 else dcg_at_k(relevances, k) / denom
+    return float(ndcg_at_k_batch(relevances, [k])[0, 0])
@@ -6,7 +6,7 @@ Compares different weight configurations and computes metrics.
 from typing import List, Dict, Tuple
 import pandas as pd
 
-from src.ranking import score_resume_against_jd
+from src.ranking import score_resumes_against_jd
 from src.eval_metrics import precision_at_k, ndcg_at_k
 
 
@@ -34,16 +34,13 @@ def run_experiment(
         - df_ranked: ranked results with predictions and labels
     """
 
-    # Score all resumes
-    results = []
-    for r in resumes:
-        scored = score_resume_against_jd(
-            resume_text=r["text"],
-            jd_text=jd_text,
-            filename=r["filename"],
-            weights=weights,
-        )
-        results.append((scored, r["label"]))
+    # Score all resumes (JD features computed once for the batch)
+    scored_all = score_resumes_against_jd(
+        [(r["text"], r["filename"]) for r in resumes],
+        jd_text=jd_text,
+        weights=weights,
+    )
+    results = [(scored, r["label"]) for scored, r in zip(scored_all, resumes)]
 
     # Sort by predicted overall score (highest first)
     results_sorted = sorted(results, key=lambda x: x[0].overall, reverse=True)
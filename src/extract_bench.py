@@ -0,0 +1,118 @@
+"""
+Speed and fidelity comparison of the PDF extraction modes (see src/pdf_utils.MODES).
+
+    python -m src.extract_bench --resumes 200
+    python -m src.extract_bench --pdf-dir samples/      # also real PDFs
+
+Resume PDFs are generated from the eval_dataset.json vocabulary and the
+skills taxonomy (src/benchmark.py). Fidelity is skill recall: the share of
+the source text's extract_skills() found again in the extracted text. For
+PDFs from --pdf-dir there is no source text, so the "full" mode's skills
+are the reference. The PDF text cache is bypassed.
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.benchmark import CorpusGenerator, load_vocabulary, text_to_pdf
+from src.pdf_utils import MODES, extract_text_from_pdf
+from src.skills import extract_skills
+
+
+def synthetic_corpus(n: int, resume_words: int = 300, dataset: str = "eval_dataset.json", seed: int = 0):
+    """[(name, pdf bytes, reference skills)] for n generated resumes."""
+    gen = CorpusGenerator(load_vocabulary(dataset), seed=seed)
+    corpus = []
+    for i in range(n):
+        text = gen.resume(resume_words)
+        corpus.append((f"resume_{i:04d}.pdf", text_to_pdf(text), set(extract_skills(text))))
+    return corpus
+
+
+def _recall(found: set, reference: set) -> float:
+    return len(found & reference) / len(reference) if reference else 1.0
+
+
+def _run_mode(corpus, mode: str, repeat: int) -> Tuple[List[str], List[float]]:
+    """Extracted texts and per-file seconds (best of `repeat`)."""
+    texts, times = [], []
+    for _, data, _ in corpus:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = extract_text_from_pdf(data, use_cache=False, mode=mode)
+            best = min(best, time.perf_counter() - start)
+        texts.append(text)
+        times.append(best)
+    return texts, times
+
+
+def compare_modes(
+    corpus: List[Tuple[str, bytes, Optional[set]]],
+    modes: Sequence[str] = MODES,
+    repeat: int = 3,
+) -> pd.DataFrame:
+    """
+    One row per mode: throughput and skill recall. Files whose reference is
+    None are scored against the "full" mode's skills.
+    """
+    extract_text_from_pdf(text_to_pdf("warm up"), use_cache=False)  # lazy pypdf import
+    by_mode: Dict[str, Tuple[List[str], List[float]]] = {m: _run_mode(corpus, m, repeat) for m in modes}
+    full_texts = by_mode["full"][0] if "full" in by_mode else _run_mode(corpus, "full", 1)[0]
+    references = [
+        ref if ref is not None else set(extract_skills(full))
+        for (_, _, ref), full in zip(corpus, full_texts)
+    ]
+
+    rows = []
+    for mode, (texts, times) in by_mode.items():
+        recalls = [_recall(set(extract_skills(t)), ref) for t, ref in zip(texts, references)]
+        total = sum(times)
+        rows.append({
+            "Mode": mode,
+            "Files": len(corpus),
+            "Files/s": round(len(corpus) / total, 1) if total else float("inf"),
+            "ms/file p50": round(statistics.median(times) * 1000, 3),
+            "ms/file max": round(max(times) * 1000, 3),
+            "Skill recall (mean)": round(statistics.fmean(recalls), 4),
+            "Skill recall (min)": round(min(recalls), 4),
+            "Same text as full": round(sum(t == f for t, f in zip(texts, full_texts)) / len(corpus), 4),
+        })
+    df = pd.DataFrame(rows)
+    if "full" in by_mode:
+        base = df.loc[df["Mode"] == "full", "Files/s"].iloc[0]
+        df["Speed-up vs full"] = (df["Files/s"] / base).round(2)
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare PDF extraction modes for speed and skill recall.")
+    parser.add_argument("--resumes", type=int, default=200, help="generated resume PDFs")
+    parser.add_argument("--resume-words", type=int, default=300)
+    parser.add_argument("--pdf-dir", help="also benchmark the PDFs in this directory")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per file (best is kept)")
+    parser.add_argument("--dataset", default="eval_dataset.json", help="vocabulary source")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the table to this JSON file")
+    args = parser.parse_args(argv)
+
+    corpus = synthetic_corpus(args.resumes, args.resume_words, args.dataset, args.seed)
+    if args.pdf_dir:
+        corpus += [(p.name, p.read_bytes(), None) for p in sorted(Path(args.pdf_dir).glob("*.pdf"))]
+    if not corpus:
+        parser.error("no PDFs to benchmark")
+
+    df = compare_modes(corpus, args.modes, args.repeat)
+    print(df.to_string(index=False))
+    if args.json:
+        df.to_json(args.json, orient="records", indent=2)
+
+
+if __name__ == "__main__":
+    main()
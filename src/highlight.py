@@ -1,15 +1,28 @@
 import re
-from typing import List
+from typing import List, Optional
 
+from src.skills import SkillIndex, get_matcher, index_skills
 
-def highlight_terms(text: str, terms: List[str]) -> str:
+
+def highlight_terms(text: str, terms: List[str], index: Optional[SkillIndex] = None) -> str:
     """
     Returns HTML with highlighted matches for the given terms.
     Note: Streamlit must render with unsafe_allow_html=True
+    When every term is a skill of the taxonomy, matches follow extract_skills'
+    rules (whole words for single-word skills, aliases included), so what is
+    highlighted is what was counted; pass `index` (the SkillIndex of `text`)
+    to reuse its spans instead of scanning again. Other term lists are
+    highlighted as case-insensitive substrings, with or without `index`.
     """
     if not text.strip() or not terms:
         return text
 
+    matcher = get_matcher()
+    canonical = {matcher.canonical(" ".join(t.lower().split())) for t in terms if t.strip()}
+    if canonical and None not in canonical:
+        index = index if index is not None else index_skills(text)
+        return _highlight_spans(text, [sp for c in canonical for sp in index.original_spans(c)])
+
     # Highlight longer phrases first to avoid partial overlaps
     terms_sorted = sorted(set(terms), key=len, reverse=True)
 
@@ -20,3 +33,17 @@ def highlight_terms(text: str, terms: List[str]) -> str:
         return f"<mark>{match.group(0)}</mark>"
 
     return re.sub(pattern, repl, text, flags=re.IGNORECASE)
+
+
+def _highlight_spans(text: str, spans) -> str:
+    # left to right, longest first at equal start, overlapping spans skipped
+    out = []
+    pos = 0
+    for start, end in sorted(spans, key=lambda s: (s[0], -s[1])):
+        if start < pos:
+            continue
+        out.append(text[pos:start])
+        out.append(f"<mark>{text[start:end]}</mark>")
+        pos = end
+    out.append(text[pos:])
+    return "".join(out)
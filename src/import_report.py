@@ -0,0 +1,107 @@
+"""
+Import-time report for tracking Streamlit cold-start regressions.
+
+    python -m src.import_report            # table
+    python -m src.import_report --json out.json
+    python -m src.import_report --check    # exit 1 if app startup loads a heavy dependency
+
+Every module is imported in a fresh interpreter so timings are cold and
+independent of import order. "app startup" imports exactly what app.py
+imports before the first paint.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+MODULES = [
+    "src.pdf_utils",
+    "src.sections",
+    "src.highlight",
+    "src.suggestions",
+    "src.skills",
+    "src.scoring",
+    "src.semantic_scoring",
+    "src.ranking",
+    "src.pdf_export",
+    "src.eval_experiment",
+]
+
+APP_STARTUP = [
+    "pandas",
+    "streamlit",
+    "src.pdf_utils",
+    "src.pdf_cache",
+    "src.pdf_parallel",
+    "src.bulk_ingest",
+    "src.sections",
+    "src.highlight",
+    "src.suggestions",
+    "src.ranking",
+    "src.score_table",
+    "src.timing",
+    "src.scoring",
+    "src.semantic_scoring",
+    "src.model_registry",
+    "src.ui_style",
+    "src.ui_components",
+    "src.pdf_export",
+]
+
+# Dependencies that must not be loaded before the first paint.
+HEAVY = ["torch", "sentence_transformers", "sklearn", "fpdf", "onnxruntime", "transformers"]
+
+_PROBE = """
+import importlib, json, sys, time
+mods = json.loads(sys.argv[1])
+start = time.perf_counter()
+for m in mods:
+    importlib.import_module(m)
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [h for h in json.loads(sys.argv[2]) if h in sys.modules]
+print(json.dumps({"ms": elapsed, "heavy_loaded": heavy}))
+"""
+
+
+def measure(modules: List[str]) -> Dict:
+    """Cold import time (ms) of `modules` in a fresh interpreter and which heavy deps it loaded."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, json.dumps(modules), json.dumps(HEAVY)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def import_report() -> List[Dict]:
+    rows = []
+    for name, mods in [(m, [m]) for m in MODULES] + [("app startup", APP_STARTUP)]:
+        res = measure(mods)
+        rows.append({"module": name, "import_ms": round(res["ms"], 1), "heavy_loaded": res["heavy_loaded"]})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-module cold import times.")
+    parser.add_argument("--json", help="write the report to this JSON file")
+    parser.add_argument("--check", action="store_true", help="fail if app startup loads a heavy dependency")
+    args = parser.parse_args(argv)
+
+    rows = import_report()
+    width = max(len(r["module"]) for r in rows)
+    for r in rows:
+        heavy = ", ".join(r["heavy_loaded"]) or "-"
+        print(f"{r['module']:<{width}}  {r['import_ms']:>9.1f} ms   heavy: {heavy}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, indent=2)
+
+    if args.check and rows[-1]["heavy_loaded"]:
+        print(f"app startup loads heavy dependencies: {rows[-1]['heavy_loaded']}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Process-wide registry of sentence encoders.
+Each (model name, backend) pair is loaded exactly once, even when several
+Streamlit sessions ask for it at the same time, and can be warmed up in a
+background thread so the first request doesn't pay the load cost.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.encoders import encoder_backend, load_encoder
+
+
+Key = Tuple[str, str]  # (model_name, backend)
+
+
+@dataclass
+class ModelInfo:
+    model_name: str
+    backend: str
+    load_seconds: float
+    rss_delta_bytes: int
+    weights_bytes: int
+
+
+def _current_rss() -> int:
+    """Resident set size of this process in bytes (0 when unavailable)."""
+    try:
+        with open("/proc/self/statm", "r") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        import sys
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # peak, not current
+        return rss if sys.platform == "darwin" else rss * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+def _weights_bytes(model) -> int:
+    if hasattr(model, "parameters"):
+        return sum(p.numel() * p.element_size() for p in model.parameters())
+    path = getattr(model, "model_path", None)
+    if path is not None and Path(path).exists():
+        return Path(path).stat().st_size
+    return 0
+
+
+class ModelRegistry:
+    def __init__(self, loader: Callable = load_encoder):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Key, threading.Lock] = {}
+        self._models: Dict[Key, object] = {}
+        self._info: Dict[Key, ModelInfo] = {}
+        self._warmups: Dict[Key, threading.Thread] = {}
+
+    def _key(self, model_name: str, backend: Optional[str]) -> Key:
+        return (model_name, backend or encoder_backend())
+
+    def get(self, model_name: str, backend: Optional[str] = None):
+        """Return the loaded encoder, loading it under a per-model lock on first use."""
+        key = self._key(model_name, backend)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            model = self._models.get(key)
+            if model is None:
+                rss_before = _current_rss()
+                start = time.perf_counter()
+                model = self._loader(*key)
+                self._info[key] = ModelInfo(
+                    model_name=key[0],
+                    backend=key[1],
+                    load_seconds=time.perf_counter() - start,
+                    rss_delta_bytes=max(0, _current_rss() - rss_before),
+                    weights_bytes=_weights_bytes(model),
+                )
+                self._models[key] = model
+        return model
+
+    def warmup(self, model_name: str, backend: Optional[str] = None, background: bool = True):
+        """
+        Load the model and run one tiny encode. With background=True this
+        happens in a daemon thread (started at most once per model), which is
+        returned so callers can join it.
+        """
+        key = self._key(model_name, backend)
+
+        def _run():
+            self.get(*key).encode(["warmup"], batch_size=1, normalize_embeddings=True)
+
+        if not background:
+            _run()
+            return None
+
+        with self._lock:
+            thread = self._warmups.get(key)
+            if thread is None:
+                thread = threading.Thread(target=_run, name=f"warmup-{key[0]}-{key[1]}", daemon=True)
+                self._warmups[key] = thread
+                thread.start()
+        return thread
+
+    def is_loaded(self, model_name: str, backend: Optional[str] = None) -> bool:
+        return self._key(model_name, backend) in self._models
+
+    def memory_report(self) -> List[ModelInfo]:
+        """
+        Per loaded model: load time, RSS growth measured around the load
+        (approximate when models load concurrently) and weight size.
+        """
+        return list(self._info.values())
+
+
+REGISTRY = ModelRegistry()
@@ -0,0 +1,102 @@
+"""
+Cache of extracted PDF text, keyed by SHA-256 of the file bytes.
+
+An in-process LRU serves reruns, re-uploads and the Evaluation tab; an
+optional on-disk DiskStore (size-capped, LRU) keeps text across restarts.
+
+Environment:
+    TALENTRANK_PDF_CACHE        set to 0 to disable the cache
+    TALENTRANK_PDF_CACHE_ITEMS  in-process entries (default 512)
+    TALENTRANK_PDF_CACHE_MB     on-disk size cap in MB (default 0 = memory only)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from src.cache_store import DiskStore, default_cache_dir
+
+
+DEFAULT_MAX_ITEMS = 512
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class PdfTextCache:
+    def __init__(self, max_items: int = DEFAULT_MAX_ITEMS, disk_root=None, disk_max_bytes: int = 0):
+        self.max_items = max_items
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk = None
+        if disk_max_bytes > 0:
+            self.disk = DiskStore(disk_root or default_cache_dir() / "pdf_text", disk_max_bytes)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return text
+
+        if self.disk is not None:
+            text = self.disk.get(key, lambda path: path.read_text(encoding="utf-8"))
+            if text is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._remember(key, text)
+                return text
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, text: str) -> None:
+        self._remember(key, text)
+        if self.disk is not None:
+            self.disk.put(key, ".txt", lambda path: path.write_text(text, encoding="utf-8"))
+
+    def _remember(self, key: str, text: str) -> None:
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            out = {
+                "entries": len(self._memory),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            }
+        if self.disk is not None:
+            out["disk"] = self.disk.stats()
+        return out
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_pdf_cache() -> Optional[PdfTextCache]:
+    """Process-wide cache configured from the environment (None when disabled)."""
+    global _CACHE
+    if os.environ.get("TALENTRANK_PDF_CACHE", "1") == "0":
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            items = int(os.environ.get("TALENTRANK_PDF_CACHE_ITEMS", DEFAULT_MAX_ITEMS))
+            disk_mb = float(os.environ.get("TALENTRANK_PDF_CACHE_MB", 0))
+            _CACHE = PdfTextCache(max_items=items, disk_max_bytes=int(disk_mb * 1024 * 1024))
+    return _CACHE
@@ -1,4 +1,3 @@
-from fpdf import FPDF
 from datetime import datetime
 
 def generate_ats_pdf_report(results_sorted, jd_skills, mode, weights, top_n=10, brand_name="TalentRank"):
@@ -12,6 +11,7 @@ def generate_ats_pdf_report(results_sorted, jd_skills, mode, weights, top_n=10,
     - Key Insights
     - Footer
     """
+    from fpdf import FPDF  # imported lazily: only needed once a report is exported
 
     # ---- Helpers ----
     def pct(x):
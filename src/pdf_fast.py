@@ -0,0 +1,149 @@
+"""
+Fast text-layer extraction for screening.
+
+pypdf's page.extract_text() tracks the full text/graphics matrices, font
+widths and orientations for every glyph run, and recurses into form
+XObjects. Screening only needs the words, so page_text_fast() walks the
+content stream once and keeps just the text-showing operators:
+
+    Tf              select font (decoder cached per font dictionary)
+    Tj TJ ' "       show text (large TJ kerning gaps become spaces)
+    Td TD T* Tm BT  track the baseline; a new baseline starts a new line
+
+Images, form XObjects (Do) and inline images are skipped, and no layout is
+reconstructed (columns come out in content-stream order). Decoding uses the
+font's /Encoding and /ToUnicode maps, as pypdf does, through pypdf's
+private get_encoding helper; when a pypdf version lacks it, available() is
+False and iter_pdf_pages falls back to the full mode.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+from pypdf.generic import ContentStream
+
+log = logging.getLogger(__name__)
+
+# TJ adjustments are in thousandths of an em; most fonts' space is ~250
+TJ_SPACE = 200
+LINE_TOLERANCE = 0.5  # points of baseline movement treated as the same line
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    try:
+        from pypdf._cmap import get_encoding  # private; checked against pypdf 5.1
+    except (ImportError, AttributeError):
+        log.warning("pypdf has no _cmap.get_encoding; fast PDF mode falls back to full extraction")
+        return None
+    return get_encoding
+
+
+def available() -> bool:
+    """True when this pypdf provides what page_text_fast needs."""
+    return _get_encoding() is not None
+
+
+def _decoder(font) -> Callable[[bytes], str]:
+    encoding, to_unicode = _get_encoding()(font)
+
+    def decode(raw: bytes) -> str:
+        if isinstance(encoding, str):
+            try:
+                text = raw.decode(encoding, "surrogatepass")
+            except Exception:
+                text = raw.decode("utf-16-be" if encoding == "charmap" else "charmap", "surrogatepass")
+        else:
+            text = "".join(encoding.get(b, chr(b)) for b in raw)
+        if to_unicode:
+            text = "".join(to_unicode.get(c, c) for c in text)
+        return text
+
+    return decode
+
+
+def _latin1(raw: bytes) -> str:
+    return raw.decode("latin-1")
+
+
+def page_text_fast(page, decoders: Optional[Dict] = None) -> str:
+    """
+    Text of one pypdf page without layout handling. `decoders` caches font
+    decoders across the pages of a document (keyed by font object).
+    """
+    decoders = {} if decoders is None else decoders
+    resources = page.get("/Resources")
+    fonts = resources.get_object().get("/Font", {}) if resources is not None else {}
+    fonts = fonts.get_object() if hasattr(fonts, "get_object") else fonts
+    contents = page.get("/Contents")
+    if contents is None:
+        return ""
+    stream = ContentStream(contents.get_object(), page.pdf, "bytes")
+
+    out: List[str] = []
+    decode = _latin1
+    y = last_y = 0.0
+    leading = 0.0
+    pending_space = False
+
+    def show(raw) -> None:
+        nonlocal last_y, pending_space
+        text = decode(bytes(raw)) if isinstance(raw, bytes) else str(raw)
+        if not text:
+            return
+        if out:
+            if abs(y - last_y) > LINE_TOLERANCE:
+                out.append("\n")
+            elif pending_space and not out[-1].endswith(" ") and not text.startswith(" "):
+                out.append(" ")
+        out.append(text)
+        last_y = y
+        pending_space = False
+
+    for operands, op in stream.operations:
+        if op == b"Tj":
+            if operands:
+                show(operands[0])
+        elif op == b"TJ":
+            for item in operands[0] if operands else ():
+                if isinstance(item, (bytes, str)):
+                    show(item)
+                elif -float(item) >= TJ_SPACE:
+                    pending_space = True
+        elif op == b"Tf":
+            name = operands[0]
+            font = fonts.get(name) if fonts else None
+            if font is None:
+                decode = _latin1
+            else:
+                key = getattr(font, "idnum", None) or id(font.get_object())
+                if key not in decoders:
+                    try:
+                        decoders[key] = _decoder(font.get_object())
+                    except Exception:
+                        decoders[key] = _latin1
+                decode = decoders[key]
+        elif op == b"BT":
+            y = 0.0
+        elif op in (b"Td", b"TD"):
+            ty = float(operands[1])
+            if op == b"TD":
+                leading = -ty
+            y += ty
+            if float(operands[0]):
+                pending_space = True  # a separate glyph run (becomes a newline if the baseline moved)
+        elif op == b"Tm":
+            y = float(operands[5])
+            pending_space = True
+        elif op == b"TL":
+            leading = float(operands[0])
+        elif op == b"T*":
+            y -= leading or 1.0
+        elif op == b"'":
+            y -= leading or 1.0
+            show(operands[0])
+        elif op == b'"':
+            y -= leading or 1.0
+            show(operands[2])
+    return "".join(out)
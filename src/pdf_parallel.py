@@ -0,0 +1,308 @@
+"""
+Parallel PDF text extraction.
+
+    results = extract_many([(name, data_or_upload), ...], workers=4, timeout=60)
+    for r in results:            # same order as the input
+        r.text if r.ok else r.error
+
+Files go to a process pool (pypdf is pure Python and CPU-bound), even a
+single file, so every file gets the same isolation: a parse error, timeout
+or worker crash marks that file as failed and the rest of the batch
+continues. The pool is spawned once per process and reused by later calls. Nothing is parsed in the calling process. A worker that finds a
+large document extracts its first pages and reports the page count; the
+remaining page ranges are then extracted in parallel and joined in order,
+giving the same text as extract_text_from_pdf. Results share the PDF text
+cache with extract_text_from_pdf, and the same extraction mode and
+ExtractLimits (page, character and time budgets per file; files cut short
+have .truncated set).
+
+Environment:
+    TALENTRANK_PDF_WORKERS  pool size (default: CPU count, at most 8)
+"""
+
+import os
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.pdf_cache import get_pdf_cache
+from src.pdf_utils import ExtractLimits, cache_key, default_mode, iter_pdf_pages, page_count, read_pdf_bytes
+from src.timing import record
+
+
+SPLIT_PAGES = 40  # documents with more pages are split ...
+PAGES_PER_TASK = 20  # ... into ranges of this many pages
+
+
+@dataclass
+class ExtractResult:
+    name: str
+    text: str = ""
+    error: Optional[str] = None
+    seconds: float = 0.0
+    cached: bool = False
+    truncated: Optional[str] = None  # limit that cut the text short
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _TaskResult:
+    pages: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+    error: Optional[str] = None
+    stopped_by: Optional[str] = None
+    total_pages: Optional[int] = None  # set by a probe task that left pages for other tasks
+
+
+class _Timeout(BaseException):
+    # BaseException: pypdf's broad `except Exception` handlers must not swallow it
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise _Timeout()
+
+
+def _splittable(limits: ExtractLimits) -> bool:
+    # character and time budgets run across the whole document
+    return limits.max_chars is None and limits.time_budget is None
+
+
+def _extract_task(
+    data: bytes,
+    start: int,
+    stop: Optional[int],
+    timeout: Optional[float],
+    limits: ExtractLimits,
+    mode: str,
+    probe: bool = False,
+) -> _TaskResult:
+    """
+    Worker: page texts for pages[start:stop] within `limits`, interrupted
+    after `timeout` seconds. With `probe`, a document longer than SPLIT_PAGES
+    is only read up to PAGES_PER_TASK and its page count is returned.
+    """
+    t0 = time.perf_counter()
+    status: Dict = {}
+    use_alarm = timeout and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        total = None
+        if probe and _splittable(limits):
+            n = page_count(data)
+            if limits.max_pages is not None:
+                n = min(n, limits.max_pages)
+            if n > SPLIT_PAGES:
+                total, stop = n, PAGES_PER_TASK
+        pages = list(iter_pdf_pages(data, limits, start, stop, status, mode))
+        return _TaskResult(pages, time.perf_counter() - t0, None, status["stopped_by"], total)
+    except _Timeout:
+        raise TimeoutError(f"extraction exceeded {timeout:g}s") from None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def default_workers() -> int:
+    return int(os.environ.get("TALENTRANK_PDF_WORKERS", min(8, os.cpu_count() or 1)))
+
+
+def _rest_ranges(total: int) -> List[Tuple[int, Optional[int]]]:
+    """Page ranges after the probe task's first PAGES_PER_TASK pages."""
+    ranges: List[Tuple[int, Optional[int]]] = [
+        (s, s + PAGES_PER_TASK) for s in range(PAGES_PER_TASK, total, PAGES_PER_TASK)
+    ]
+    ranges[-1] = (ranges[-1][0], None)  # open-ended, so the worker reports a max_pages cut
+    return ranges
+
+
+_SHARED: Optional[ProcessPoolExecutor] = None
+_SHARED_WORKERS = 0
+_SHARED_LOCK = threading.Lock()
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+
+
+def _shared_pool(workers: int) -> ProcessPoolExecutor:
+    """The process-wide pool (spawned on first use, resized on demand); call with _SHARED_LOCK held."""
+    global _SHARED, _SHARED_WORKERS
+    if _SHARED is None or _SHARED_WORKERS != workers:
+        _discard_shared()
+        _SHARED, _SHARED_WORKERS = _new_pool(workers), workers
+    return _SHARED
+
+
+def _discard_shared() -> None:
+    global _SHARED
+    if _SHARED is not None:
+        _SHARED.shutdown(wait=False, cancel_futures=True)
+        _SHARED = None
+
+
+def _run_pool(
+    tasks: List[Tuple[int, bytes, int, Optional[int], bool]],
+    workers: int,
+    timeout: Optional[float],
+    limits: ExtractLimits,
+    mode: str = "full",
+) -> Dict[int, _TaskResult]:
+    """
+    Run (task_id, data, start, stop, probe) tasks; returns task_id -> _TaskResult.
+    Tasks go to the long-lived shared pool, so spawning is paid once per
+    process (a concurrent call that finds it busy uses a private pool).
+    Tasks lost to a crashed or stuck worker are re-run together in a fresh
+    pool; whatever is lost again is bisected until the file that really
+    breaks the parser is alone, and only that one fails.
+    """
+    out: Dict[int, _TaskResult] = {}
+    # the worker enforces `timeout` itself; the parent only steps in if a worker is stuck in C code
+    hard_limit = None if timeout is None else timeout + 5
+
+    def drain(batch, pool, n_workers) -> Dict[int, str]:
+        """Run `batch` on `pool`; returns task_id -> reason for tasks lost with their worker."""
+        lost: Dict[int, str] = {}
+        futures = {pool.submit(_extract_task, data, start, stop, timeout, limits, mode, probe): tid
+                   for tid, data, start, stop, probe in batch}
+        # every task may have waited for a free worker before starting
+        deadline = None
+        if hard_limit is not None:
+            deadline = time.monotonic() + hard_limit * -(-len(futures) // n_workers)
+        pending = set(futures)
+        while pending:
+            budget = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=budget, return_when=FIRST_COMPLETED)
+            if not done:
+                for fut in pending:
+                    lost[futures[fut]] = "timed out (worker unresponsive)"
+                _kill(pool)
+                break
+            for fut in done:
+                try:
+                    out[futures[fut]] = fut.result()
+                except BrokenProcessPool:
+                    lost[futures[fut]] = "worker crashed while parsing this file"
+                except Exception as exc:  # parse error, timeout
+                    out[futures[fut]] = _TaskResult(error=f"{type(exc).__name__}: {exc}")
+        return lost
+
+    def settle(batch) -> None:
+        if not batch:
+            return
+        n = min(workers, len(batch))
+        pool = _new_pool(n)
+        try:
+            lost = drain(batch, pool, n)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        again = [t for t in batch if t[0] in lost]
+        if not again:
+            return
+        if len(batch) == 1:
+            out[batch[0][0]] = _TaskResult(error=lost[batch[0][0]])
+            return
+        mid = (len(again) + 1) // 2
+        settle(again[:mid])
+        settle(again[mid:])
+
+    if not tasks:
+        return out
+    shared = _SHARED_LOCK.acquire(blocking=False)
+    try:
+        pool = _shared_pool(workers) if shared else _new_pool(workers)
+        lost = drain(tasks, pool, workers)
+        if lost and shared:
+            _discard_shared()  # broken or killed: the next call spawns a new one
+        elif not shared:
+            pool.shutdown(wait=False, cancel_futures=True)
+    finally:
+        if shared:
+            _SHARED_LOCK.release()
+    if lost:
+        settle([t for t in tasks if t[0] in lost])
+    return out
+
+
+def _kill(pool: ProcessPoolExecutor) -> None:
+    for proc in list(getattr(pool, "_processes", {}).values()):
+        proc.terminate()
+
+
+def extract_many(
+    files: Sequence,
+    workers: Optional[int] = None,
+    timeout: Optional[float] = 60.0,
+    use_cache: bool = True,
+    limits: Optional[ExtractLimits] = None,
+    mode: Optional[str] = None,
+) -> List[ExtractResult]:
+    """
+    Extract text from many PDFs in parallel. `files` holds (name, source)
+    pairs or Streamlit uploads (name taken from .name); a source is anything
+    extract_text_from_pdf accepts. `timeout` is per file (per page range for
+    split documents). `limits` defaults to ExtractLimits.from_env() and `mode`
+    to $TALENTRANK_PDF_MODE. Results keep the input order; failures have
+    .error set.
+    """
+    workers = workers or default_workers()
+    limits = ExtractLimits.from_env() if limits is None else limits
+    mode = mode or default_mode()
+    cache = get_pdf_cache() if use_cache else None
+
+    results: List[ExtractResult] = []
+    todo: List[Tuple[int, bytes, str]] = []
+    for i, f in enumerate(files):
+        name, source = f if isinstance(f, tuple) else (getattr(f, "name", f"file_{i}"), f)
+        res = ExtractResult(name=name)
+        results.append(res)
+        try:
+            data = read_pdf_bytes(source)
+        except Exception as exc:
+            res.error = f"{type(exc).__name__}: {exc}"
+            continue
+        key = cache_key(data, limits, mode)
+        text = cache.get(key) if cache else None
+        if text is not None:
+            res.text, res.cached = text, True
+        else:
+            todo.append((i, data, key))
+
+    # first pass: one probe task per file; large documents report their page count
+    first = _run_pool([(i, data, 0, None, True) for i, data, _ in todo], workers, timeout, limits, mode)
+
+    # second pass: the remaining page ranges of large documents
+    tasks, task_ids = [], {}
+    for i, data, _ in todo:
+        total = first[i].total_pages
+        if first[i].error is None and total is not None:
+            for start, stop in _rest_ranges(total):
+                task_ids.setdefault(i, []).append(len(tasks))
+                tasks.append((len(tasks), data, start, stop, False))
+    rest = _run_pool(tasks, workers, timeout, limits, mode)
+
+    for i, data, key in todo:
+        parts = [first[i]] + [rest[t] for t in task_ids.get(i, [])]
+        res = results[i]
+        res.seconds = sum(p.seconds for p in parts)
+        errors = [p.error for p in parts if p.error]
+        stopped = [p.stopped_by for p in parts if p.stopped_by]
+        if errors:
+            res.error = errors[0]
+        else:
+            res.text = "\n".join(page for p in parts for page in p.pages).strip()
+            res.truncated = stopped[0] if stopped else None
+        record("pdf_extract", res.seconds, res.name)
+        if res.ok and cache and res.truncated != "time_budget":
+            cache.put(key, res.text)
+    return results
@@ -1,12 +1,205 @@
-from pypdf import PdfReader
+import io
+import logging
+import os
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
 
+from src.pdf_cache import get_pdf_cache, sha256_bytes
+from src.timing import stage
 
-def extract_text_from_pdf(uploaded_file) -> str:
+
+log = logging.getLogger(__name__)
+
+# bump when the extraction output changes, so cached text is not reused
+EXTRACTOR_VERSION = "pypdf-1"
+
+# "full": pypdf's extract_text(); "fast": text layer only (see src/pdf_fast.py)
+MODES = ("full", "fast")
+
+
+def default_mode() -> str:
+    """$TALENTRANK_PDF_MODE, or "full" when unset or not one of MODES (warned once)."""
+    mode = os.environ.get("TALENTRANK_PDF_MODE", "full").strip().lower() or "full"
+    if mode not in MODES:
+        _warn_malformed("TALENTRANK_PDF_MODE", mode, f"one of {MODES}")
+        return "full"
+    return mode
+
+
+@dataclass(frozen=True)
+class ExtractLimits:
+    """
+    Per-file extraction budget; None means unlimited.
+    max_chars counts the joined document text (pages separated by "\n").
+    time_budget is checked between pages, so one slow page can overrun it
+    (the batch pool's hard timeout covers that case).
+    """
+
+    max_pages: Optional[int] = None
+    max_chars: Optional[int] = None
+    time_budget: Optional[float] = None  # seconds
+
+    @classmethod
+    def from_env(cls) -> "ExtractLimits":
+        return cls(
+            max_pages=_env_limit("TALENTRANK_PDF_MAX_PAGES", int),
+            max_chars=_env_limit("TALENTRANK_PDF_MAX_CHARS", int),
+            time_budget=_env_limit("TALENTRANK_PDF_TIME_BUDGET", float),
+        )
+
+    @property
+    def bounded(self) -> bool:
+        return any(v is not None for v in (self.max_pages, self.max_chars, self.time_budget))
+
+    def cache_tag(self) -> str:
+        """Key suffix for the deterministic limits (the time budget is not cacheable)."""
+        if self.max_pages is None and self.max_chars is None:
+            return ""
+        return f"|p={self.max_pages}|c={self.max_chars}"
+
+
+UNLIMITED = ExtractLimits()
+
+
+def _env_limit(name: str, cast):
+    """Positive value of $name, or None when unset, non-positive or malformed."""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return None
+    try:
+        parsed = cast(value)
+    except ValueError:
+        _warn_malformed(name, value, "a number")
+        return None
+    return parsed if parsed > 0 else None
+
+
+@lru_cache(maxsize=None)
+def _warn_malformed(name: str, value: str, expected: str) -> None:
+    # read per extraction / per app rerun: warn once per bad value, not per call
+    log.warning("ignoring %s=%r: not %s", name, value, expected)
+
+
+def read_pdf_bytes(uploaded_file) -> bytes:
+    """Raw bytes of a Streamlit upload, file object, path or bytes."""
+    if isinstance(uploaded_file, (bytes, bytearray)):
+        return bytes(uploaded_file)
+    if isinstance(uploaded_file, str) or hasattr(uploaded_file, "__fspath__"):
+        with open(uploaded_file, "rb") as fh:
+            return fh.read()
+    if hasattr(uploaded_file, "getvalue"):  # UploadedFile, BytesIO
+        return uploaded_file.getvalue()
+    uploaded_file.seek(0)
+    return uploaded_file.read()
+
+
+def page_count(data: bytes) -> int:
+    from pypdf import PdfReader  # lazy: keeps app start-up light
+
+    return len(PdfReader(io.BytesIO(data)).pages)
+
+
+def iter_pdf_pages(
+    data: bytes,
+    limits: ExtractLimits = UNLIMITED,
+    start: int = 0,
+    stop: Optional[int] = None,
+    status: Optional[Dict] = None,
+    mode: str = "full",
+) -> Iterator[str]:
+    """
+    Yield the raw text of pages[start:stop] one page at a time, extracted
+    with `mode` (see MODES). Stops early at limits.max_pages (counted from
+    the first page of the document), limits.max_chars or limits.time_budget;
+    when a limit cuts the document short, status["stopped_by"] is set to
+    "max_pages", "max_chars" or "time_budget".
+    """
+    from pypdf import PdfReader  # lazy: keeps app start-up light
+
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+    if mode == "fast":
+        from src.pdf_fast import available
+
+        mode = "fast" if available() else "full"
+    decoders: Dict = {}  # fast mode: font decoders shared by the pages of this document
+
+    def extract(page) -> str:
+        if mode == "fast":
+            from src.pdf_fast import page_text_fast
+
+            return page_text_fast(page, decoders)
+        return page.extract_text() or ""
+
+    status = status if status is not None else {}
+    status["stopped_by"] = None
+    pages = PdfReader(io.BytesIO(data)).pages
+    total = len(pages)
+    stop = total if stop is None else min(stop, total)
+    if limits.max_pages is not None and limits.max_pages < stop:
+        stop = limits.max_pages
+        status["stopped_by"] = "max_pages"
+    deadline = None if limits.time_budget is None else time.monotonic() + limits.time_budget
+    chars_left = limits.max_chars
+
+    for i in range(start, stop):
+        if deadline is not None and i > start and time.monotonic() >= deadline:
+            status["stopped_by"] = "time_budget"
+            return
+        text = extract(pages[i])
+        if chars_left is not None:
+            if len(text) >= chars_left:
+                status["stopped_by"] = "max_chars"
+                yield text[:chars_left]
+                return
+            chars_left -= len(text) + 1  # the "\n" joining it to the next page
+        yield text
+
+
+def page_texts(data: bytes, start: int = 0, stop: Optional[int] = None) -> List[str]:
+    """Raw text of pages[start:stop] (joined with "\n" and stripped, they make the document text)."""
+    return list(iter_pdf_pages(data, start=start, stop=stop))
+
+
+def _parse_pdf(
+    data: bytes, limits: ExtractLimits = UNLIMITED, status: Optional[Dict] = None, mode: str = "full"
+) -> str:
+    return "\n".join(iter_pdf_pages(data, limits, status=status, mode=mode)).strip()
+
+
+def cache_key(data: bytes, limits: ExtractLimits = UNLIMITED, mode: str = "full") -> str:
+    tag = "" if mode == "full" else f"|mode={mode}"
+    return f"{EXTRACTOR_VERSION}|{sha256_bytes(data)}{limits.cache_tag()}{tag}"
+
+
+def extract_text_from_pdf(
+    uploaded_file,
+    use_cache: bool = True,
+    limits: Optional[ExtractLimits] = None,
+    mode: Optional[str] = None,
+) -> str:
     """
     Extract text from a PDF uploaded through Streamlit.
+    Results are cached by SHA-256 of the file bytes (see src/pdf_cache.py),
+    so re-uploads and reruns skip parsing. `limits` defaults to
+    ExtractLimits.from_env() and `mode` to $TALENTRANK_PDF_MODE; text cut off
+    by the time budget is not cached.
     """
-    reader = PdfReader(uploaded_file)
-    parts = []
-    for page in reader.pages:
-        parts.append(page.extract_text() or "")
-    return "\n".join(parts).strip()
+    limits = ExtractLimits.from_env() if limits is None else limits
+    mode = mode or default_mode()
+    with stage("pdf_extract"):
+        data = read_pdf_bytes(uploaded_file)
+        cache = get_pdf_cache() if use_cache else None
+        if cache is None:
+            return _parse_pdf(data, limits, mode=mode)
+
+        key = cache_key(data, limits, mode)
+        text = cache.get(key)
+        if text is None:
+            status: Dict = {}
+            text = _parse_pdf(data, limits, status, mode)
+            if status["stopped_by"] != "time_budget":
+                cache.put(key, text)
+        return text
@@ -0,0 +1,117 @@
+"""
+Opt-in CPU and memory profiling of a screening run.
+
+    with profile_run() as prof:
+        ... scoring ...
+    prof.report.pstats_bytes     # load with pstats / snakeviz
+    prof.report.allocations      # top allocation sites (tracemalloc)
+    prof.report.peak_bytes
+
+Enabled from the app's sidebar toggle or with TALENTRANK_PROFILE=1.
+cProfile covers the calling thread (the Streamlit script thread, which is
+where scoring runs); tracemalloc covers Python allocations of all threads.
+Both are process-wide, so only one capture runs at a time: while another
+session is profiling, profile_run() runs the block unprofiled and sets
+.busy on the yielded object (its .report stays None).
+"""
+
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+
+def profiling_requested() -> bool:
+    return os.environ.get("TALENTRANK_PROFILE", "0").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class ProfileReport:
+    wall_seconds: float
+    peak_bytes: int
+    pstats_bytes: bytes  # same format as cProfile's dump_stats
+    top_functions: str  # pstats text, sorted by cumulative time
+    allocations: List[Dict] = field(default_factory=list)
+
+    def summary(self) -> Dict:
+        return {
+            "wall_seconds": round(self.wall_seconds, 3),
+            "peak_traced_mb": round(self.peak_bytes / 2**20, 2),
+            "top_allocations": self.allocations,
+        }
+
+
+class _Capture:
+    report: Optional[ProfileReport] = None
+    busy: bool = False  # another capture was running; this block was not profiled
+
+
+_LOCK = threading.Lock()
+
+
+def _top_allocations(snapshot: "tracemalloc.Snapshot", limit: int) -> List[Dict]:
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ])
+    rows = []
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        rows.append({
+            "site": f"{frame.filename}:{frame.lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "blocks": stat.count,
+        })
+    return rows
+
+
+@contextmanager
+def profile_run(top_n: int = 30, frames: int = 1) -> Iterator[_Capture]:
+    """Profile the block; the result is on the yielded object's .report afterwards."""
+    capture = _Capture()
+    if not _LOCK.acquire(blocking=False):
+        capture.busy = True
+        yield capture
+        return
+    try:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(frames)
+        tracemalloc.reset_peak()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield capture
+        finally:
+            profiler.disable()
+            wall = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:  # leave tracing on if someone else started it
+                tracemalloc.stop()
+            capture.report = _build_report(profiler, wall, peak, snapshot, top_n)
+    finally:
+        _LOCK.release()
+
+
+def _build_report(profiler: cProfile.Profile, wall: float, peak: int, snapshot, top_n: int) -> ProfileReport:
+    profiler.create_stats()
+    raw = marshal.dumps(profiler.stats)  # before pstats.Stats(), which re-snapshots and empties it
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(top_n)
+    return ProfileReport(
+        wall_seconds=wall,
+        peak_bytes=peak,
+        pstats_bytes=raw,
+        top_functions=text.getvalue(),
+        allocations=_top_allocations(snapshot, top_n),
+    )
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from src.scoring import tfidf_match_score
-from src.semantic_scoring import sbert_match_score
-from src.skills import extract_skills, missing_skills
+import numpy as np
+
+from src.scoring import tfidf_match_score, tfidf_match_scores
+from src.semantic_scoring import encode_texts, sbert_match_score, sbert_match_scores
+from src.skill_matrix import SkillMatrix
+from src.skills import extract_skills, index_skills, missing_skills
 from src.robustness import keyword_stuffing_penalty, length_normalization
+from src.timing import candidate, stage
+
+
+SHORTLIST_THRESHOLD = 0.75
+REVIEW_THRESHOLD = 0.55
 
 
 @dataclass
@@ -18,8 +26,45 @@ class CandidateResult:
     skill_overlap: float
     resume_skills: List[str]
     jd_skills: List[str]
-    missing: List[str]
+    missing: Optional[List[str]]  # None: built from skill_row on first use, see missing_skills()
     decision: str
+    sbert_skipped: bool = False  # cascade mode: SBERT not run, sbert left at 0.0
+    penalty: float = 1.0  # keyword stuffing factor applied to the weighted sum
+    length_factor: float = 1.0
+    skill_row: Optional[Tuple[SkillMatrix, int]] = field(default=None, repr=False, compare=False)
+
+    def missing_skills(self) -> List[str]:
+        """JD skills this candidate lacks; batch results build the list only when asked."""
+        if self.missing is None:
+            matrix, row = self.skill_row
+            self.missing = matrix.missing_for(row, self.jd_skills)
+        return self.missing
+
+
+@dataclass
+class JDProfile:
+    """Everything about the JD that scoring needs, computed once per batch."""
+    text: str
+    skills: List[str]
+    embedding: Optional[np.ndarray] = None  # filled on first SBERT use
+
+
+def build_jd_profile(jd_text: str) -> JDProfile:
+    return JDProfile(text=jd_text or "", skills=extract_skills(jd_text))
+
+
+def _jd_embedding(profile: JDProfile) -> Optional[np.ndarray]:
+    if profile.embedding is None and profile.text.strip():
+        profile.embedding = encode_texts([profile.text.strip()], batch_size=1)[0]
+    return profile.embedding
+
+
+def _decision(overall: float) -> str:
+    if overall >= SHORTLIST_THRESHOLD:
+        return "SHORTLIST"
+    if overall >= REVIEW_THRESHOLD:
+        return "REVIEW"
+    return "REJECT"
 
 
 def _skill_overlap_ratio(resume_sk: List[str], jd_sk: List[str]) -> float:
@@ -34,34 +79,40 @@ def score_resume_against_jd(
     jd_text: str,
     filename: str,
     weights: Tuple[float, float, float],
+    tfidf_score: Optional[float] = None,
+    sbert_score: Optional[float] = None,
 ) -> CandidateResult:
     """
     weights = (w_tfidf, w_sbert, w_skill_overlap)
     All scores are 0..1.
+    tfidf_score / sbert_score: precomputed component scores
+    (e.g. from tfidf_match_scores / sbert_match_scores for a batch).
     """
-    tfidf = tfidf_match_score(resume_text, jd_text)
-    sbert = sbert_match_score(resume_text, jd_text)
+    with candidate(filename):
+        with stage("tfidf"):
+            tfidf = tfidf_match_score(resume_text, jd_text) if tfidf_score is None else tfidf_score
+        with stage("sbert"):
+            sbert = sbert_match_score(resume_text, jd_text) if sbert_score is None else sbert_score
 
-    resume_sk = extract_skills(resume_text)
-    jd_sk = extract_skills(jd_text)
-    overlap = _skill_overlap_ratio(resume_sk, jd_sk)
-    miss = missing_skills(jd_sk, resume_sk)
+        # one scan of the resume feeds both skill extraction and the stuffing penalty
+        with stage("skills"):
+            resume_index = index_skills(resume_text)
+            resume_sk = resume_index.skills()
+            jd_sk = extract_skills(jd_text)
+            overlap = _skill_overlap_ratio(resume_sk, jd_sk)
+            miss = missing_skills(jd_sk, resume_sk)
 
-    w_t, w_s, w_o = weights
-    base_score = (w_t * tfidf) + (w_s * sbert) + (w_o * overlap)
+        w_t, w_s, w_o = weights
+        base_score = (w_t * tfidf) + (w_s * sbert) + (w_o * overlap)
 
-    # Apply robustness penalties
-    penalty = keyword_stuffing_penalty(resume_text, jd_sk)
-    length_factor = length_normalization(resume_text)
-    overall = base_score * penalty * length_factor
+        # Apply robustness penalties
+        with stage("robustness"):
+            penalty = keyword_stuffing_penalty(resume_text, jd_sk, index=resume_index)
+            length_factor = length_normalization(resume_text)
+        overall = base_score * penalty * length_factor
 
     # ATS decision
-    if overall >= 0.75:
-        decision = "SHORTLIST"
-    elif overall >= 0.55:
-        decision = "REVIEW"
-    else:
-        decision = "REJECT"
+    decision = _decision(overall)
 
     return CandidateResult(
         filename=filename,
@@ -73,11 +124,171 @@ def score_resume_against_jd(
         jd_skills=jd_sk,
         missing=miss,
         decision=decision,
+        penalty=float(penalty),
+        length_factor=float(length_factor),
     )
 
 
+def score_resumes_against_jd(
+    resumes: Sequence[Tuple[str, str]],
+    jd_text: str,
+    weights: Tuple[float, float, float],
+    profile: Optional[JDProfile] = None,
+    cascade: bool = False,
+    top_k: Optional[int] = None,
+    tfidf_scores: Optional[Sequence[float]] = None,
+) -> List[CandidateResult]:
+    """
+    Batch version of score_resume_against_jd.
+    resumes = [(resume_text, filename), ...]; results keep the input order.
+
+    The JD profile (skills, embedding) is built once, TF-IDF and SBERT scores
+    come from one batch call each, skill overlap from a SkillMatrix, and the
+    weighted sum, penalties and decisions are computed as arrays.
+
+    cascade=True computes the cheap components first and only runs SBERT for
+    candidates that could still reach REVIEW or (with top_k) the top-K, using
+    SBERT <= 1 as the bound (see _cascade_sbert). Skipped candidates are
+    marked sbert_skipped and scored with sbert=0.0; their decision (REJECT)
+    and the top-K are the same as with the full computation.
+
+    tfidf_scores: precomputed TF-IDF scores (e.g. pairwise tfidf_match_score
+    when resumes are scored in chunks and pool-fitted IDF would vary).
+    """
+    texts = [t for t, _ in resumes]
+    names = [n for _, n in resumes]
+    if not texts:
+        return []
+    with stage("jd_profile"):
+        profile = profile or build_jd_profile(jd_text)
+    jd_sk = profile.skills
+
+    with stage("tfidf_batch"):
+        if tfidf_scores is None:
+            tfidf = np.array(tfidf_match_scores(texts, jd_text), dtype=np.float64)
+        else:
+            tfidf = np.asarray(tfidf_scores, dtype=np.float64)
+
+    # one scan per resume feeds skill extraction and the stuffing penalty
+    indexes = []
+    penalty = np.ones(len(texts))
+    length_factor = np.ones(len(texts))
+    for i, t in enumerate(texts):
+        with candidate(names[i]):
+            with stage("skills"):
+                indexes.append(index_skills(t))
+            with stage("robustness"):
+                penalty[i] = keyword_stuffing_penalty(t, jd_sk, index=indexes[i])
+                length_factor[i] = length_normalization(t)
+    resume_sks = [ix.skills() for ix in indexes]
+    with stage("skill_overlap_batch"):
+        matrix = SkillMatrix(resume_sks)
+        overlap = matrix.overlap_ratios(jd_sk)
+
+    with stage("sbert_batch"):
+        if cascade:
+            sbert, skipped = _cascade_sbert(
+                texts, jd_text, profile, weights, tfidf, overlap, penalty, length_factor, top_k
+            )
+        else:
+            skipped = np.zeros(len(texts), dtype=bool)
+            sbert = np.array(
+                sbert_match_scores(texts, jd_text, jd_embedding=_jd_embedding(profile)), dtype=np.float64
+            )
+
+    overall = weighted_overall(weights, tfidf, sbert, overlap, penalty, length_factor)
+    decisions = decisions_for(overall)
+
+    return [
+        CandidateResult(
+            filename=names[i],
+            overall=float(overall[i]),
+            tfidf=float(tfidf[i]),
+            sbert=float(sbert[i]),
+            skill_overlap=float(overlap[i]),
+            resume_skills=resume_sks[i],
+            jd_skills=jd_sk,
+            missing=None,
+            decision=str(decisions[i]),
+            sbert_skipped=bool(skipped[i]),
+            penalty=float(penalty[i]),
+            length_factor=float(length_factor[i]),
+            skill_row=(matrix, i),
+        )
+        for i in range(len(texts))
+    ]
+
+
+def weighted_overall(weights, tfidf, sbert, overlap, penalty, length_factor):
+    """
+    Overall scores for arrays of components (scalars broadcast); same formula
+    and float operation order as score_resume_against_jd.
+    """
+    w_t, w_s, w_o = weights
+    return ((w_t * tfidf) + (w_s * sbert) + (w_o * overlap)) * penalty * length_factor
+
+
+def decisions_for(overall: np.ndarray) -> np.ndarray:
+    """SHORTLIST / REVIEW / REJECT for an array of overall scores (vectorised _decision)."""
+    return np.where(
+        overall >= SHORTLIST_THRESHOLD, "SHORTLIST",
+        np.where(overall >= REVIEW_THRESHOLD, "REVIEW", "REJECT"),
+    )
+
+
+def _cascade_sbert(
+    texts: List[str],
+    jd_text: str,
+    profile: JDProfile,
+    weights: Tuple[float, float, float],
+    tfidf: np.ndarray,
+    overlap: np.ndarray,
+    penalty: np.ndarray,
+    length_factor: np.ndarray,
+    top_k: Optional[int],
+    chunk: int = 32,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    SBERT scores for the candidates that can still matter, plus the mask of
+    who was pruned without encoding. A candidate's best possible overall uses
+    sbert = 1 (cosine bound). Everyone whose bound reaches REVIEW is encoded;
+    with top_k, the rest are encoded in descending-bound chunks until no bound
+    can beat the K-th best exact overall found so far. With a zero SBERT
+    weight nobody is encoded or pruned: sbert = 0.0 is the exact contribution.
+    """
+    n = len(texts)
+    best = 1.0 if weights[1] >= 0 else -1.0
+    upper = weighted_overall(weights, tfidf, best, overlap, penalty, length_factor)
+    sbert = np.zeros(n, dtype=np.float64)
+    done = np.zeros(n, dtype=bool)
+    if weights[1] == 0:
+        return sbert, done  # SBERT can't change any score, so nothing counts as skipped
+
+    def encode(idx: np.ndarray) -> None:
+        if idx.size:
+            sbert[idx] = sbert_match_scores(
+                [texts[i] for i in idx], jd_text, jd_embedding=_jd_embedding(profile)
+            )
+            done[idx] = True
+
+    encode(np.flatnonzero(upper >= REVIEW_THRESHOLD))
+
+    if top_k is not None and top_k > 0:
+        pending = [i for i in np.argsort(-upper, kind="stable") if not done[i]]
+        while pending:
+            exact = weighted_overall(weights, tfidf, sbert, overlap, penalty, length_factor)[done]
+            kth = np.partition(exact, -top_k)[-top_k] if exact.size >= top_k else -np.inf
+            batch = [i for i in pending[:chunk] if upper[i] >= kth]
+            if not batch:
+                break  # pending is sorted by bound, nobody later can beat kth either
+            encode(np.array(batch))
+            pending = pending[len(batch):]
+    return sbert, ~done
+
+
 def to_row_dict(r: CandidateResult) -> Dict:
-    d = asdict(r)
+    # not asdict(): that would deep-copy the shared SkillMatrix behind skill_row
+    d = {f.name: getattr(r, f.name) for f in fields(r)}
     # keep table clean
     d["overall_%"] = round(d.pop("overall") * 100, 2)
     d["tfidf_%"] = round(d.pop("tfidf") * 100, 2)
@@ -85,9 +296,14 @@ def to_row_dict(r: CandidateResult) -> Dict:
     d["skill_overlap_%"] = round(d.pop("skill_overlap") * 100, 2)
 
     # shorten long lists for table view
-    d["missing_skills_preview"] = ", ".join(r.missing[:10]) + (" ..." if len(r.missing) > 10 else "")
+    missing = r.missing_skills()
+    d["missing_skills_preview"] = ", ".join(missing[:10]) + (" ..." if len(missing) > 10 else "")
     d.pop("resume_skills")
     d.pop("jd_skills")
     d.pop("missing")
+    d.pop("sbert_skipped")
+    d.pop("penalty")
+    d.pop("length_factor")
+    d.pop("skill_row")
     # Keep decision in output
     return d
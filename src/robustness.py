@@ -1,20 +1,32 @@
 import re
-from typing import List
+from typing import List, Optional
 
+from src.skills import SkillIndex, get_matcher, index_skills
 
-def keyword_stuffing_penalty(text: str, jd_skills: List[str]) -> float:
+
+def keyword_stuffing_penalty(text: str, jd_skills: List[str], index: Optional[SkillIndex] = None) -> float:
     """
     Penalize excessive repetition of JD skills.
     Returns a penalty factor between 0.85 and 1.0
+    Occurrence counts come from the resume's SkillIndex (pass the one built
+    during skill extraction to avoid rescanning the text).
     """
-    text = (text or "").lower()
     if not jd_skills:
         return 1.0
 
+    matcher = get_matcher()
     counts = []
     for skill in jd_skills:
-        if skill.strip():
-            counts.append(len(re.findall(rf"\b{re.escape(skill)}\b", text)))
+        if not skill.strip():
+            continue
+        canonical = matcher.canonical(skill)
+        if canonical is None:
+            # not in the taxonomy -> count it directly
+            counts.append(len(re.findall(rf"\b{re.escape(skill)}\b", (text or "").lower())))
+            continue
+        if index is None:
+            index = index_skills(text)
+        counts.append(index.count(canonical))
 
     if not counts:
         return 1.0
@@ -0,0 +1,66 @@
+"""
+Columnar store of per-candidate component scores.
+
+overall is a weighted sum of tfidf / sbert / skill overlap times the
+stuffing penalty and length factor, so once those columns are kept the
+ranking for any weights is a few array ops and an argsort; no PDF parsing,
+TF-IDF or SBERT is needed to re-rank.
+"""
+
+from dataclasses import dataclass, replace
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from src.ranking import CandidateResult, decisions_for, weighted_overall
+
+
+@dataclass
+class ScoreTable:
+    results: List[CandidateResult]  # input order, component scores as computed
+    tfidf: np.ndarray
+    sbert: np.ndarray
+    skill_overlap: np.ndarray
+    penalty: np.ndarray
+    length_factor: np.ndarray
+
+    @classmethod
+    def from_results(cls, results: Sequence[CandidateResult]) -> "ScoreTable":
+        def col(name: str) -> np.ndarray:
+            return np.array([getattr(r, name) for r in results], dtype=np.float64)
+
+        return cls(
+            results=list(results),
+            tfidf=col("tfidf"),
+            sbert=col("sbert"),
+            skill_overlap=col("skill_overlap"),
+            penalty=col("penalty"),
+            length_factor=col("length_factor"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def sbert_skipped(self) -> int:
+        """Rows scored by the cascade without SBERT (their sbert is 0.0)."""
+        return sum(r.sbert_skipped for r in self.results)
+
+    def overall(self, weights: Tuple[float, float, float]) -> np.ndarray:
+        return weighted_overall(
+            weights, self.tfidf, self.sbert, self.skill_overlap, self.penalty, self.length_factor
+        )
+
+    def order(self, weights: Tuple[float, float, float]) -> np.ndarray:
+        """Row indices best-first; ties keep input order like sorted(..., reverse=True)."""
+        return np.argsort(-self.overall(weights), kind="stable")
+
+    def reweight(self, weights: Tuple[float, float, float]) -> List[CandidateResult]:
+        """Results re-scored with `weights`, sorted by overall (descending)."""
+        overall = self.overall(weights)
+        decisions = decisions_for(overall)
+        order = np.argsort(-overall, kind="stable")
+        return [
+            replace(self.results[i], overall=float(overall[i]), decision=str(decisions[i]))
+            for i in order
+        ]
@@ -1,5 +1,7 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import List, Optional, Sequence
+
+# scikit-learn is imported inside the functions so importing this module
+# (and src.ranking) stays cheap until the first score is computed.
 
 
 def tfidf_match_score(resume_text: str, jd_text: str) -> float:
@@ -13,7 +15,58 @@ def tfidf_match_score(resume_text: str, jd_text: str) -> float:
     if not resume_text or not jd_text:
         return 0.0
 
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
     vectorizer = TfidfVectorizer(stop_words="english")
     vectors = vectorizer.fit_transform([resume_text, jd_text])
     score = cosine_similarity(vectors[0], vectors[1])[0][0]
     return float(score)
+
+
+def tfidf_match_scores(
+    resume_texts: Sequence[str],
+    jd_text: str,
+    reference_corpus: Optional[Sequence[str]] = None,
+) -> List[float]:
+    """
+    Batch TF-IDF similarity of many resumes against one job description.
+
+    The vectorizer is fitted once (on the whole batch plus the JD, or on
+    `reference_corpus` when given), every document is transformed into one
+    sparse matrix and all cosine scores come from a single sparse
+    matrix-vector product. Returns one float (0..1) per resume, in order.
+    """
+    resume_texts = [(t or "").strip() for t in resume_texts]
+    jd_text = (jd_text or "").strip()
+
+    scores = [0.0] * len(resume_texts)
+    if not jd_text:
+        return scores
+
+    idx = [i for i, t in enumerate(resume_texts) if t]
+    if not idx:
+        return scores
+
+    docs = [resume_texts[i] for i in idx]
+    if reference_corpus is None:
+        fit_docs = docs + [jd_text]
+    else:
+        fit_docs = [t for t in reference_corpus if (t or "").strip()]
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(stop_words="english")
+    try:
+        vectorizer.fit(fit_docs)
+    except ValueError:
+        # empty vocabulary (e.g. only stop words) -> nothing to match on
+        return scores
+
+    # TfidfVectorizer L2-normalises rows, so cosine == dot product
+    vectors = vectorizer.transform(docs + [jd_text])
+    sims = (vectors[:-1] @ vectors[-1].T).toarray().ravel()
+
+    for i, s in zip(idx, sims):
+        scores[i] = float(s)
+    return scores
@@ -1,16 +1,20 @@
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import List, Optional, Sequence
 
+import numpy as np
 
-# Cache model in memory (loads once)
-_MODEL = None
+from src.embedding_cache import get_embedding_cache
+from src.encoders import encoder_backend, encoder_id
+from src.model_registry import REGISTRY
+
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+DEFAULT_BATCH_SIZE = 32
 
 
 def _get_model():
-    global _MODEL
-    if _MODEL is None:
-        _MODEL = SentenceTransformer("all-MiniLM-L6-v2")
-    return _MODEL
+    # loaded once per process (thread-safe), shared by all sessions
+    return REGISTRY.get(MODEL_NAME)
 
 
 def sbert_match_score(resume_text: str, jd_text: str) -> float:
@@ -23,7 +27,77 @@ def sbert_match_score(resume_text: str, jd_text: str) -> float:
     if not resume_text or not jd_text:
         return 0.0
 
+    emb = encode_texts([resume_text, jd_text], batch_size=2)
+    return float(emb[0] @ emb[1])
+
+
+def _encode_uncached(texts: List[str], batch_size: int) -> np.ndarray:
     model = _get_model()
-    emb = model.encode([resume_text, jd_text], normalize_embeddings=True)
-    score = cosine_similarity([emb[0]], [emb[1]])[0][0]
-    return float(score)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+    out = np.empty((len(texts), model.get_sentence_embedding_dimension()), dtype=np.float32)
+    for start in range(0, len(order), batch_size):
+        chunk = order[start:start + batch_size]
+        out[chunk] = model.encode(
+            [texts[i] for i in chunk],
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+    return out
+
+
+def encode_texts(texts: Sequence[str], batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+    """
+    Encode texts into L2-normalised float32 embeddings, `batch_size` texts at a time.
+    Cached embeddings are reused; only misses reach the model, sorted by
+    length so each batch pads to a similar length. Rows keep the input order.
+    """
+    texts = list(texts)
+    cache = get_embedding_cache()
+    if cache is None:
+        if not texts:
+            return np.zeros((0, _get_model().get_sentence_embedding_dimension()), dtype=np.float32)
+        return _encode_uncached(texts, batch_size)
+
+    model_id = encoder_id(MODEL_NAME, encoder_backend())
+    rows = [cache.get(t, model_id, True) for t in texts]
+    missing = [i for i, r in enumerate(rows) if r is None]
+    if missing:
+        fresh = _encode_uncached([texts[i] for i in missing], batch_size)
+        for i, emb in zip(missing, fresh):
+            cache.put(texts[i], model_id, True, emb)
+            rows[i] = emb
+
+    if not rows:
+        return np.zeros((0, _get_model().get_sentence_embedding_dimension()), dtype=np.float32)
+    return np.vstack(rows).astype(np.float32, copy=False)
+
+
+def sbert_match_scores(
+    resume_texts: Sequence[str],
+    jd_text: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    jd_embedding: Optional[np.ndarray] = None,
+) -> List[float]:
+    """
+    Batch semantic similarity of many resumes against one job description.
+    The JD is encoded once (or `jd_embedding` is reused), resumes are encoded
+    in length-sorted batches and all similarities come from one
+    matrix-vector product.
+    Returns one float per resume, in order.
+    """
+    resume_texts = [(t or "").strip() for t in resume_texts]
+    jd_text = (jd_text or "").strip()
+
+    scores = [0.0] * len(resume_texts)
+    idx = [i for i, t in enumerate(resume_texts) if t]
+    if not jd_text or not idx:
+        return scores
+
+    jd_emb = encode_texts([jd_text], batch_size=1)[0] if jd_embedding is None else jd_embedding
+    resume_emb = encode_texts([resume_texts[i] for i in idx], batch_size=batch_size)
+    sims = resume_emb @ jd_emb
+
+    for i, s in zip(idx, sims):
+        scores[i] = float(s)
+    return scores
@@ -0,0 +1,107 @@
+"""
+Bit-matrix representation of candidate skill sets.
+
+Each candidate is one row of packed bits over a skill vocabulary
+(candidates x ceil(skills / 8) uint8), so overlap ratios (against one or
+many JDs) are computed for the whole pool with NumPy bitwise ops. Missing-
+skill lists are built per row, only for candidates that are displayed or
+exported; only the JD's columns are ever unpacked.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.skills_db import SKILLS
+
+
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount_rows(packed: np.ndarray) -> np.ndarray:
+    """Number of set bits per row (last axis) of a packed uint8 array."""
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        bits = np.bitwise_count(packed)
+    else:
+        bits = _POPCOUNT_TABLE[packed]
+    return bits.sum(axis=-1, dtype=np.int64)
+
+
+class SkillMatrix:
+    """
+    Packed candidates x skills membership matrix.
+
+    vocabulary: column order (defaults to the taxonomy's SKILLS); skills not
+    in it are appended as new columns when the matrix is built.
+    """
+
+    def __init__(self, skill_lists: Sequence[Sequence[str]], vocabulary: Optional[Sequence[str]] = None):
+        self.vocabulary: List[str] = list(vocabulary if vocabulary is not None else SKILLS)
+        self.column: Dict[str, int] = {s: i for i, s in enumerate(self.vocabulary)}
+
+        rows, cols = [], []
+        for r, skills in enumerate(skill_lists):
+            for s in skills:
+                c = self.column.get(s)
+                if c is None:
+                    c = self.column[s] = len(self.vocabulary)
+                    self.vocabulary.append(s)
+                rows.append(r)
+                cols.append(c)
+
+        self.n_rows = len(skill_lists)
+        self.n_bytes = (len(self.vocabulary) + 7) // 8
+        self.bits = np.zeros((self.n_rows, self.n_bytes), dtype=np.uint8)
+        if rows:
+            cols_arr = np.asarray(cols, dtype=np.int64)
+            np.bitwise_or.at(
+                self.bits,
+                (np.asarray(rows, dtype=np.int64), cols_arr >> 3),
+                (0x80 >> (cols_arr & 7)).astype(np.uint8),
+            )
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def mask(self, skills: Sequence[str]) -> np.ndarray:
+        """Packed bit mask of `skills` (skills outside the vocabulary are ignored)."""
+        cols = np.array(sorted({self.column[s] for s in skills if s in self.column}), dtype=np.int64)
+        m = np.zeros(self.n_bytes, dtype=np.uint8)
+        if cols.size:
+            np.bitwise_or.at(m, cols >> 3, (0x80 >> (cols & 7)).astype(np.uint8))
+        return m
+
+    def overlap_ratios(self, jd_skills: Sequence[str]) -> np.ndarray:
+        """
+        |resume skills & JD skills| / |JD skills| for every row, like
+        ranking._skill_overlap_ratio. JD skills outside the vocabulary count
+        in the denominator (no candidate can have them).
+        """
+        jd_set = set(jd_skills)
+        if not jd_set:
+            return np.zeros(self.n_rows, dtype=np.float64)
+        hits = _popcount_rows(self.bits & self.mask(jd_set))
+        return hits / len(jd_set)
+
+    def overlap_matrix(self, jd_skill_lists: Sequence[Sequence[str]]) -> np.ndarray:
+        """Overlap ratios for many JDs at once: array of shape (n_jds, n_rows)."""
+        out = np.zeros((len(jd_skill_lists), self.n_rows), dtype=np.float64)
+        for j, jd_skills in enumerate(jd_skill_lists):
+            # one JD at a time keeps the temporary at (n_rows, n_bytes)
+            out[j] = self.overlap_ratios(jd_skills)
+        return out
+
+    def missing_for(self, row: int, jd_skills: Sequence[str]) -> List[str]:
+        """Sorted JD skills that `row` lacks, like skills.missing_skills for that candidate."""
+        jd_set = set(jd_skills)
+        cols = np.array(sorted(self.column[s] for s in jd_set if s in self.column), dtype=np.int64)
+        # only the JD's columns of this one row are unpacked
+        has = (self.bits[row, cols >> 3] & (0x80 >> (cols & 7)).astype(np.uint8)) != 0
+        return sorted(jd_set - {self.vocabulary[c] for c in cols[has]})
+
+    def _names(self, packed_row: np.ndarray) -> List[str]:
+        cols = np.flatnonzero(np.unpackbits(packed_row)[:len(self.vocabulary)])
+        return [self.vocabulary[c] for c in cols]
+
+    def skills(self, row: int) -> List[str]:
+        return sorted(self._names(self.bits[row]))
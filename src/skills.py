@@ -1,7 +1,13 @@
+import json
+import os
 import re
-from typing import List, Set
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
-from src.skills_db import SKILLS
+from src.cache_store import default_cache_dir, sha256_text
+from src.skills_db import ALIASES, SKILLS
 
 
 def _normalize(text: str) -> str:
@@ -10,24 +16,202 @@ def _normalize(text: str) -> str:
     return text
 
 
-def extract_skills(text: str) -> List[str]:
+def _is_word(ch: str) -> bool:
+    # same definition of a word character as re's \w for str patterns
+    return ch.isalnum() or ch == "_"
+
+
+def _trie_pattern(terms: Sequence[str]) -> str:
     """
-    Simple dictionary-based skill extraction.
-    Finds skills from SKILLS that appear in the text.
+    Regex equivalent to an alternation of `terms`, factored as a trie so the
+    engine walks shared prefixes once. At any position it matches the
+    longest term starting there.
     """
-    t = _normalize(text)
-    found: Set[str] = set()
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        children = sorted(ch for ch in node if ch)
+        if not children:
+            return ""
+        alts = [re.escape(ch) + build(node[ch]) for ch in children]
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+def _cached_trie_pattern(terms: Sequence[str], cache_dir: Optional[Path]) -> str:
+    """
+    _trie_pattern(terms), reused from a JSON file under `cache_dir` keyed by
+    the terms. Building the pattern is about half of a large taxonomy's
+    startup; re.compile of it still runs in every process. Plain JSON rather
+    than pickle, so the file is never executed.
+    """
+    if cache_dir is None:
+        return _trie_pattern(terms)
+    path = Path(cache_dir) / f"trie-{sha256_text(json.dumps(list(terms)))[:24]}.json"
+    try:
+        with open(path, encoding="utf-8") as fh:
+            pattern = json.load(fh)["pattern"]
+        if isinstance(pattern, str):
+            return pattern
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    pattern = _trie_pattern(terms)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"pattern": pattern}, fh)
+        os.replace(tmp, path)  # concurrent processes never see a partial file
+    except OSError:
+        pass  # read-only location: just don't cache
+    return pattern
+
+
+class SkillMatcher:
+    """
+    Single-pass skill matcher over normalised text.
+
+    All terms (canonical skills and their aliases) are compiled into one
+    trie-shaped regex wrapped in a lookahead, so one scan visits every
+    position and reports the longest term starting there; shorter terms that
+    are prefixes of it are expanded from a precomputed table. Matching rules
+    are the same as the original per-skill loop: single words need a word
+    boundary on both sides, multi-word phrases are plain substring matches.
+    Matches are reported under their canonical skill name.
+
+    pattern_cache: directory to reuse the trie pattern from (see
+    _cached_trie_pattern); None builds it every time.
+    """
+
+    def __init__(
+        self,
+        skills: Sequence[str],
+        aliases: Optional[Dict[str, str]] = None,
+        pattern_cache: Optional[Path] = None,
+    ):
+        self.skills = sorted({s for s in skills if s})
+        self._canonical = {s: s for s in self.skills}
+        for alias, canonical in (aliases or {}).items():
+            if alias and canonical and alias not in self._canonical:
+                self._canonical[alias] = canonical
+                if canonical not in self.skills:
+                    self.skills.append(canonical)
+        self.skills.sort()
+
+        terms = sorted(self._canonical)
+        self._multi = {t: " " in t for t in terms}
+        # every term that is a prefix of `t` (including t itself), longest first
+        self._prefixes: Dict[str, List[str]] = {
+            t: [t[:i] for i in range(len(t), 0, -1) if t[:i] in self._canonical]
+            for t in terms
+        }
+        self._regex = re.compile("(?=(" + _cached_trie_pattern(terms, pattern_cache) + "))") if terms else None
+
+    def finditer(self, t: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (canonical skill, start, end) for every occurrence in normalised text `t`."""
+        if self._regex is None:
+            return
+        n = len(t)
+        for m in self._regex.finditer(t):
+            start = m.start()
+            left_word = start > 0 and _is_word(t[start - 1])
+            for term in self._prefixes[m.group(1)]:
+                end = start + len(term)
+                if not self._multi[term]:
+                    # \b on both sides
+                    if left_word == _is_word(term[0]):
+                        continue
+                    if _is_word(term[-1]) == (end < n and _is_word(t[end])):
+                        continue
+                yield self._canonical[term], start, end
+
+    def find(self, t: str) -> Set[str]:
+        return {skill for skill, _, _ in self.finditer(t)}
 
-    for skill in SKILLS:
-        # word-boundary match for single words; phrase match for multi-words
-        if " " in skill:
-            if skill in t:
-                found.add(skill)
-        else:
-            if re.search(rf"\b{re.escape(skill)}\b", t):
-                found.add(skill)
+    def canonical(self, term: str) -> Optional[str]:
+        """Canonical name for a skill or alias, None if it isn't in the taxonomy."""
+        return self._canonical.get(term)
 
-    return sorted(found)
+
+@lru_cache(maxsize=1)
+def get_matcher() -> SkillMatcher:
+    """Matcher for the configured taxonomy (built once per process, trie pattern cached on disk)."""
+    return SkillMatcher(SKILLS, ALIASES, pattern_cache=default_cache_dir() / "skills")
+
+
+def _normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """
+    Same result as _normalize, plus offsets[i] = index in `text` of normalised
+    character i (with a final entry == len(text)).
+    """
+    text = text or ""
+    parts: List[str] = []
+    offsets: List[int] = []
+    for m in re.finditer(r"\s+|\S+", text):
+        piece = m.group(0)
+        if piece[0].isspace():
+            parts.append(" ")
+            offsets.append(m.start())
+            continue
+        low = piece.lower()
+        parts.append(low)
+        if len(low) == len(piece):
+            offsets.extend(range(m.start(), m.end()))
+        else:  # lower() changed the length (rare unicode): map to the token start
+            offsets.extend([m.start()] * len(low))
+    offsets.append(len(text))
+    return "".join(parts), offsets
+
+
+@dataclass
+class SkillIndex:
+    """
+    Skill occurrences in one document, from a single matcher scan.
+    `spans` maps canonical skill -> (start, end) in the normalised text;
+    original_spans() maps them back onto the raw text for highlighting.
+    """
+    text: str
+    spans: Dict[str, List[Tuple[int, int]]]
+    _offsets: Optional[List[int]] = field(default=None, repr=False)
+
+    def skills(self) -> List[str]:
+        return sorted(self.spans)
+
+    def count(self, skill: str) -> int:
+        return len(self.spans.get(skill, ()))
+
+    def original_spans(self, skill: str) -> List[Tuple[int, int]]:
+        if self._offsets is None:
+            self._offsets = _normalize_with_offsets(self.text)[1]
+        off = self._offsets
+        return [(off[s], off[e - 1] + 1) for s, e in self.spans.get(skill, ())]
+
+
+def index_skills(text: str) -> SkillIndex:
+    """Scan `text` once and record every skill occurrence (see SkillIndex)."""
+    spans: Dict[str, List[Tuple[int, int]]] = {}
+    for skill, start, end in get_matcher().finditer(_normalize(text)):
+        spans.setdefault(skill, []).append((start, end))
+    return SkillIndex(text=text or "", spans=spans)
+
+
+def extract_skills(text: str) -> List[str]:
+    """
+    Simple dictionary-based skill extraction.
+    Finds skills from the taxonomy (or their aliases) that appear in the text,
+    in one pass (see SkillMatcher), and returns canonical names.
+    """
+    return sorted(get_matcher().find(_normalize(text)))
 
 
 def missing_skills(jd_skills: List[str], resume_skills: List[str]) -> List[str]:
@@ -1,5 +1,22 @@
+"""
+Skills taxonomy: canonical skill names plus aliases that map onto them.
+
+The built-in starter list is used unless TALENTRANK_SKILLS_FILE points to a
+taxonomy file, in one of two formats:
+
+    JSON  {"skills": ["kubernetes", ...], "aliases": {"k8s": "kubernetes", ...}}
+          or {"kubernetes": ["k8s", "kube"], "python": [], ...}
+    text  one skill per line: canonical[,alias,alias...]  (lines starting with # are comments)
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Tuple
+
+
 # A starter skills list. You can expand this anytime.
-SKILLS = sorted(set([
+BUILTIN_SKILLS = sorted(set([
     # Programming
     "python", "java", "javascript", "typescript", "c", "c++", "c#", "go", "rust", "sql",
 
@@ -23,3 +40,68 @@ SKILLS = sorted(set([
     # Extras
     "rest api", "unit testing", "pytest"
 ]))
+
+# alias -> canonical skill
+BUILTIN_ALIASES = {
+    "k8s": "kubernetes",
+    "sklearn": "scikit-learn",
+    "scikit learn": "scikit-learn",
+    "postgres": "postgresql",
+    "golang": "go",
+    "hugging face": "huggingface",
+    "restful api": "rest api",
+}
+
+
+def _clean(name: str) -> str:
+    return re.sub(r"\s+", " ", (name or "").strip().lower())
+
+
+def load_taxonomy(path: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Read a taxonomy file (see module docstring).
+    Returns (sorted canonical skills, {alias: canonical}); names are lower-cased.
+    """
+    skills = set()
+    aliases: Dict[str, str] = {}
+
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if "skills" in data and isinstance(data["skills"], list):
+            skills.update(_clean(s) for s in data["skills"])
+            for alias, canonical in data.get("aliases", {}).items():
+                aliases[_clean(alias)] = _clean(canonical)
+        else:
+            for canonical, alias_list in data.items():
+                skills.add(_clean(canonical))
+                for alias in alias_list or []:
+                    aliases[_clean(alias)] = _clean(canonical)
+    else:
+        with open(path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if line.lstrip().startswith("#"):
+                    continue
+                names = [_clean(n) for n in line.split(",")]
+                names = [n for n in names if n]
+                if not names:
+                    continue
+                skills.add(names[0])
+                for alias in names[1:]:
+                    aliases[alias] = names[0]
+
+    skills.discard("")
+    skills.update(aliases.values())
+    # a canonical name never doubles as an alias
+    aliases = {a: c for a, c in aliases.items() if a and a not in skills}
+    return sorted(skills), aliases
+
+
+def configured_taxonomy() -> Tuple[List[str], Dict[str, str]]:
+    path = os.environ.get("TALENTRANK_SKILLS_FILE")
+    if path:
+        return load_taxonomy(path)
+    return list(BUILTIN_SKILLS), dict(BUILTIN_ALIASES)
+
+
+SKILLS, ALIASES = configured_taxonomy()
@@ -0,0 +1,180 @@
+"""
+Lightweight per-stage timing.
+
+    with recording() as rec:            # activate a Recorder for this context
+        with candidate("cv.pdf"):       # optional: attribute stages to a candidate
+            with stage("pdf_extract"):
+                ...
+    rec.summary()                       # count / total / p50 / p95 / max per stage
+
+stage() is a no-op when no recorder is active, so the hooks can stay in the
+scoring code. The active recorder lives in a ContextVar, so concurrent
+Streamlit sessions (threads) don't mix their timings.
+
+PROCESS keeps cumulative totals across runs for the Prometheus text file;
+write_metrics() writes it (plus the last run as JSON) to TALENTRANK_METRICS_DIR.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+
+
+_RECORDER: ContextVar[Optional["Recorder"]] = ContextVar("talentrank_recorder", default=None)
+_CANDIDATE: ContextVar[Optional[str]] = ContextVar("talentrank_candidate", default=None)
+
+
+class Recorder:
+    """
+    Stage durations (seconds). Counts and totals are exact; percentiles use
+    the most recent `max_samples` durations per stage.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self._lock = threading.Lock()
+        self.max_samples = max_samples
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.samples: Dict[str, Deque[float]] = {}
+        self.candidates: Dict[str, Dict[str, float]] = {}
+
+    def add(self, name: str, seconds: float, who: Optional[str] = None) -> None:
+        with self._lock:
+            self.counts[name] += 1
+            self.totals[name] += seconds
+            self.samples.setdefault(name, deque(maxlen=self.max_samples)).append(seconds)
+            if who is not None:
+                per = self.candidates.setdefault(who, {})
+                per[name] = per.get(name, 0.0) + seconds
+
+    def merge(self, other: "Recorder") -> None:
+        """Add another recorder's stage timings (not its candidates)."""
+        with other._lock:
+            items = [(n, other.counts[n], other.totals[n], list(other.samples[n])) for n in other.counts]
+        with self._lock:
+            for name, count, total, samples in items:
+                self.counts[name] += count
+                self.totals[name] += total
+                self.samples.setdefault(name, deque(maxlen=self.max_samples)).extend(samples)
+
+    def summary(self) -> List[Dict]:
+        """One row per stage, in first-recorded order."""
+        with self._lock:
+            rows = []
+            for name, count in self.counts.items():
+                s = np.fromiter(self.samples[name], dtype=np.float64)
+                rows.append({
+                    "stage": name,
+                    "count": count,
+                    "total_s": round(self.totals[name], 6),
+                    "p50_ms": round(float(np.percentile(s, 50)) * 1000, 3),
+                    "p95_ms": round(float(np.percentile(s, 95)) * 1000, 3),
+                    "max_ms": round(float(s.max()) * 1000, 3),
+                })
+            return rows
+
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        """candidate -> {stage: seconds}."""
+        with self._lock:
+            return {who: dict(stages) for who, stages in self.candidates.items()}
+
+    def to_json(self) -> Dict:
+        return {"stages": self.summary(), "candidates": self.breakdown()}
+
+    def to_prometheus(self, prefix: str = "talentrank_stage") -> str:
+        """Prometheus text exposition format (summary + max gauge per stage)."""
+        lines = [
+            f"# HELP {prefix}_seconds Time spent per pipeline stage.",
+            f"# TYPE {prefix}_seconds summary",
+        ]
+        for row in self.summary():
+            label = f'stage="{row["stage"]}"'
+            lines.append(f'{prefix}_seconds{{{label},quantile="0.5"}} {row["p50_ms"] / 1000:.6f}')
+            lines.append(f'{prefix}_seconds{{{label},quantile="0.95"}} {row["p95_ms"] / 1000:.6f}')
+            lines.append(f"{prefix}_seconds_sum{{{label}}} {row['total_s']:.6f}")
+            lines.append(f"{prefix}_seconds_count{{{label}}} {row['count']}")
+        lines.append(f"# HELP {prefix}_seconds_max Slowest observed call per stage.")
+        lines.append(f"# TYPE {prefix}_seconds_max gauge")
+        for row in self.summary():
+            lines.append(f'{prefix}_seconds_max{{stage="{row["stage"]}"}} {row["max_ms"] / 1000:.6f}')
+        return "\n".join(lines) + "\n"
+
+
+# cumulative timings of every run in this process (for the Prometheus file)
+PROCESS = Recorder()
+
+
+@contextmanager
+def recording(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """Make `recorder` (or a new one) the active recorder for this context."""
+    rec = recorder or Recorder()
+    token = _RECORDER.set(rec)
+    try:
+        yield rec
+    finally:
+        _RECORDER.reset(token)
+
+
+@contextmanager
+def candidate(name: str) -> Iterator[None]:
+    """Attribute stages recorded inside the block to candidate `name`."""
+    token = _CANDIDATE.set(name)
+    try:
+        yield
+    finally:
+        _CANDIDATE.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the block as `name` on the active recorder (no-op without one)."""
+    rec = _RECORDER.get()
+    if rec is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rec.add(name, time.perf_counter() - start, _CANDIDATE.get())
+
+
+def record(name: str, seconds: float, who: Optional[str] = None) -> None:
+    """Add a duration measured elsewhere (e.g. in a worker process) to the active recorder."""
+    rec = _RECORDER.get()
+    if rec is not None:
+        rec.add(name, seconds, who if who is not None else _CANDIDATE.get())
+
+
+def write_metrics(run: Recorder, out_dir=None) -> Optional[Path]:
+    """
+    Merge `run` into PROCESS and write talentrank.prom (cumulative) and
+    talentrank_last_run.json to `out_dir` or $TALENTRANK_METRICS_DIR.
+    Returns the directory, or None when no directory is configured.
+    """
+    PROCESS.merge(run)
+    out_dir = out_dir or os.environ.get("TALENTRANK_METRICS_DIR")
+    if not out_dir:
+        return None
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    for name, body in (
+        ("talentrank.prom", PROCESS.to_prometheus()),
+        ("talentrank_last_run.json", json.dumps(run.to_json(), indent=2)),
+    ):
+        # unique per call: Streamlit sessions are threads of one process
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=out, prefix=f".{name}.", suffix=".tmp",
+                                         delete=False) as fh:
+            fh.write(body)
+        os.chmod(fh.name, 0o644)  # mkstemp creates 0600; the collector may run as another user
+        os.replace(fh.name, out / name)  # atomic for node_exporter's textfile collector
+    return out
@@ -0,0 +1,132 @@
+"""
+Grid search over ensemble weights on a labeled set.
+
+    python -m src.weight_search --dataset eval_dataset.json --step 0.01 --k 3 5
+
+Component scores are computed once (ScoreTable); every (w_tfidf, w_sbert,
+w_skill) triple on the simplex grid is then ranked in chunks, one argsort
+per weight row, and evaluated with the batched metrics in eval_metrics.
+Returns Precision@K / NDCG@K for the whole grid and the Pareto-best weights
+over those metrics.
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.eval_metrics import ndcg_at_k_batch, precision_at_k_batch
+from src.ranking import score_resumes_against_jd
+from src.score_table import ScoreTable
+
+
+def simplex_grid(step: float = 0.01) -> np.ndarray:
+    """All weight triples with components in multiples of `step` summing to 1, shape (n, 3)."""
+    n = int(round(1.0 / step))
+    rows = [(i, j, n - i - j) for i in range(n + 1) for j in range(n + 1 - i)]
+    return np.array(rows, dtype=np.float64) / n
+
+
+def score_dataset(jd_text: str, resumes: List[Dict]) -> ScoreTable:
+    """Component scores for labeled resumes ({"filename", "text", "label"} dicts)."""
+    results = score_resumes_against_jd(
+        [(r["text"], r["filename"]) for r in resumes], jd_text, (1 / 3, 1 / 3, 1 / 3)
+    )
+    return ScoreTable.from_results(results)
+
+
+def overall_matrix(table: ScoreTable, weights: np.ndarray) -> np.ndarray:
+    """(n_weights, n_candidates) overall scores; same formula as ranking.weighted_overall."""
+    w_t, w_s, w_o = (weights[:, c:c + 1] for c in range(3))
+    return ((w_t * table.tfidf) + (w_s * table.sbert) + (w_o * table.skill_overlap)) \
+        * table.penalty * table.length_factor
+
+
+def _batch_metrics(rel: np.ndarray, k_values: Sequence[int]) -> Dict[str, np.ndarray]:
+    """
+    Precision@K / NDCG@K for every row of a ranked relevance matrix, keyed by
+    the requested K (K larger than the pool is evaluated over the whole pool).
+    """
+    precision = precision_at_k_batch((rel >= 1).astype(np.int64), k_values)
+    ndcg = ndcg_at_k_batch(rel, k_values)
+    out = {}
+    for j, k in enumerate(k_values):
+        out[f"P@{k}"] = precision[:, j]
+        out[f"NDCG@{k}"] = ndcg[:, j]
+    return out
+
+
+def evaluate_grid(
+    table: ScoreTable,
+    labels: Sequence[int],
+    weights: np.ndarray,
+    k_values: Sequence[int] = (3, 5),
+    chunk: int = 4096,
+) -> pd.DataFrame:
+    """One row per weight triple: weights plus Precision@K / NDCG@K columns."""
+    labels = np.asarray(labels)
+    k_values = list(dict.fromkeys(k_values))
+    parts: List[Dict[str, np.ndarray]] = []
+    for start in range(0, len(weights), chunk):
+        overall = overall_matrix(table, weights[start:start + chunk])
+        order = np.argsort(-overall, axis=1, kind="stable")  # ties keep input order
+        parts.append(_batch_metrics(labels[order], k_values))
+
+    df = pd.DataFrame(weights, columns=["w_tfidf", "w_sbert", "w_skill"])
+    for col in parts[0] if parts else []:
+        df[col] = np.concatenate([p[col] for p in parts])
+    return df
+
+
+def pareto_front(df: pd.DataFrame, objectives: Sequence[str]) -> pd.DataFrame:
+    """
+    Rows not dominated on `objectives` (all maximised). Weight triples with
+    identical metrics are collapsed to the first one, with a `ties` count.
+    """
+    group = df.groupby(list(objectives), sort=False).ngroup()
+    unique = df[~group.duplicated()].copy()
+    unique["ties"] = group.map(group.value_counts()).loc[unique.index].to_numpy()
+
+    vals = unique[list(objectives)].to_numpy()
+    ge = (vals[:, None, :] >= vals[None, :, :]).all(axis=2)
+    gt = (vals[:, None, :] > vals[None, :, :]).any(axis=2)
+    dominated = (ge & gt).any(axis=0)  # column j is dominated by some row i
+    return unique[~dominated].sort_values(list(objectives), ascending=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grid search ensemble weights on a labeled dataset.")
+    parser.add_argument("--dataset", default="eval_dataset.json")
+    parser.add_argument("--step", type=float, default=0.01, help="grid spacing on the weight simplex")
+    parser.add_argument("--k", nargs="+", type=int, default=[3, 5])
+    parser.add_argument("--out", help="write the full grid to this CSV")
+    args = parser.parse_args(argv)
+
+    with open(args.dataset, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+
+    k_values = list(dict.fromkeys(args.k))
+    start = time.perf_counter()
+    table = score_dataset(data["jd_text"], data["resumes"])
+    scored = time.perf_counter()
+    weights = simplex_grid(args.step)
+    grid = evaluate_grid(table, [r["label"] for r in data["resumes"]], weights, k_values)
+    searched = time.perf_counter()
+
+    objectives = [f"{m}@{k}" for k in k_values for m in ("NDCG", "P")]
+    front = pareto_front(grid, objectives)
+
+    print(f"{len(table)} resumes scored in {scored - start:.2f}s; "
+          f"{len(weights)} weight triples evaluated in {searched - scored:.3f}s")
+    print("\nPareto-best weights:")
+    print(front.round(4).to_string(index=False))
+    if args.out:
+        grid.to_csv(args.out, index=False)
+        print(f"\nFull grid written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import zlib
+
+import pytest
+
+import src.ranking as ranking
+
+
+def _fake_sbert(texts, jd_text, jd_embedding=None, **_):
+    # deterministic stand-in for the model (no download in tests)
+    return [(zlib.crc32(t.encode()) % 1000) / 1000 if t.strip() else 0.0 for t in texts]
+
+
+@pytest.fixture
+def fake_sbert(monkeypatch):
+    monkeypatch.setattr(ranking, "sbert_match_scores", _fake_sbert)
+    monkeypatch.setattr(ranking, "_jd_embedding", lambda profile: None)
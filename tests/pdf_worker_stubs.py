@@ -0,0 +1,11 @@
+"""Worker functions for the pdf_parallel tests (importable by spawned workers)."""
+
+import os
+
+from src.pdf_parallel import _TaskResult
+
+
+def crash_on_marker(data, start, stop, timeout, limits, mode, probe=False):
+    if data == b"crash":
+        os._exit(1)  # like a segfault in a C extension
+    return _TaskResult(pages=[data.decode()])
@@ -0,0 +1,34 @@
+import os
+
+import src.benchmark as benchmark
+
+
+def test_env_is_restored(monkeypatch):
+    monkeypatch.setenv("TALENTRANK_EMBED_CACHE", "1")
+    with benchmark._env("TALENTRANK_EMBED_CACHE", "0"):
+        assert os.environ["TALENTRANK_EMBED_CACHE"] == "0"
+    assert os.environ["TALENTRANK_EMBED_CACHE"] == "1"
+
+    monkeypatch.delenv("TALENTRANK_EMBED_CACHE")
+    try:
+        with benchmark._env("TALENTRANK_EMBED_CACHE", "0"):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert "TALENTRANK_EMBED_CACHE" not in os.environ
+
+
+def test_batch_stages_run_on_the_whole_pool(monkeypatch):
+    import src.semantic_scoring as semantic
+
+    monkeypatch.setattr(semantic, "sbert_match_score", lambda r, jd: 0.5)  # no model download in tests
+    rows = benchmark.run([5, 40], stages=["tfidf_match_scores", "split_sections"], sample=10)
+    measured = {(r["size"], r["stage"]): (r["measured"], r["extrapolated"]) for r in rows}
+    assert measured[(5, "tfidf_match_scores")] == (5, False)
+    assert measured[(40, "tfidf_match_scores")] == (40, False)
+    assert measured[(40, "split_sections")] == (10, True)
+    assert list(benchmark.scaling_table(rows, extrapolated=False).index) == ["tfidf_match_scores"]
+    assert list(benchmark.scaling_table(rows, extrapolated=True).index) == ["split_sections"]
+
+    capped = benchmark.run([40], stages=["tfidf_match_scores"], sample=10, batch_cap=20)
+    assert (capped[0]["measured"], capped[0]["extrapolated"]) == (20, True)
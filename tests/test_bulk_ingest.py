@@ -0,0 +1,96 @@
+import io
+import warnings
+import zipfile
+
+import pytest
+
+pytest.importorskip("fpdf")  # test PDFs are rendered with fpdf, like the benchmark corpus
+
+import src.bulk_ingest as bulk
+from src.benchmark import text_to_pdf
+from src.ranking import CandidateResult
+
+
+def _fake_score(resumes, jd_text, weights, profile=None, tfidf_scores=None, **kwargs):
+    # scoring models are not under test here; overall = text length keeps results distinguishable
+    return [
+        CandidateResult(name, float(len(text)), 0.0, 0.0, 0.0, [], [], [], "REJECT")
+        for text, name in resumes
+    ]
+
+
+@pytest.fixture(autouse=True)
+def no_models(monkeypatch):
+    monkeypatch.setattr(bulk, "score_resumes_against_jd", _fake_score)
+    monkeypatch.setattr(bulk, "build_jd_profile", lambda jd: None)
+    monkeypatch.setattr(bulk, "tfidf_match_score", lambda text, jd: 0.0)
+    monkeypatch.setenv("TALENTRANK_PDF_CACHE", "0")
+
+
+def _zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in members:
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+def _records(source, chunk_size=2):
+    return [rec for chunk in bulk.iter_scored(source, "python", chunk_size=chunk_size) for rec in chunk]
+
+
+def test_duplicate_zip_members_keep_archive_order():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # zipfile warns about duplicate names
+        archive = _zip([
+            ("cv.pdf", text_to_pdf("a" * 10)),
+            ("cv.pdf", b"not a pdf"),
+            ("cv.pdf", text_to_pdf("b" * 30)),
+            ("other.pdf", text_to_pdf("c" * 20)),
+        ])
+    recs = _records(archive, chunk_size=4)
+    assert [r.name for r in recs] == ["cv.pdf", "cv.pdf", "cv.pdf", "other.pdf"]
+    assert recs[0].result.overall == 10
+    assert recs[1].result is None and recs[1].error
+    assert recs[2].result.overall == 30
+    assert recs[3].result.overall == 20
+
+
+def test_skips_non_pdf_and_mac_metadata():
+    archive = _zip([
+        ("notes.txt", b"x"),
+        ("__MACOSX/._cv.pdf", b"x"),
+        ("dir/cv.pdf", text_to_pdf("hello")),
+    ])
+    assert [r.name for r in _records(archive)] == ["dir/cv.pdf"]
+
+
+def test_oversized_member_is_reported(monkeypatch):
+    archive = _zip([("big.pdf", b"x" * 2048), ("ok.pdf", text_to_pdf("fine"))])
+    recs = [rec for chunk in bulk.iter_scored(archive, "jd", max_bytes=1024) for rec in chunk]
+    assert "larger than" in recs[0].error
+    assert recs[1].result is not None
+
+
+def test_empty_archive_yields_nothing():
+    assert _records(_zip([])) == []
+
+
+def test_directory_source(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "2.pdf").write_bytes(text_to_pdf("two"))
+    (tmp_path / "1.pdf").write_bytes(text_to_pdf("one"))
+    assert [r.name for r in _records(tmp_path)] == ["1.pdf", "b/2.pdf"]
+
+
+def test_resolve_server_path_stays_under_root(tmp_path):
+    root = tmp_path / "root"
+    (root / "cvs").mkdir(parents=True)
+    (tmp_path / "secret").mkdir()
+    (root / "escape").symlink_to(tmp_path / "secret")
+
+    assert bulk.resolve_server_path("cvs", root.resolve()) == (root / "cvs").resolve()
+    for bad in ["../secret", "/", str(tmp_path / "secret"), "escape", "missing"]:
+        with pytest.raises(ValueError):
+            bulk.resolve_server_path(bad, root.resolve())
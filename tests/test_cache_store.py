@@ -0,0 +1,94 @@
+import json
+
+from src.cache_store import DiskStore
+
+
+def _put(store, key, body=b"x" * 10):
+    return store.put(key, ".bin", lambda path: path.write_bytes(body))
+
+
+def test_index_is_written_in_batches(tmp_path, monkeypatch):
+    store = DiskStore(tmp_path, max_bytes=10_000)
+    writes = []
+    real = store._write_index
+    monkeypatch.setattr(store, "_write_index", lambda: (writes.append(1), real()))
+    for i in range(200):
+        _put(store, f"k{i}")
+    assert len(writes) <= 1
+    store.flush()
+    assert len(json.loads((tmp_path / "index.json").read_text())) == 200
+    assert DiskStore(tmp_path, max_bytes=10_000).stats()["entries"] == 200
+
+
+def test_hit_counted_only_after_a_successful_load(tmp_path):
+    store = DiskStore(tmp_path, max_bytes=10_000)
+    _put(store, "good")
+    _put(store, "bad")
+
+    def read(path):
+        if path.name.startswith(store._file_name("bad", "")):
+            raise ValueError("truncated")
+        return path.read_bytes()
+
+    assert store.get("good", read) == b"x" * 10
+    assert store.get("bad", read) is None
+    assert store.get("absent", read) is None
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (1, 2, 1, 10)
+
+
+def test_lru_eviction_keeps_the_size_cap(tmp_path):
+    store = DiskStore(tmp_path, max_bytes=25)
+    _put(store, "a")
+    _put(store, "b")
+    store.get("a", lambda p: p.read_bytes())  # b is now least recently used
+    _put(store, "c")
+    assert store.get("b", lambda p: p.read_bytes()) is None
+    assert store.stats()["entries"] == 2 and store.stats()["bytes"] == 20
+
+
+def test_os_error_is_a_miss_that_keeps_the_entry(tmp_path):
+    store = DiskStore(tmp_path, max_bytes=10_000)
+    path = _put(store, "k")
+
+    def too_many_files(path):
+        raise OSError(24, "Too many open files")
+
+    assert store.get("k", too_many_files) is None
+    assert path.exists() and store.get("k", lambda p: p.read_bytes()) == b"x" * 10
+
+
+def test_corrupt_entry_is_dropped_with_its_file(tmp_path):
+    store = DiskStore(tmp_path, max_bytes=10_000)
+    path = _put(store, "k")
+
+    def corrupt(path):
+        raise ValueError("truncated")
+
+    assert store.get("k", corrupt) is None
+    assert not path.exists() and store.stats()["entries"] == 0
+
+
+def test_embeddings_are_loaded_without_a_memory_map(tmp_path):
+    import numpy as np
+
+    from src.embedding_cache import EmbeddingCache
+
+    cache = EmbeddingCache(root=tmp_path)
+    cache.put("text", "model", True, np.ones(4))
+    row = cache.get("text", "model", True)
+    assert not isinstance(row, np.memmap) and row.tolist() == [1.0] * 4
+
+
+def test_eviction_goes_below_the_cap_and_recency_survives_a_reload(tmp_path):
+    store = DiskStore(tmp_path, max_bytes=100)
+    for k in "abcdefghij":
+        _put(store, k)  # 10 x 10 bytes: exactly at the cap
+    store.get("a", lambda p: p.read_bytes())
+    store.flush()
+
+    store = DiskStore(tmp_path, max_bytes=100)
+    _put(store, "k")  # over the cap: evict the LRU entries down to 90 bytes
+    assert store.stats()["bytes"] <= 90
+    keys = [k for k in "abcdefghijk" if store.get(k, lambda p: p.read_bytes()) is not None]
+    assert keys == ["a", "d", "e", "f", "g", "h", "i", "j", "k"]
@@ -0,0 +1,31 @@
+import pytest
+
+from src.encoders import DONE_MARKER, _staged_dir
+
+
+def _write_export(d, tag):
+    (d / "model.onnx").write_text(tag)
+    (d / DONE_MARKER).write_text("{}")
+
+
+def test_interrupted_export_leaves_nothing_behind(tmp_path):
+    out = tmp_path / "model"
+    with pytest.raises(KeyboardInterrupt):
+        with _staged_dir(out) as tmp:
+            (tmp / "model.onnx").write_text("half")
+            raise KeyboardInterrupt
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_incomplete_dir_is_replaced_and_complete_one_kept(tmp_path):
+    out = tmp_path / "model"
+    out.mkdir()
+    (out / "model.onnx").write_text("partial")  # older export, no done marker
+    with _staged_dir(out) as tmp:
+        _write_export(tmp, "first")
+    assert (out / "model.onnx").read_text() == "first"
+
+    with _staged_dir(out) as tmp:  # another worker finishing second
+        _write_export(tmp, "second")
+    assert (out / "model.onnx").read_text() == "first"
+    assert [p.name for p in tmp_path.iterdir()] == ["model"]
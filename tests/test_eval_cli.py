@@ -0,0 +1,35 @@
+import src.eval_cli as eval_cli
+from src.ranking import CandidateResult
+
+
+def _dataset(name, n=2):
+    return {"name": name, "jd_text": "python sql",
+            "resumes": [{"filename": f"{name}_{i}", "text": "python", "label": i % 2} for i in range(n)]}
+
+
+def _fake_score(jd_text, resumes):
+    if resumes[0]["filename"].startswith("bad"):
+        raise ValueError("broken dataset")
+    return [CandidateResult(r["filename"], 0.5, 0.5, 0.5, 1.0, ["python"], ["python", "sql"], ["sql"], "REVIEW")
+            for r in resumes]
+
+
+def test_failed_dataset_is_reported_and_the_rest_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(eval_cli, "_score", _fake_score)
+    cache = eval_cli.ComponentCache(root=tmp_path)
+    data = [_dataset("a"), _dataset("bad"), _dataset("c")]
+    scored, hits, failed = eval_cli.score_datasets(data, workers=1, cache=cache)
+    assert sorted(scored) == ["a", "c"] and hits == 0
+    assert failed == {"bad": "ValueError: broken dataset"}
+    assert cache.get(data[0]) is not None and cache.get(data[1]) is None
+
+    metrics, boards, hits, failed = eval_cli.evaluate(data, cache=cache)
+    assert hits == 2 and list(failed) == ["bad"]
+    assert set(metrics["Dataset"]) == {"a", "c"} and sorted(boards) == ["a", "c"]
+
+
+def test_cache_version_is_part_of_the_key(tmp_path, monkeypatch):
+    d = _dataset("a")
+    old = eval_cli.ComponentCache(root=tmp_path).key(d)
+    monkeypatch.setattr(eval_cli.ComponentCache, "CACHE_VERSION", eval_cli.ComponentCache.CACHE_VERSION + 1)
+    assert eval_cli.ComponentCache(root=tmp_path).key(d) != old
@@ -0,0 +1,67 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.eval_metrics import dcg_at_k, ndcg_at_k, ndcg_at_k_batch, precision_at_k, precision_at_k_batch
+
+
+# the scalar implementations the batch functions replaced
+def _precision_ref(labels, k):
+    k = max(1, min(k, len(labels)))
+    return sum(labels[:k]) / k
+
+
+def _dcg_ref(relevances, k):
+    k = max(1, min(k, len(relevances)))
+    score = 0.0
+    for i in range(k):
+        score += (2 ** relevances[i] - 1) / math.log2(i + 2)
+    return score
+
+
+def _ndcg_ref(relevances, k):
+    denom = _dcg_ref(sorted(relevances, reverse=True), k)
+    return 0.0 if denom == 0 else _dcg_ref(relevances, k) / denom
+
+
+K_VALUES = [0, 1, 3, 5, 10, 50]  # includes K = 0 and K > n
+
+
+def _lists(seed=0):
+    rng = random.Random(seed)
+    return [[rng.choice([0, 0, 1, 2]) for _ in range(rng.randint(1, 30))] for _ in range(200)]
+
+
+def test_single_list_functions_match_the_scalar_reference():
+    for rel in _lists():
+        labels = [int(r > 0) for r in rel]
+        for k in K_VALUES:
+            assert precision_at_k(labels, k) == _precision_ref(labels, k)
+            assert dcg_at_k(rel, k) == _dcg_ref(rel, k)  # bit for bit
+            assert ndcg_at_k(rel, k) == _ndcg_ref(rel, k)
+
+
+@pytest.mark.parametrize("n", [1, 7, 40])
+def test_batch_rows_match_the_scalar_reference(n):
+    rng = np.random.default_rng(n)
+    rel = rng.integers(0, 3, size=(25, n))
+    labels = (rel > 0).astype(int)
+    ndcg = ndcg_at_k_batch(rel, K_VALUES)
+    prec = precision_at_k_batch(labels, K_VALUES)
+    for i in range(rel.shape[0]):
+        for j, k in enumerate(K_VALUES):
+            assert ndcg[i, j] == _ndcg_ref(rel[i].tolist(), k)
+            assert prec[i, j] == _precision_ref(labels[i].tolist(), k)
+
+
+def test_empty_ranking_scores_zero():
+    assert precision_at_k([], 5) == 0.0
+    assert dcg_at_k([], 5) == 0.0
+    assert ndcg_at_k([], 5) == 0.0
+    assert ndcg_at_k_batch(np.zeros((3, 0)), [1, 5]).shape == (3, 2)
+
+
+def test_no_relevant_items_scores_zero():
+    assert ndcg_at_k([0, 0, 0], 2) == 0.0
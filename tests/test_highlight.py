@@ -0,0 +1,22 @@
+from src.highlight import highlight_terms
+from src.skills import index_skills
+
+TEXT = "Good Go developer, K8s and Python/SQL. going"
+
+
+def test_skills_use_the_matcher_rules_with_or_without_index():
+    terms = ["go", "kubernetes", "python", "sql"]
+    expected = "Good <mark>Go</mark> developer, <mark>K8s</mark> and <mark>Python</mark>/<mark>SQL</mark>. going"
+    assert highlight_terms(TEXT, terms) == expected
+    assert highlight_terms(TEXT, terms, index=index_skills(TEXT)) == expected
+
+
+def test_other_terms_are_substring_matches_with_or_without_index():
+    expected = "<mark>Go</mark>od <mark>Go</mark> <mark>developer</mark>, K8s and Python/SQL. <mark>go</mark>ing"
+    assert highlight_terms(TEXT, ["developer", "go"]) == expected
+    assert highlight_terms(TEXT, ["developer", "go"], index=index_skills(TEXT)) == expected
+
+
+def test_nothing_to_highlight():
+    assert highlight_terms("   ", ["python"]) == "   "
+    assert highlight_terms(TEXT, []) == TEXT
@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip("fpdf")  # test PDFs are rendered with fpdf, like the benchmark corpus
+
+import src.pdf_parallel as pp
+from src.pdf_utils import ExtractLimits, extract_text_from_pdf
+
+
+def _pdf(pages: int, words: int = 30) -> bytes:
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=10)
+    for i in range(pages):
+        pdf.add_page()
+        pdf.multi_cell(0, 5, f"Page {i} " + "python sql docker " * words)
+    return bytes(pdf.output())
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setenv("TALENTRANK_PDF_CACHE", "0")
+
+
+def test_order_and_text_match_single_file_extraction():
+    files = [("a.pdf", _pdf(1)), ("b.pdf", _pdf(2)), ("c.pdf", _pdf(3))]
+    results = pp.extract_many(files, workers=2)
+    assert [r.name for r in results] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert [r.text for r in results] == [extract_text_from_pdf(d, use_cache=False) for _, d in files]
+
+
+def test_single_bad_file_is_isolated():
+    (bad,) = pp.extract_many([("bad.pdf", b"not a pdf")], workers=1)
+    assert not bad.ok and bad.text == ""
+
+
+def test_bad_file_does_not_fail_the_batch():
+    results = pp.extract_many([("ok.pdf", _pdf(1)), ("bad.pdf", b"%PDF-1.4 garbage"), ("ok2.pdf", _pdf(1))])
+    assert [r.ok for r in results] == [True, False, True]
+
+
+def test_timeout_marks_file_failed():
+    (slow,) = pp.extract_many([("slow.pdf", _pdf(30, words=200))], workers=1, timeout=0.001)
+    assert not slow.ok and "TimeoutError" in slow.error
+
+
+def test_large_document_is_split_in_workers(monkeypatch):
+    def no_parent_parse(data):
+        raise AssertionError("page counting must happen in the worker")
+
+    monkeypatch.setattr(pp, "page_count", no_parent_parse)  # spawned workers import the real one
+    data = _pdf(pp.SPLIT_PAGES + 5)
+    (res,) = pp.extract_many([("big.pdf", data)], workers=2)
+    assert res.ok and res.text == extract_text_from_pdf(data, use_cache=False)
+
+
+def test_max_pages_on_split_document_is_reported():
+    data = _pdf(pp.SPLIT_PAGES + 20)
+    limits = ExtractLimits(max_pages=pp.SPLIT_PAGES + 5)
+    (res,) = pp.extract_many([("big.pdf", data)], workers=2, limits=limits)
+    assert res.truncated == "max_pages"
+    assert res.text == extract_text_from_pdf(data, use_cache=False, limits=limits)
+
+
+def test_empty_input():
+    assert pp.extract_many([]) == []
+
+
+def test_crashing_file_is_isolated_without_a_pool_per_file(monkeypatch):
+    from tests.pdf_worker_stubs import crash_on_marker
+
+    monkeypatch.setattr(pp, "_extract_task", crash_on_marker)
+    spawned = []
+    real_new_pool = pp._new_pool
+    monkeypatch.setattr(pp, "_new_pool", lambda n: spawned.append(n) or real_new_pool(n))
+    files = [(f"f{i}.pdf", b"crash" if i == 5 else f"text {i}".encode()) for i in range(32)]
+    results = pp.extract_many(files, workers=4, use_cache=False)
+    assert [r.ok for r in results] == [i != 5 for i in range(32)]
+    assert "crashed" in results[5].error
+    assert [r.text for r in results if r.ok] == [f"text {i}" for i in range(32) if i != 5]
+    assert len(spawned) <= 16  # one retry pool, then bisection: O(log n) pools, not one per file
+
+
+def test_pool_is_reused_across_calls(monkeypatch):
+    pp.extract_many([("a.pdf", _pdf(1))], workers=2)
+    spawned = []
+    monkeypatch.setattr(pp, "_new_pool", lambda n: spawned.append(n))
+    (res,) = pp.extract_many([("b.pdf", _pdf(1))], workers=2)
+    assert res.ok and spawned == []
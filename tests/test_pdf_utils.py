@@ -0,0 +1,53 @@
+import logging
+
+import pytest
+
+from src.pdf_utils import ExtractLimits
+
+
+def test_limits_from_env(monkeypatch):
+    monkeypatch.setenv("TALENTRANK_PDF_MAX_PAGES", "3")
+    monkeypatch.setenv("TALENTRANK_PDF_MAX_CHARS", "0")
+    monkeypatch.setenv("TALENTRANK_PDF_TIME_BUDGET", "1.5")
+    assert ExtractLimits.from_env() == ExtractLimits(max_pages=3, max_chars=None, time_budget=1.5)
+
+
+def test_malformed_limit_is_ignored_with_one_warning(monkeypatch, caplog):
+    monkeypatch.setenv("TALENTRANK_PDF_MAX_PAGES", "ten")
+    monkeypatch.setenv("TALENTRANK_PDF_TIME_BUDGET", "2")
+    with caplog.at_level(logging.WARNING, logger="src.pdf_utils"):
+        for _ in range(3):
+            assert ExtractLimits.from_env() == ExtractLimits(time_budget=2.0)
+    assert [r.getMessage() for r in caplog.records] == ["ignoring TALENTRANK_PDF_MAX_PAGES='ten': not a number"]
+
+
+def test_unknown_mode_falls_back_to_full_with_one_warning(monkeypatch, caplog):
+    from src.pdf_utils import default_mode
+
+    monkeypatch.setenv("TALENTRANK_PDF_MODE", "Fsat")
+    with caplog.at_level(logging.WARNING, logger="src.pdf_utils"):
+        for _ in range(3):
+            assert default_mode() == "full"
+    assert [r.getMessage() for r in caplog.records] == [
+        "ignoring TALENTRANK_PDF_MODE='fsat': not one of ('full', 'fast')"
+    ]
+    monkeypatch.setenv("TALENTRANK_PDF_MODE", " FAST ")
+    assert default_mode() == "fast"
+
+
+def test_fast_mode_falls_back_to_full_without_the_pypdf_helper(monkeypatch):
+    fpdf = pytest.importorskip("fpdf")
+    import src.pdf_fast as pdf_fast
+    from src.pdf_utils import extract_text_from_pdf
+
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=10)
+    pdf.multi_cell(0, 5, "python sql docker")
+    data = bytes(pdf.output())
+
+    monkeypatch.setattr(pdf_fast, "available", lambda: False)
+    monkeypatch.setattr(pdf_fast, "page_text_fast", None)  # would raise if the fast path ran
+    assert extract_text_from_pdf(data, use_cache=False, mode="fast") == extract_text_from_pdf(
+        data, use_cache=False, mode="full"
+    )
@@ -0,0 +1,57 @@
+import threading
+import tracemalloc
+
+from src.profiling import profile_run
+
+
+def _work():
+    return sum(i * i for i in range(20000))
+
+
+def test_report_is_filled():
+    with profile_run(top_n=5) as prof:
+        _work()
+    assert prof.report is not None and not prof.busy
+    assert prof.report.pstats_bytes
+    assert "_work" in prof.report.top_functions or "genexpr" in prof.report.top_functions
+
+
+def test_concurrent_capture_is_skipped():
+    entered, release = threading.Event(), threading.Event()
+    outer = {}
+
+    def first():
+        with profile_run() as prof:
+            entered.set()
+            release.wait(10)
+        outer["prof"] = prof
+
+    t = threading.Thread(target=first)
+    t.start()
+    entered.wait(10)
+    try:
+        with profile_run() as second:
+            _work()
+        assert second.busy and second.report is None
+    finally:
+        release.set()
+        t.join(10)
+    assert outer["prof"].report is not None
+
+    # the lock is released again
+    with profile_run() as third:
+        _work()
+    assert third.report is not None
+
+
+def test_leaves_tracing_started_elsewhere_running():
+    tracemalloc.start()
+    try:
+        with profile_run():
+            _work()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    with profile_run():
+        _work()
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,47 @@
+import pytest
+
+import src.ranking as ranking
+
+pytestmark = pytest.mark.usefixtures("fake_sbert")
+
+JD = "python sql docker kubernetes aws machine learning"
+RESUMES = [
+    ("python sql docker kubernetes aws machine learning engineer", "strong"),
+    ("python sql docker developer", "mid"),
+    ("java spring developer", "weak1"),
+    ("accountant excel", "weak2"),
+    ("", "empty"),
+]
+
+
+def test_zero_sbert_weight_skips_nobody():
+    results = ranking.score_resumes_against_jd(RESUMES, JD, (0.5, 0.0, 0.5), cascade=True)
+    assert not any(r.sbert_skipped for r in results)
+    assert all(r.sbert == 0.0 for r in results)
+
+
+def test_cascade_flags_only_pruned_rows_and_keeps_decisions():
+    weights = (0.4, 0.3, 0.3)  # low SBERT weight, so weak candidates cannot reach REVIEW
+    full = ranking.score_resumes_against_jd(RESUMES, JD, weights, cascade=False)
+    fast = ranking.score_resumes_against_jd(RESUMES, JD, weights, cascade=True)
+    assert [r.decision for r in fast] == [r.decision for r in full]
+    for f, c in zip(full, fast):
+        if c.sbert_skipped:
+            assert c.sbert == 0.0 and c.decision == "REJECT"
+        else:
+            assert c.sbert == f.sbert and c.overall == f.overall
+    assert [r.filename for r in fast if r.sbert_skipped] == ["weak1", "weak2", "empty"]
+    assert not any(r.sbert_skipped for r in full)
+
+
+def test_empty_pool():
+    assert ranking.score_resumes_against_jd([], JD, (0.2, 0.65, 0.15), cascade=True) == []
+
+
+def test_missing_skills_are_built_on_first_use():
+    results = ranking.score_resumes_against_jd(RESUMES, JD, (0.2, 0.65, 0.15))
+    assert all(r.missing is None for r in results)
+    for r in results:
+        assert r.missing_skills() == ranking.missing_skills(r.jd_skills, r.resume_skills)
+    row = ranking.to_row_dict(results[3])
+    assert "skill_row" not in row and row["missing_skills_preview"]
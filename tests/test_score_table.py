@@ -0,0 +1,27 @@
+import pytest
+
+import src.ranking as ranking
+from src.score_table import ScoreTable
+
+pytestmark = pytest.mark.usefixtures("fake_sbert")
+
+JD = "python sql docker kubernetes aws machine learning"
+RESUMES = [
+    ("python sql docker kubernetes aws machine learning engineer", "strong"),
+    ("python sql docker developer", "mid"),
+    ("java spring developer", "weak"),
+    ("", "empty"),
+]
+
+
+@pytest.mark.parametrize("weights", [(0.2, 0.65, 0.15), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.4, 0.3, 0.3)])
+def test_reweight_matches_rescoring(weights):
+    table = ScoreTable.from_results(ranking.score_resumes_against_jd(RESUMES, JD, (0.2, 0.65, 0.15)))
+    rescored = ranking.score_resumes_against_jd(RESUMES, JD, weights)
+    expected = sorted(rescored, key=lambda r: r.overall, reverse=True)  # the app's sort
+    assert table.reweight(weights) == expected
+
+
+def test_empty_table():
+    table = ScoreTable.from_results([])
+    assert len(table) == 0 and table.reweight((0.2, 0.65, 0.15)) == [] and table.sbert_skipped == 0
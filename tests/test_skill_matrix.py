@@ -0,0 +1,36 @@
+import random
+
+import numpy as np
+
+from src.skill_matrix import SkillMatrix
+from src.skills import missing_skills
+
+VOCAB = [f"skill{i}" for i in range(37)]  # not a multiple of 8
+
+
+def _pool(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.sample(VOCAB + ["extra1", "extra2"], rng.randint(0, 12)) for _ in range(n)]
+
+
+def _ratio(resume, jd):
+    # ranking._skill_overlap_ratio
+    return len(set(resume) & set(jd)) / len(set(jd)) if jd else 0.0
+
+
+def test_matches_set_operations():
+    pool = _pool(200)
+    jds = [pool[0][:5] + ["unknown"], VOCAB[:10], []]
+    m = SkillMatrix(pool, vocabulary=VOCAB)
+    for jd in jds:
+        assert np.allclose(m.overlap_ratios(jd), [_ratio(r, jd) for r in pool])
+        assert [m.missing_for(i, jd) for i in range(len(pool))] == [missing_skills(jd, r) for r in pool]
+    expected = np.array([[_ratio(r, jd) for r in pool] for jd in jds])
+    assert np.allclose(m.overlap_matrix(jds), expected)
+    assert [m.skills(i) for i in range(len(pool))] == [sorted(set(r)) for r in pool]
+
+
+def test_empty_pool():
+    m = SkillMatrix([], vocabulary=VOCAB)
+    assert m.overlap_ratios(["skill1"]).shape == (0,)
+    assert m.overlap_matrix([["skill1"], []]).shape == (2, 0)
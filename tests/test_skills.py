@@ -0,0 +1,63 @@
+import pickle
+import random
+import re
+
+from src.skills import SkillMatcher, _normalize
+from src.skills_db import SKILLS
+
+
+def test_aliases_report_canonical_names():
+    m = SkillMatcher(["kubernetes", "machine learning"], {"k8s": "kubernetes"})
+    assert m.find(_normalize("Ran K8s clusters; Machine  Learning")) == {"kubernetes", "machine learning"}
+    assert m.canonical("k8s") == "kubernetes" and m.canonical("cobol") is None
+
+
+def test_matcher_survives_pickling():
+    # spawned worker processes receive the matcher by pickle
+    m = SkillMatcher(["python", "sql"], {})
+    clone = pickle.loads(pickle.dumps(m))
+    assert clone.find("python and sql") == m.find("python and sql") == {"python", "sql"}
+
+
+def test_empty_taxonomy_matches_nothing():
+    assert SkillMatcher([], {}).find("python") == set()
+
+
+def _extract_ref(text, skills):
+    # the per-skill regex loop the matcher replaced
+    t = _normalize(text)
+    found = set()
+    for skill in skills:
+        if " " in skill:
+            if skill in t:
+                found.add(skill)
+        elif re.search(rf"\b{re.escape(skill)}\b", t):
+            found.add(skill)
+    return found
+
+
+def test_matcher_matches_the_per_skill_loop():
+    rng = random.Random(0)
+    pieces = list(SKILLS) + ["x", "-", ".", "/", "+", "#", "_", "9", "  ", "\n", "Ja", "script", "ing"]
+    matcher = SkillMatcher(SKILLS, {})
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) + rng.choice(["", " ", ",", ""]) for _ in range(rng.randint(0, 25)))
+        assert matcher.find(_normalize(text)) == _extract_ref(text, SKILLS), text
+
+
+def test_trie_pattern_is_reused_from_cache(tmp_path):
+    terms = ["python", "sql", "scikit-learn"]
+    m = SkillMatcher(terms, {"sklearn": "scikit-learn"}, pattern_cache=tmp_path)
+    files = list(tmp_path.glob("trie-*.json"))
+    assert len(files) == 1
+
+    files[0].write_text('{"pattern": "python"}')  # stand-in: proves the file is read back
+    cached = SkillMatcher(terms, {"sklearn": "scikit-learn"}, pattern_cache=tmp_path)
+    assert cached.find("python and sql") == {"python"}
+    assert m.find("python and sql and sklearn") == {"python", "sql", "scikit-learn"}
+
+    files[0].write_text("not json")  # corrupt entry -> rebuilt and rewritten
+    rebuilt = SkillMatcher(terms, {"sklearn": "scikit-learn"}, pattern_cache=tmp_path)
+    assert rebuilt.find("python and sql") == {"python", "sql"}
+    assert SkillMatcher(["go"], {}, pattern_cache=tmp_path).find("go") == {"go"}
+    assert len(list(tmp_path.glob("trie-*.json"))) == 2
@@ -0,0 +1,26 @@
+import json
+import threading
+
+from src.timing import Recorder, write_metrics
+
+
+def test_concurrent_writes_leave_complete_files(tmp_path):
+    errors = []
+
+    def write():
+        try:
+            for _ in range(20):
+                rec = Recorder()
+                rec.add("tfidf", 0.01)
+                write_metrics(rec, tmp_path)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["talentrank.prom", "talentrank_last_run.json"]
+    json.loads((tmp_path / "talentrank_last_run.json").read_text())
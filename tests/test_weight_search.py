@@ -0,0 +1,54 @@
+import numpy as np
+
+from src.eval_metrics import ndcg_at_k, precision_at_k
+from src.score_table import ScoreTable
+from src.weight_search import evaluate_grid, pareto_front, simplex_grid
+
+
+def _table(n=6, seed=0):
+    rng = np.random.default_rng(seed)
+    return ScoreTable(
+        results=[None] * n,
+        tfidf=rng.random(n),
+        sbert=rng.random(n),
+        skill_overlap=rng.random(n),
+        penalty=np.ones(n),
+        length_factor=np.ones(n),
+    )
+
+
+def test_simplex_grid_sums_to_one():
+    grid = simplex_grid(0.1)
+    assert len(grid) == 66
+    assert np.allclose(grid.sum(axis=1), 1.0)
+
+
+def test_k_larger_than_pool_keeps_requested_keys():
+    table = _table(n=6)
+    labels = [2, 0, 1, 0, 2, 1]
+    df = evaluate_grid(table, labels, simplex_grid(0.25), k_values=[3, 5, 10, 10])
+    assert [c for c in df.columns if "@" in c] == ["P@3", "NDCG@3", "P@5", "NDCG@5", "P@10", "NDCG@10"]
+
+    # K > n is evaluated over the whole pool
+    binary = [int(l >= 1) for l in labels]
+    for row in df.itertuples(index=False):
+        overall = table.overall(np.array([row.w_tfidf, row.w_sbert, row.w_skill]))
+        order = np.argsort(-overall, kind="stable")
+        ranked = [labels[i] for i in order]
+        assert row[df.columns.get_loc("P@10")] == precision_at_k([binary[i] for i in order], 10)
+        assert row[df.columns.get_loc("NDCG@10")] == ndcg_at_k(ranked, 10)
+
+    front = pareto_front(df, ["NDCG@10", "P@10"])
+    assert len(front) >= 1
+
+
+def test_grid_matches_scalar_metrics():
+    table = _table(n=8, seed=3)
+    labels = [0, 1, 2, 0, 0, 1, 2, 0]
+    df = evaluate_grid(table, labels, simplex_grid(0.1), k_values=[3, 5], chunk=7)
+    for row in df.itertuples(index=False):
+        overall = table.overall(np.array([row.w_tfidf, row.w_sbert, row.w_skill]))
+        order = np.argsort(-overall, kind="stable")
+        ranked = [labels[i] for i in order]
+        assert row[df.columns.get_loc("NDCG@5")] == ndcg_at_k(ranked, 5)
+        assert row[df.columns.get_loc("P@3")] == precision_at_k([int(l >= 1) for l in ranked], 3)